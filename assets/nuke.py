@@ -5650,14 +5650,7 @@ class Box3_Knob(Array_Knob):
 
 
 class CancelledError(Exception):
-    class CascadingEnumeration_Knob(Enumeration_Knob):
-        def __new__(self, S):
-            """T.__new__(S, ...) -> a new object with type S, a subtype of T"""
-            pass
-
-        def __init__(self):
-            """x.__init__(...) initializes x; see help(type(x)) for signature"""
-            pass
+    pass
 
 
 class Channel_Knob(Knob):
@@ -5868,6 +5861,16 @@ class Enumeration_Knob(Unsigned_Knob):
         pass
 
 
+class CascadingEnumeration_Knob(Enumeration_Knob):
+    def __new__(self, S):
+        """T.__new__(S, ...) -> a new object with type S, a subtype of T"""
+        pass
+
+    def __init__(self):
+        """x.__init__(...) initializes x; see help(type(x)) for signature"""
+        pass
+
+
 class EditableEnumeration_Knob(Enumeration_Knob):
     def setValue(self, item):
         """self.setValue(item) -> None.
@@ -1,3 +1,8 @@
+from io import StringIO
+from PySide2.QtCore import QObject
+from PySide2.QtWidgets import QDialog, QStyledItemDelegate
+
+
 
 class Dialog(object):
     def __init__(self):
@@ -997,6 +1002,10 @@ class TableDelegate(QStyledItemDelegate):
         pass
 
 
+class _Verbose(object):
+    pass
+
+
 class Thread(_Verbose):
     def isAlive(self):
         """None"""
@@ -1093,7 +1102,7 @@ class UDIMErrorDialog(QDialog):
         pass
 
 
-class UDIMFile(UDIMFile):
+class UDIMFile(object):
     def __init__(self, udim, uv, filename):
         """None"""
         pass
@@ -1149,13 +1158,13 @@ class UserPresetsLoadPanel(PythonPanel):
         pass
 
 
-class VertexInfo(VertexInfo):
+class VertexInfo(object):
     def __init__(self, objnum, index, value, position):
         """None"""
         pass
 
 
-class VertexSelection(VertexSelection):
+class VertexSelection(object):
     def scale(self, vector):
         """None"""
         pass
@@ -1230,7 +1239,7 @@ class ViewerCaptureDialogThread(Thread):
         pass
 
 
-class WidgetKnob(WidgetKnob):
+class WidgetKnob(object):
     def makeUI(self):
         """None"""
         pass
@@ -0,0 +1,5 @@
+"""
+Headless benchmarks for the editor's hot paths.
+
+Run from the project directory with `python -m benchmarks`; see `python -m benchmarks --help`.
+"""
@@ -0,0 +1,74 @@
+import argparse
+import importlib
+import os
+import sys
+
+from benchmarks import harness
+
+# Kayıt sırası = çalıştırma sırası
+MODULES = (
+    "benchmarks.bench_settings",
+    "benchmarks.bench_highlight",
+    "benchmarks.bench_completion",
+    "benchmarks.bench_editor",
+    "benchmarks.bench_search",
+    "benchmarks.bench_panels",
+    "benchmarks.bench_output",
+    "benchmarks.startup",
+)
+
+
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Headless (offscreen Qt) benchmarks of the editor's hot paths, with assets/nuke.py "
+                    "standing in for Nuke.")
+    parser.add_argument("patterns", nargs="*", help="fnmatch patterns of the benchmarks to run (e.g. 'highlight.*')")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    parser.add_argument("--quick", action="store_true", help="smaller problem sizes for a fast smoke run")
+    parser.add_argument("--output", default=os.path.join(harness.RESULTS_DIR, "latest.json"),
+                        help="JSON file for the results (default: benchmarks/results/latest.json)")
+    parser.add_argument("--baseline", nargs="?", const=harness.DEFAULT_BASELINE,
+                        help="compare against a stored results file (default: benchmarks/results/baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="also store the results as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="relative slowdown of the median reported as a regression (default: 0.1)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    arguments = parse_arguments(sys.argv[1:] if argv is None else argv)
+    harness.setup_environment()
+    for module in MODULES:
+        importlib.import_module(module)
+
+    benchmarks = harness.select(arguments.patterns)
+    if arguments.list:
+        for bench in benchmarks:
+            print(bench.name)
+        return 0
+    if not benchmarks:
+        print("No benchmark matches", " ".join(arguments.patterns))
+        return 1
+
+    results = harness.run_benchmarks(benchmarks, quick=arguments.quick)
+    harness.save_results(arguments.output, results, arguments.quick)
+    print(f"\nResults written to {arguments.output}")
+    if arguments.save_baseline:
+        harness.save_results(harness.DEFAULT_BASELINE, results, arguments.quick)
+        print(f"Baseline written to {harness.DEFAULT_BASELINE}")
+
+    if arguments.baseline:
+        if not os.path.exists(arguments.baseline):
+            print(f"Baseline not found: {arguments.baseline}")
+            return 1
+        print()
+        regressions = harness.compare(results, harness.load_results(arguments.baseline), arguments.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 1 if any("error" in result for result in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+from editor.completer import CompletionIndex
+from editor.symbols import DocumentSymbolIndex
+from benchmarks.fixtures import python_source
+from benchmarks.harness import benchmark
+
+PREFIXES = ("n", "nu", "nuke", "createN", "Gr", "os", "os.pa", "get", "set", "re", "str", "__", "imp", "x")
+WORDS = ("creatNode", "toNod", "selectdNode", "rendr", "prnt", "lenght", "enumerat", "Grdae", "Knb", "frmae")
+
+
+@benchmark("completion.prefix")
+def prefix_lookups(run):
+    """Prefix lookups over the shared static + module index."""
+    index = CompletionIndex.instance()
+    rounds = 1000
+    for _ in run:
+        for _ in range(rounds):
+            for prefix in PREFIXES:
+                index.prefix_matches(prefix, 50)
+    lookups = rounds * len(PREFIXES)
+    run.metric("lookups", lookups)
+    run.metric("per_lookup_us", min(run.samples) / lookups * 1e6)
+
+
+@benchmark("completion.fuzzy_cold")
+def fuzzy_cold(run):
+    """Fuzzy matching with an empty cache (the first keystroke of a word)."""
+    index = CompletionIndex.instance()
+    for _ in run:
+        for word in WORDS:
+            index._fuzzy_cache.clear()
+            index.fuzzy_matches(word)
+    run.metric("per_word_ms", min(run.samples) / len(WORDS) * 1000)
+
+
+@benchmark("completion.fuzzy_cached")
+def fuzzy_cached(run):
+    """Fuzzy matching of already seen words against a 5k-line document's symbols."""
+    index = CompletionIndex.instance()
+    symbols = DocumentSymbolIndex()
+    symbols.rebuild(python_source(5000).split("\n"))
+    rounds = 100
+    for _ in run:
+        for _ in range(rounds):
+            for word in WORDS:
+                index.fuzzy_matches(word, extra=symbols)
+    run.metric("per_word_us", min(run.samples) / (rounds * len(WORDS)) * 1e6)
+
+
+@benchmark("completion.symbol_index_rebuild", repeat=3)
+def symbol_index_rebuild(run):
+    """Indexes the identifiers of a 50k-line document from scratch (file open)."""
+    lines = python_source(run.size(50000, 5000)).split("\n")
+    symbols = DocumentSymbolIndex()
+    for _ in run:
+        symbols.rebuild(lines)
+    run.metric("names", len(symbols))
+
+
+@benchmark("completion.symbol_index_edit")
+def symbol_index_edit(run):
+    """Single-line updates of a 50k-line document's index (one keystroke each)."""
+    lines = python_source(run.size(50000, 5000)).split("\n")
+    symbols = DocumentSymbolIndex()
+    symbols.rebuild(lines)
+    line = len(lines) // 2
+    edits = 10000
+    for _ in run:
+        for edit in range(edits):
+            symbols.apply_change(line, line, [f"value_{edit % 100} = render_frames_{edit}(1, 10)"])
+    run.metric("per_edit_us", min(run.samples) / edits * 1e6)
@@ -0,0 +1,155 @@
+import os
+import shutil
+import tempfile
+import time
+from PySide2.QtGui import QPixmap
+from PySide2.QtTest import QTest
+from editor.code_editor import CodeEditor
+from benchmarks.fixtures import python_source, python_source_of_size, main_window, close_extra_tabs
+from benchmarks.harness import benchmark, process_events, wait_until
+
+
+def shown_editor(text="", width=1000, height=800):
+    editor = CodeEditor()
+    editor.resize(width, height)
+    editor.setPlainText(text)
+    editor.changes.flush()
+    editor.show()
+    process_events()
+    return editor
+
+
+def dispose(editor):
+    editor.close()
+    editor.deleteLater()
+    process_events()
+
+
+@benchmark("editor.open_300kb")
+def open_300kb(run):
+    """setPlainText of a 300 KB file up to the first rendered frame; background highlighting as a metric."""
+    source = python_source_of_size(300 * 1024)
+    background = []
+    for _ in run:
+        with run.untimed():
+            editor = shown_editor()
+            target = QPixmap(editor.size())
+        editor.setPlainText(source)
+        editor.changes.flush()
+        editor.update_highlight_viewport()
+        editor.render(target)
+        with run.untimed():
+            start = time.perf_counter()
+            highlighter = editor.highlighter
+            last = editor.document().blockCount() - 1
+            if highlighter.is_lazy():
+                wait_until(lambda: highlighter.done_until >= last)
+            background.append(time.perf_counter() - start)
+            dispose(editor)
+    run.metric("size_kb", len(source) // 1024)
+    run.metric("background_highlight_s", min(background))
+
+
+@benchmark("editor.open_50_tabs", repeat=3)
+def open_tabs(run):
+    """Opens 50 files of 500 lines each as tabs of the main window."""
+    window = main_window()
+    directory = tempfile.mkdtemp(prefix="nuke_ide_bench_")
+    try:
+        paths = []
+        source = python_source(500)
+        for index in range(50):
+            path = os.path.join(directory, f"tab_{index:02d}.py")
+            with open(path, "w") as file:
+                file.write(source)
+            paths.append(path)
+        close_extra_tabs(window)
+        process_events()
+        for _ in run:
+            for path in paths:
+                window.add_new_tab(path)
+            process_events()
+            with run.untimed():
+                close_extra_tabs(window)
+                process_events()
+        run.metric("per_tab_ms", min(run.samples) / len(paths) * 1000)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+@benchmark("editor.scroll_100k", repeat=3)
+def scroll_frames(run):
+    """Page-down frames (scroll + lazy highlight of the new page + editor and gutter paint) in 100k lines."""
+    editor = shown_editor(python_source(run.size(100000, 10000)))
+    target = QPixmap(editor.size())
+    scrollbar = editor.verticalScrollBar()
+    pages = 200
+    frames = []
+    for _ in run:
+        with run.untimed():
+            scrollbar.setValue(0)
+            process_events()
+            frames = []
+        for _ in range(pages):
+            start = time.perf_counter()
+            scrollbar.setValue(scrollbar.value() + scrollbar.pageStep())
+            editor.render(target)
+            frames.append(time.perf_counter() - start)
+    run.metric("lines", editor.document().blockCount())
+    run.distribution("frame", frames)
+    dispose(editor)
+
+
+@benchmark("editor.typing", repeat=3)
+def typing(run):
+    """
+    Types a line in the middle of a 5k-line file; a keystroke lasts until its IMMEDIATE change lane ran.
+
+    Per-handler mean times come from the editor's ChangeDispatcher.
+    """
+    source = python_source(run.size(5000, 1000))
+    text = "result = render_frames_1(first=1, last=10) # typed"
+    editor = shown_editor(source)
+    latencies = []
+    for _ in run:
+        with run.untimed():
+            editor.setPlainText(source)
+            editor.changes.flush()
+            cursor = editor.textCursor()
+            cursor.setPosition(editor.document().findBlockByNumber(editor.document().blockCount() // 2).position())
+            editor.setTextCursor(cursor)
+            editor.setFocus()
+            process_events()
+            latencies = []
+            editor.changes.stats.clear()
+        for character in text:
+            start = time.perf_counter()
+            QTest.keyClicks(editor, character)
+            process_events()
+            latencies.append(time.perf_counter() - start)
+    run.distribution("keystroke", latencies)
+    for name, calls, total, _ in editor.changes.report():
+        run.metric(f"{name}_mean_ms", total / calls)
+    dispose(editor)
+
+
+@benchmark("editor.change_burst")
+def change_burst(run):
+    """1000 scattered single-character edits in one event-loop turn, delivered as one coalesced change."""
+    source = python_source(run.size(5000, 1000))
+    editor = shown_editor(source)
+    edits = 1000
+    for _ in run:
+        with run.untimed():
+            editor.setPlainText(source)
+            editor.changes.flush()
+            editor.changes.stats.clear()
+            step = max(1, editor.document().characterCount() // edits)
+        cursor = editor.textCursor()
+        for edit in range(edits):
+            cursor.setPosition(edit * step)
+            cursor.insertText("x")
+        process_events()
+    for name, calls, total, _ in editor.changes.report():
+        run.metric(f"{name}_calls", calls)
+    dispose(editor)
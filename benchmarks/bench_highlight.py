@@ -0,0 +1,59 @@
+from PySide2.QtGui import QTextDocument
+from pygments.styles import get_all_styles
+from pygments.token import STANDARD_TYPES
+from editor.code_editor import PygmentsHighlighter, StyleTable
+from benchmarks.fixtures import python_source
+from benchmarks.harness import benchmark
+
+
+@benchmark("highlight.style_tables")
+def style_tables(run):
+    """Builds the StyleTable of every bundled style and resolves every standard token type."""
+    styles = sorted(get_all_styles())
+    tokens = list(STANDARD_TYPES)
+    for _ in run:
+        for style in styles:
+            table = StyleTable(style)
+            for token in tokens:
+                table[token]
+    run.metric("styles", len(styles))
+    run.metric("tokens", len(tokens))
+
+
+def eager_document(lines):
+    """A document of `lines` lines with a fully (not lazily) highlighting PygmentsHighlighter."""
+    document = QTextDocument()
+    highlighter = PygmentsHighlighter(document)
+    highlighter.lazy_threshold = 0
+    document.setPlainText(python_source(lines))
+    return document, highlighter
+
+
+def highlight_document(run, lines):
+    document, highlighter = eager_document(lines)
+    for _ in run:
+        highlighter.rehighlight()
+    run.metric("lines", document.blockCount())
+    run.metric("lines_per_second", document.blockCount() / min(run.samples))
+
+
+@benchmark("highlight.document_10k", repeat=3)
+def highlight_10k(run):
+    highlight_document(run, run.size(10000, 2000))
+
+
+@benchmark("highlight.document_50k", repeat=3)
+def highlight_50k(run):
+    highlight_document(run, run.size(50000, 5000))
+
+
+@benchmark("highlight.line_edit", repeat=5)
+def highlight_line_edit(run):
+    """Re-highlights one edited line in the middle of a 20k-line document (the per-keystroke cost)."""
+    document, highlighter = eager_document(run.size(20000, 2000))
+    block = document.findBlockByNumber(document.blockCount() // 2)
+    edits = 200
+    for _ in run:
+        for _ in range(edits):
+            highlighter.rehighlightBlock(block)
+    run.metric("edits", edits)
@@ -0,0 +1,31 @@
+from editor.core import get_settings
+from editor.output import OutputWidget
+from benchmarks.harness import benchmark, process_events
+
+
+@benchmark("output.stream_1m", repeat=3)
+def output_stream(run):
+    """
+    Streams 1M print()-style writes into the OUTPUT panel and flushes them like its timer does.
+
+    The panel keeps the configured `OUTPUT_MAX_BLOCKS` lines, as in the editor.
+    """
+    widget = OutputWidget()
+    widget.resize(800, 400)
+    widget.show()
+    process_events()
+    lines = run.size(1000000, 100000)
+    batch = 10000  # Yaklaşık bir flush_interval içinde gelen satır sayısı
+    for _ in run:
+        with run.untimed():
+            widget.clear()
+        for first in range(0, lines, batch):
+            for index in range(first, min(first + batch, lines)):
+                widget.write(f"frame {index} rendered in 0.{index % 1000:03d}s\n")
+            widget.flush()
+        process_events()
+    run.metric("lines", lines)
+    run.metric("lines_per_second", lines / min(run.samples))
+    run.metric("max_blocks", get_settings().OUTPUT_MAX_BLOCKS)
+    run.metric("document_blocks", widget.document().blockCount())
+    widget.deleteLater()
@@ -0,0 +1,186 @@
+import os
+import time
+from PySide2.QtGui import QIcon
+from PySide2.QtWidgets import QTreeView
+from editor.core import PathFromOS
+from editor.nlink import parse_reference_classes
+from editor.outliner import OutlinerModel, OutlinerFilterProxy
+from editor.structure import parse_outline
+from benchmarks.fixtures import python_source, main_window, TemporaryTree
+from benchmarks.harness import benchmark, process_events
+
+FILTERS = ("k", "kn", "knob", "setValue", "Grade", "Viewer", "zzz", "")
+
+
+# HEADER
+@benchmark("header.parse", repeat=3)
+def header_parse(run):
+    """Parses a 20k-line document into the HEADER outline (runs on a worker thread in the editor)."""
+    source = python_source(run.size(20000, 2000))
+    for _ in run:
+        outline = parse_outline(source)
+    run.metric("entries", len(outline))
+
+
+def reset_header(window):
+    window.header_tree.clear()
+    window.header_outline = []
+    window.header_project_item = None
+
+
+@benchmark("header.apply_full", repeat=3)
+def header_apply_full(run):
+    """Fills an empty HEADER tree from the outline of a 20k-line document."""
+    window = main_window()
+    editor = window.tab_widget.currentWidget()
+    outline = parse_outline(python_source(run.size(20000, 2000)))
+    for _ in run:
+        with run.untimed():
+            reset_header(window)
+        window.apply_header_outline(editor, outline)
+    run.metric("entries", len(outline))
+    reset_header(window)
+
+
+@benchmark("header.apply_edit")
+def header_apply_edit(run):
+    """Re-applies a 20k-line document's outline after one entry changed (the diffed update)."""
+    window = main_window()
+    editor = window.tab_widget.currentWidget()
+    outline = parse_outline(python_source(run.size(20000, 2000)))
+    edited = list(outline)
+    middle = len(edited) // 2
+    kind, name, lineno, methods = edited[middle]
+    edited[middle] = (kind, name + "_renamed", lineno, methods)
+    updates = 100
+    with run.untimed():
+        reset_header(window)
+        window.apply_header_outline(editor, outline)
+    for _ in run:
+        for update in range(updates):
+            window.apply_header_outline(editor, edited if update % 2 == 0 else outline)
+    run.metric("per_update_ms", min(run.samples) / updates * 1000)
+    reset_header(window)
+
+
+# OUTLINER
+def reference_classes():
+    classes = []
+    for path in (PathFromOS().nuke_ref_path, PathFromOS().nukescripts_ref_path):
+        with open(path, "rb") as file:
+            classes.extend(parse_reference_classes(file.read()))
+    return classes
+
+
+def renamed_copies(classes, copies):
+    """`copies` copies of the reference classes; every copy after the first gets a name suffix."""
+    return [(f"{name}_{copy}" if copy else name, methods) for copy in range(copies) for name, methods in classes]
+
+
+def outliner_view():
+    icons = {kind: QIcon(os.path.join(PathFromOS().icons_path, icon))
+             for kind, icon in (("Class", "C_logo.svg"), ("Method", "M_logo.svg"), ("Function", "M_red.svg"),
+                                ("Folder", "folder_tree.svg"))}
+    model = OutlinerModel(icons)
+    proxy = OutlinerFilterProxy()
+    proxy.setSourceModel(model)
+    view = QTreeView()
+    view.setModel(proxy)
+    view.resize(400, 900)
+    view.show()
+    return model, proxy, view
+
+
+@benchmark("outliner.parse_reference", repeat=3)
+def outliner_parse_reference(run):
+    """Parses assets/nuke.py and assets/nukescripts.py (a cache miss of the reference cache)."""
+    for _ in run:
+        classes = reference_classes()
+    run.metric("classes", len(classes))
+
+
+@benchmark("outliner.populate", repeat=3)
+def outliner_populate(run):
+    """Adds several renamed copies of the reference classes to a shown OUTLINER view."""
+    payload = renamed_copies(reference_classes(), run.size(10, 2))
+    for _ in run:
+        with run.untimed():
+            model, proxy, view = outliner_view()
+        model.add_classes(payload)
+        process_events()
+        with run.untimed():
+            view.deleteLater()
+            process_events()
+    run.metric("symbols", len(model.index_.symbols))
+
+
+@benchmark("outliner.filter")
+def outliner_filter(run):
+    """Types a sequence of filter texts into the OUTLINER like `EditorApp.filter_outliner`."""
+    model, proxy, view = outliner_view()
+    model.add_classes(renamed_copies(reference_classes(), run.size(10, 2)))
+    process_events()
+    for _ in run:
+        for text in FILTERS:
+            proxy.set_filter_text(text)
+            if text:
+                view.expandAll()
+            process_events()
+    run.metric("symbols", len(model.index_.symbols))
+    run.metric("per_filter_ms", min(run.samples) / len(FILTERS) * 1000)
+    view.deleteLater()
+
+
+# WORKPLACE
+def reset_workplace(window):
+    window.workplace_scanner.reset()
+    window.workplace_tree.clear()
+    window.workplace_folders = {}
+    window.workplace_files = {}
+    window.workplace_loaded = set()
+
+
+def load_workplace(run, files):
+    """
+    Populates the WORKPLACE with a synthetic tree and expands every folder until all are loaded.
+
+    The sample is the full load; `first_level_ms` is the time until the root's children are shown.
+    """
+    window = main_window()
+    tree = TemporaryTree(files)
+    first_level = []
+    try:
+        for _ in run:
+            with run.untimed():
+                reset_workplace(window)
+                process_events()
+            start = time.perf_counter()
+            window.populate_workplace(tree.root)
+            root_item = window.workplace_folders[tree.root]
+            while not root_item.childCount():
+                process_events()
+            first_level.append(time.perf_counter() - start)
+            while True:
+                pending = [item for directory, item in list(window.workplace_folders.items())
+                           if directory not in window.workplace_loaded]
+                for item in pending:
+                    item.setExpanded(True)
+                if not pending and not window.workplace_scanner.pending:
+                    break
+                process_events()
+        run.metric("files", len(window.workplace_files))
+        run.metric("directories", tree.directories)
+        run.metric("first_level_ms", min(first_level) * 1000)
+    finally:
+        reset_workplace(window)
+        tree.remove()
+
+
+@benchmark("workplace.load_10k", repeat=3)
+def workplace_10k(run):
+    load_workplace(run, run.size(10000, 2000))
+
+
+@benchmark("workplace.load_100k", repeat=3)
+def workplace_100k(run):
+    load_workplace(run, run.size(100000, 10000))
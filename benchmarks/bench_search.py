@@ -0,0 +1,75 @@
+from editor.search import build_pattern, replace_spans, replace_in_editor, ProjectSearch, ProjectReplace
+from benchmarks.bench_editor import shown_editor, dispose
+from benchmarks.fixtures import python_source, TemporaryTree
+from benchmarks.harness import benchmark, wait_until
+
+
+@benchmark("search.document_100k", repeat=3)
+def document_search(run):
+    """Streams a search through a 100k-line document in time-sliced chunks until `finished`."""
+    editor = shown_editor(python_source(run.size(100000, 10000)))
+    search = editor.document_search
+    pattern = build_pattern("render")
+    for _ in run:
+        search.start(pattern)
+        wait_until(lambda: not search.scanning)
+    run.metric("matches", len(search.matches))
+    search.cancel()
+    dispose(editor)
+
+
+@benchmark("search.replace_all_50k", repeat=3)
+def replace_all(run):
+    """Replace All in a 50k-line editor: spans, in-place edits and the coalesced change delivery."""
+    source = python_source(run.size(50000, 5000))
+    editor = shown_editor(source)
+    pattern = build_pattern("frames", whole_word=True)
+    spans = []
+    for _ in run:
+        with run.untimed():
+            editor.setPlainText(source)
+            editor.changes.flush()
+        text = editor.toPlainText()
+        spans = replace_spans(pattern, text, "shots")
+        replace_in_editor(editor, text, spans)
+        editor.changes.flush()
+    run.metric("replacements", len(spans))
+    dispose(editor)
+
+
+def project_tree(run):
+    return TemporaryTree(run.size(1500, 300), per_directory=50, lines=300)
+
+
+@benchmark("search.project_search", repeat=3)
+def project_search(run):
+    """Searches every .py/.txt file of a synthetic project on the thread pool."""
+    tree = project_tree(run)
+    search = ProjectSearch()
+    done = []
+    search.finished.connect(lambda files, matches: done.append(matches))
+    try:
+        for _ in run:
+            del done[:]
+            search.start(build_pattern("createNode"), {}, tree.root)
+            wait_until(lambda: done)
+        run.metric("matches", done[0])
+    finally:
+        tree.remove()
+
+
+@benchmark("search.project_replace_preview", repeat=3)
+def project_replace_preview(run):
+    """Computes replacement spans and unified diffs for a synthetic project (nothing is written)."""
+    tree = project_tree(run)
+    replace = ProjectReplace()
+    done = []
+    replace.finished.connect(lambda files, changes: done.append(changes))
+    try:
+        for _ in run:
+            del done[:]
+            replace.start(build_pattern("Grade"), "ColorCorrect", {}, tree.root)
+            wait_until(lambda: done)
+        run.metric("changes", done[0])
+    finally:
+        tree.remove()
@@ -0,0 +1,37 @@
+from PySide2.QtGui import QPixmap
+from editor.core import get_settings
+from editor.code_editor import CodeEditor
+from benchmarks.fixtures import python_source
+from benchmarks.harness import benchmark, count_file_access, process_events
+
+
+@benchmark("settings.get_settings")
+def settings_lookup(run):
+    """100k cached settings lookups; `file_access` must stay 0."""
+    calls = 100000
+    for _ in run:
+        with count_file_access() as counter:
+            for _ in range(calls):
+                get_settings().main_font_size
+    run.metric("file_access", counter.count)
+    run.metric("calls", calls)
+
+
+@benchmark("settings.paint_file_access")
+def paint_file_access(run):
+    """Repaints the editor and its gutter; paint handlers must not touch the disk."""
+    editor = CodeEditor()
+    editor.resize(1000, 800)
+    editor.setPlainText(python_source(2000))
+    editor.show()
+    process_events()
+    target = QPixmap(editor.size())
+    frames = 50
+    for _ in run:
+        with count_file_access() as counter:
+            for _ in range(frames):
+                # render() paints synchronously, also on the offscreen platform
+                editor.render(target)
+    run.metric("frames", frames)
+    run.metric("file_access", counter.count)
+    editor.deleteLater()
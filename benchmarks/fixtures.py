@@ -0,0 +1,110 @@
+import os
+import shutil
+import tempfile
+
+# Sentetik kaynak kodun tekrarlanan bölümü; {i} her tekrarda benzersiz isimler üretir
+_SOURCE_TEMPLATE = '''
+
+class Grade{i}(object):
+    """Colour correction helper #{i}.
+
+    Builds a Grade node and keeps its knob values in sync.
+    """
+    default_gain = {i} * 0.5  # Varsayılan kazanç
+
+    def __init__(self, name="grade_{i}", gain=1.0):
+        self.name = name
+        self.gain = gain
+        self.node = nuke.createNode("Grade", inpanel=False)
+
+    def apply(self, values):
+        for index, value in enumerate(values):
+            self.node["white"].setValue(value * self.gain, index)
+        return {{"name": self.name, "count": len(values), "ratio": 0x{i:x} / 255.0}}
+
+
+def render_frames_{i}(first=1, last=100, step=1):
+    frames = [frame for frame in range(first, last + 1, step) if frame % 2 == 0]
+    message = f"rendering {{len(frames)}} frames for {i}"
+    print(message, r"C:\\\\renders\\\\shot_{i}.####.exr")
+    return frames
+'''
+
+
+def python_source(lines):
+    """Returns deterministic, realistic Python source of roughly `lines` lines."""
+    parts = ["import nuke\nimport os\n"]
+    count = 2
+    i = 0
+    while count < lines:
+        part = _SOURCE_TEMPLATE.format(i=i)
+        parts.append(part)
+        count += part.count("\n")
+        i += 1
+    return "".join(parts)
+
+
+def python_source_of_size(size):
+    """Python source of at least `size` characters."""
+    source = python_source(max(1, size // 40))
+    while len(source) < size:
+        source += python_source(max(1, (size - len(source)) // 40))
+    return source
+
+
+class TemporaryTree:
+    """
+    Synthetic project tree in a temporary directory.
+
+    `files` files are spread over directories of `per_directory` entries each, `depth` levels deep; a
+    third of the files are .py files with `lines` lines of content, the rest are empty assets.
+    """
+
+    extensions = (".py", ".txt", ".png")
+
+    def __init__(self, files, per_directory=100, depth=2, lines=0):
+        self.root = tempfile.mkdtemp(prefix="nuke_ide_bench_")
+        self.files = files
+        self.directories = 0
+        source = python_source(lines) if lines else ""
+        for index in range(files):
+            parts = []
+            bucket = index // per_directory
+            for _ in range(depth):
+                parts.append(f"dir_{bucket % per_directory:03d}")
+                bucket //= per_directory
+            directory = os.path.join(self.root, *reversed(parts))
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            extension = self.extensions[index % len(self.extensions)]
+            with open(os.path.join(directory, f"file_{index:06d}{extension}"), "w") as file:
+                if extension == ".py":
+                    file.write(source)
+        for _, directories, _ in os.walk(self.root):
+            self.directories += len(directories)
+
+    def remove(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+_main_window = None
+
+
+def main_window():
+    """Returns a shown EditorApp shared by the benchmarks that need the full window."""
+    global _main_window
+    if _main_window is None:
+        from editor.editor_window import EditorApp
+        _main_window = EditorApp()
+        _main_window.resize(1400, 900)
+        _main_window.show()
+    return _main_window
+
+
+def close_extra_tabs(window, keep=1):
+    """Removes every tab after the first `keep` without save prompts."""
+    tabs = window.tab_widget
+    while tabs.count() > keep:
+        editor = tabs.widget(tabs.count() - 1)
+        tabs.removeTab(tabs.count() - 1)
+        editor.deleteLater()
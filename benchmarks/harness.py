@@ -0,0 +1,264 @@
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+DEFAULT_BASELINE = os.path.join(RESULTS_DIR, "baseline.json")
+
+BENCHMARKS = []  # Kayıt sırasına göre Benchmark nesneleri
+
+
+def setup_environment():
+    """
+    Prepares the process the way Nuke would, but headless.
+
+    Qt runs on the offscreen platform, the project and `editor` directories are importable like Nuke's
+    plugin paths, the bundled Pygments is on sys.path and `assets/nuke.py` / `assets/nukescripts.py`
+    stand in for the real Nuke modules. Returns the QApplication.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    for path in (os.path.join(ROOT, "editor"), ROOT):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    for path in (os.path.join(ROOT, "editor", "settings", "modules"), os.path.join(ROOT, "assets")):
+        if path not in sys.path:
+            sys.path.append(path)
+
+    from PySide2.QtWidgets import QApplication
+    return QApplication.instance() or QApplication(sys.argv[:1])
+
+
+# Kayıt
+class Benchmark:
+    def __init__(self, name, function, repeat, warmup):
+        self.name = name
+        self.function = function
+        self.repeat = repeat
+        self.warmup = warmup
+
+
+def benchmark(name, repeat=5, warmup=1):
+    """
+    Registers `function(run)` as a benchmark.
+
+    The function does its own setup and iterates `run`; only the loop body is timed (see `Run`).
+    """
+    def decorator(function):
+        BENCHMARKS.append(Benchmark(name, function, repeat, warmup))
+        return function
+    return decorator
+
+
+def select(patterns):
+    """Returns the registered benchmarks matching any of the fnmatch `patterns` (all if empty)."""
+    if not patterns:
+        return list(BENCHMARKS)
+    return [bench for bench in BENCHMARKS if any(fnmatch.fnmatch(bench.name, pattern) for pattern in patterns)]
+
+
+class Run:
+    """
+    Timing loop handed to a benchmark function.
+
+    Each iteration of `for _ in run:` is one sample; the first `warmup` iterations are discarded. Work
+    inside `with run.untimed():` (e.g. resetting state) is excluded from the sample. Extra measurements
+    are attached with `metric`.
+    """
+
+    def __init__(self, repeat, warmup, quick=False):
+        self.repeat = repeat
+        self.warmup = warmup
+        self.quick = quick
+        self.samples = []
+        self.metrics = {}
+        self.excluded = 0.0
+
+    def size(self, full, quick):
+        """Problem size for the current mode (`--quick` uses the smaller one)."""
+        return quick if self.quick else full
+
+    def __iter__(self):
+        for index in range(self.warmup + self.repeat):
+            self.excluded = 0.0
+            start = time.perf_counter()
+            yield index
+            elapsed = time.perf_counter() - start - self.excluded
+            if index >= self.warmup:
+                self.samples.append(elapsed)
+
+    @contextmanager
+    def untimed(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.excluded += time.perf_counter() - start
+
+    def metric(self, name, value):
+        self.metrics[name] = value
+
+    def distribution(self, name, values, scale=1000.0):
+        """Adds p50/p95/p99/max of `values` (seconds, reported in ms by default) as metrics."""
+        from editor.profiler import percentile
+        values = list(values)
+        if not values:
+            return
+        for label, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+            self.metrics[f"{name}_{label}"] = percentile(values, fraction) * scale
+        self.metrics[f"{name}_max"] = max(values) * scale
+
+    def result(self):
+        samples = self.samples
+        return {
+            "samples": samples,
+            "min": min(samples),
+            "median": statistics.median(samples),
+            "mean": statistics.mean(samples),
+            "max": max(samples),
+            "metrics": self.metrics,
+        }
+
+
+# Yardımcılar
+def process_events():
+    from PySide2.QtWidgets import QApplication
+    QApplication.processEvents()
+
+
+def wait_until(predicate, timeout=120.0):
+    """Runs the Qt event loop until `predicate()` is true; raises TimeoutError after `timeout` seconds."""
+    from PySide2.QtCore import QEventLoop
+    from PySide2.QtWidgets import QApplication
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError(f"condition not reached in {timeout} s")
+        QApplication.processEvents(QEventLoop.AllEvents, 20)
+        QApplication.sendPostedEvents()
+
+
+class FileAccessCounter:
+    """Counts file system audit events (open, listdir, scandir, ...) while `active`."""
+    events = ("open", "os.listdir", "os.scandir", "os.walk", "glob.glob")
+    _hook = None
+
+    def __init__(self):
+        self.count = 0
+        self.active = False
+        self.by_path = {}
+
+    def __call__(self, event, args):
+        if self.active and event in self.events:
+            self.count += 1
+            path = str(args[0]) if args else ""
+            self.by_path[path] = self.by_path.get(path, 0) + 1
+
+
+@contextmanager
+def count_file_access():
+    """
+    Counts file system accesses of the wrapped code through a `sys.addaudithook` hook.
+
+    Audit hooks cannot be removed, so one shared counter is installed and only switched on here.
+    """
+    if not hasattr(sys, "addaudithook"):
+        raise RuntimeError("file access counting needs Python 3.8+")
+    if FileAccessCounter._hook is None:
+        FileAccessCounter._hook = FileAccessCounter()
+        sys.addaudithook(FileAccessCounter._hook)
+    counter = FileAccessCounter._hook
+    counter.count = 0
+    counter.by_path = {}
+    counter.active = True
+    try:
+        yield counter
+    finally:
+        counter.active = False
+
+
+# Çalıştırma ve raporlama
+def run_benchmarks(benchmarks, quick=False, log=print):
+    """Runs the benchmarks in order; a failing benchmark is reported and skipped."""
+    results = {}
+    for bench in benchmarks:
+        run = Run(bench.repeat, bench.warmup, quick)
+        try:
+            bench.function(run)
+        except Exception as e:
+            log(f"{bench.name:<40} FAILED: {type(e).__name__}: {e}")
+            results[bench.name] = {"error": f"{type(e).__name__}: {e}"}
+            continue
+        if not run.samples:
+            log(f"{bench.name:<40} FAILED: no samples")
+            results[bench.name] = {"error": "no samples"}
+            continue
+        result = results[bench.name] = run.result()
+        metrics = ", ".join(f"{key}={format_value(value)}" for key, value in result["metrics"].items())
+        log(f"{bench.name:<40} median {result['median'] * 1000:10.2f} ms  min {result['min'] * 1000:10.2f} ms"
+            + (f"  [{metrics}]" if metrics else ""))
+    return results
+
+
+def format_value(value):
+    return f"{value:.3g}" if isinstance(value, float) else str(value)
+
+
+def environment_info(quick):
+    from PySide2 import __version__ as pyside_version
+    from PySide2.QtCore import qVersion
+    return {
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pyside2": pyside_version,
+        "qt": qVersion(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "quick": quick,
+    }
+
+
+def save_results(path, results, quick):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as file:
+        json.dump({"environment": environment_info(quick), "results": results}, file, indent=2)
+
+
+def load_results(path):
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def compare(results, baseline, threshold=0.1, log=print):
+    """
+    Compares median times against a baseline file's results.
+
+    Returns:
+        list: Names of the benchmarks that are slower than the baseline by more than `threshold`.
+    """
+    if baseline.get("environment", {}).get("quick") is not None:
+        log(f"Baseline: {baseline['environment'].get('date', '?')} "
+            f"({'quick' if baseline['environment']['quick'] else 'full'} sizes)")
+    old_results = baseline.get("results", {})
+    regressions = []
+    log(f"{'benchmark':<40} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+    for name, result in results.items():
+        old = old_results.get(name)
+        if "error" in result or not old or "error" in old:
+            log(f"{name:<40} {'-':>12} {'-':>12} {'n/a':>8}")
+            continue
+        ratio = result["median"] / old["median"] if old["median"] else float("inf")
+        status = ""
+        if ratio > 1 + threshold:
+            status = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            status = "  improved"
+        log(f"{name:<40} {old['median'] * 1000:12.2f} {result['median'] * 1000:12.2f} "
+            f"{(ratio - 1) * 100:+7.1f}%{status}")
+    return regressions
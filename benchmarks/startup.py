@@ -0,0 +1,119 @@
+"""
+Cold-start cost of the editor: a fresh interpreter imports `editor.editor_window` under `-X importtime`
+and opens the main window.
+
+    python -m benchmarks.startup              # per-module and per-package import report
+    python -m benchmarks startup.*            # the same start as a timed benchmark
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+from benchmarks.harness import ROOT, RESULTS_DIR, benchmark, save_results
+
+# Yeni süreçte çalışır; sonuçları stdout'a tek bir JSON satırı olarak yazar
+CHILD = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+from benchmarks import harness
+app = harness.setup_environment()
+start = time.perf_counter()
+import editor.editor_window
+imported = time.perf_counter()
+window = editor.editor_window.EditorApp()
+window.resize(1400, 900)
+window.show()
+harness.process_events()
+shown = time.perf_counter()
+from editor.hot_reload import editor_modules
+print(json.dumps({{"import_s": imported - start, "window_s": shown - imported, "editor_modules": editor_modules()}}))
+"""
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+PACKAGES = ("editor", "pygments", "git", "PySide2", "shiboken2")
+
+
+def parse_importtime(text):
+    """(module, self_s, cumulative_s, depth) for every line of `-X importtime` output, in print order."""
+    modules = []
+    for line in text.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append((name, int(self_us) / 1e6, int(cumulative_us) / 1e6, (len(indent) - 1) // 2))
+    return modules
+
+
+def package_of(name, editor_names):
+    if name in editor_names:
+        return "editor"
+    top = name.split(".")[0]
+    return top if top in PACKAGES else "other"
+
+
+def measure_startup():
+    """Runs one cold start in a new interpreter and returns its timings and import table."""
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", CHILD.format(root=ROOT)],
+                             cwd=ROOT, capture_output=True, text=True)
+    total = time.perf_counter() - start
+    lines = process.stdout.strip().splitlines()
+    if process.returncode or not lines:
+        errors = [line for line in process.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError("startup process failed:\n" + "\n".join(errors[-20:]))
+    report = json.loads(lines[-1])
+    editor_names = set(report.pop("editor_modules"))
+    modules = parse_importtime(process.stderr)
+    packages = {}
+    for name, self_s, _, _ in modules:
+        package = package_of(name, editor_names)
+        packages[package] = packages.get(package, 0.0) + self_s
+    report.update(total_s=total, modules=modules, packages=packages)
+    return report
+
+
+def print_report(report, top=25, log=print):
+    log(f"process {report['total_s']:.3f}s   import editor.editor_window {report['import_s']:.3f}s   "
+        f"EditorApp + show {report['window_s']:.3f}s\n")
+    log("Self time per package:")
+    for package, seconds in sorted(report["packages"].items(), key=lambda item: -item[1]):
+        log(f"  {package:<12} {seconds * 1000:9.1f} ms")
+    for title, column in (("self", 1), ("cumulative", 2)):
+        log(f"\nTop {top} modules by {title} time:")
+        for module in sorted(report["modules"], key=lambda module: -module[column])[:top]:
+            log(f"  {module[column] * 1000:9.1f} ms  {module[0]}")
+
+
+@benchmark("startup.cold_start", repeat=3)
+def cold_start(run):
+    """A new interpreter imports the editor and shows the main window; import and window shares as metrics."""
+    reports = []
+    for _ in run:
+        reports.append(measure_startup())
+    run.metric("import_s", min(report["import_s"] for report in reports))
+    run.metric("window_s", min(report["window_s"] for report in reports))
+    for package in PACKAGES:
+        run.metric(f"{package}_self_ms", min(report["packages"].get(package, 0.0) for report in reports) * 1000)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup",
+                                     description="Per-module import cost of a cold editor start.")
+    parser.add_argument("--top", type=int, default=25, help="number of modules listed (default: 25)")
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "startup.json"),
+                        help="JSON file for the report (default: benchmarks/results/startup.json)")
+    arguments = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    report = measure_startup()
+    print_report(report, arguments.top)
+    save_results(arguments.output, {"startup": report}, False)
+    print(f"\nReport written to {arguments.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
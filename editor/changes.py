@@ -0,0 +1,25 @@
+from collections import namedtuple
+
+# Birleştirilmiş belge değişikliği; konumlar değişiklikten önceki belgeye göredir (bkz. QTextDocument.contentsChange)
+DocumentChange = namedtuple("DocumentChange", "position removed added bulk")
+
+
+class PendingChange:
+    """Accumulates contentsChange notifications into one range covering every edit since the last delivery."""
+
+    def __init__(self, position, removed, added, bulk):
+        self.start = position
+        self.old_end = position + removed  # Değişiklik öncesi belgede
+        self.new_end = position + added  # Güncel belgede
+        self.bulk = bulk
+
+    def merge(self, position, removed, added, bulk):
+        delta = self.new_end - self.old_end
+        end = max(self.new_end, position + removed)
+        self.start = min(self.start, position)
+        self.old_end = end - delta
+        self.new_end = end + added - removed
+        self.bulk = self.bulk and bulk
+
+    def change(self):
+        return DocumentChange(self.start, self.old_end - self.start, self.new_end - self.start, self.bulk)
@@ -1,73 +1,145 @@
-import importlib
-import json
+from contextlib import contextmanager
 import os
-from PySide2.QtCore import QRect
+import re
+import time
+from PySide2.QtCore import QRect, QTimer, QEvent, QLineF, QPointF
 from PySide2.QtCore import QRegExp
 from PySide2.QtCore import QSize
-from PySide2.QtGui import QColor, QTextCharFormat, QSyntaxHighlighter, QPen
-from PySide2.QtGui import QFont, QPalette, QTextOption
+from PySide2.QtGui import QColor, QTextCharFormat, QSyntaxHighlighter, QPen, QTextBlockUserData, QStaticText, QTransform
+from PySide2.QtGui import QFont, QPalette, QTextOption, QKeySequence
 from PySide2.QtGui import QPainter, QTextFormat, QFontDatabase, QTextBlockFormat
 from PySide2.QtWidgets import *
-import editor.completer
-import editor.inline_ghosting
-import nodes.crtNode
-import editor.dialogs.replaceDialogs
-from editor.core import CodeEditorSettings
-import settings.settings_ui
-from editor.completer import Completer
+from editor.core import SettingsStore, get_settings
+from editor.symbols import DocumentSymbolIndex
 from PySide2.QtCore import Qt
 from PySide2.QtGui import QTextCursor
 from editor.inline_ghosting import InlineGhosting
-from init_ide import settings_path
-from nodes.crtNode import createNodeCompleter
-
-importlib.reload(editor.completer)
-importlib.reload(editor.inline_ghosting)
-importlib.reload(nodes.crtNode)
-importlib.reload(editor.dialogs.replaceDialogs)
-importlib.reload(settings.settings_ui)
+from editor.services import EditorServices
+from editor.selections import SelectionLayers, OccurrenceHighlighter
+from editor.search import DocumentSearch
+from editor.dispatcher import ChangeDispatcher, IMMEDIATE
+from editor.profiler import TypingProfiler
 
 from pygments.style import Style
 from pygments.token import Keyword, Name, Comment, String, Error, Number, Operator, Text, Generic, Literal, Punctuation
-from editor.dialogs.replaceDialogs import ReplaceDialogs
+from pygments.token import _TokenType
 from pygments.lexers import PythonLexer
-from pygments.formatters import HtmlFormatter
+from pygments.styles import get_style_by_name
 
 class CodeEditor(InlineGhosting):
     def __init__(self, editor_window=None, *args):
         super().__init__(*args)
         self.editor_window = editor_window  # Store a reference to the EditorApp instance
-        self.font_size = CodeEditorSettings().main_font_size  # Default font size
-        self.ctrl_wheel_enabled = CodeEditorSettings().ctrlWheel  # Control + Wheel feature check
+        self.font_size = get_settings().main_font_size  # Default font size
+        self.ctrl_wheel_enabled = get_settings().ctrlWheel  # Control + Wheel feature check
+        self.indent_pen = self.make_indent_pen()
+        self.indent_step = None  # 4 boşluğun piksel genişliği; font değişince sıfırlanır
         self.setup_fonts()
         self.set_background_color()
-        self.completer = Completer(self)  # Initialize Completer
+        # Belge değişiklikleri tek bir dağıtıcıdan, tur başına birleştirilmiş olarak gelir
+        self.changes = ChangeDispatcher(self)
+        self.symbol_index = DocumentSymbolIndex()  # Completer'ın sorguladığı artımlı sembol tablosu
+        self.changes.register("symbol_index", self.update_symbol_index)
+        # Completer ve createNode tamamlayıcısı tüm sekmelerde ortaktır; yazılan editöre bağlanırlar
+        EditorServices.instance().attach(self)
+        self.completer = EditorServices.instance().completer
         self.setWordWrapMode(QTextOption.NoWrap)
-        self.set_line_spacing(CodeEditorSettings().line_spacing_size)
+        self.set_line_spacing(get_settings().line_spacing_size)
         self.line_number_area = LineNumberArea(self)
         self.blockCountChanged.connect(self.update_line_number_area_width)
         self.updateRequest.connect(self.update_line_number_area)
+        # Ek seçimler (geçerli satır, tıklanan satır, tekrarlar, arama) katmanlar halinde birleştirilir
+        self.selection_layers = SelectionLayers(self)
+        self.occurrence_highlighter = OccurrenceHighlighter(self, self.selection_layers)
+        self.document_search = DocumentSearch(self)
+        self.file_path = None  # Sekmenin diskteki dosyası (varsa)
+        self.bulk_editing = False  # bkz. bulk_edit
         self.cursorPositionChanged.connect(self.highlight_current_line)
-        self.cursorPositionChanged.connect(self.highlight_current_word)
-        self.cursorPositionChanged.connect(self.update_cursor_position)
-        self.blockCountChanged.connect(self.update_line_and_character_count)
-        self.textChanged.connect(self.update_line_and_character_count)
-        self.cursorPositionChanged.connect(self.update_line_and_character_count)
-        self.textChanged.connect(self.handle_text_change)
+        # Durum çubuğu olay döngüsünün her turunda en fazla bir kez güncellenir
+        self.main_window = None
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.setInterval(0)
+        self.status_timer.timeout.connect(self.update_line_and_character_count)
+        self.cursorPositionChanged.connect(self.status_timer.start)
+        self.changes.register("status_bar", lambda change: self.update_line_and_character_count())
+        self.changes.register("completer", self.update_completer)
+        self.changes.register("ghosting", self.update_ghosting)
         self.update_line_number_area_width(0)
         self.highlighter = PygmentsHighlighter(self.document())  # Highlighter'ı bağla
-        # `createNodeCompleter` nesnesini oluştur
-        self.createNodeCompleter = createNodeCompleter(self)
-
-        # `textChanged` sinyalini `createNodeCompleter` ile bağla
-        self.textChanged.connect(self.createNodeCompleter.check_for_create_node)
+        self.verticalScrollBar().valueChanged.connect(self.update_highlight_viewport)
+        self.createNodeCompleter = EditorServices.instance().node_completer
+        self.changes.register("node_completer", self.check_for_create_node)
+
+        # settings.json değiştiğinde açık editörler ayarları yeniden uygular
+        SettingsStore.instance().settings_changed.connect(self.apply_settings)
+
+    def apply_settings(self):
+        """Re-applies cached settings after settings.json has been reloaded."""
+        settings = get_settings()
+        self.font_size = settings.main_font_size
+        self.ctrl_wheel_enabled = settings.ctrlWheel
+        self.setup_fonts()
+        self.set_background_color()
+        self.indent_pen = self.make_indent_pen()
+        self.line_number_area.invalidate()
+        if not settings.ENABLE_INLINE_GHOSTING:
+            self.ghost_text = ""
+        self.highlighter.lazy_threshold = settings.LAZY_HIGHLIGHT_THRESHOLD
+        self.highlighter.apply_style(SettingsStore.instance().get("General", "syntax_style_dropdown", "monokai"))
+        self.update_line_number_area_width(0)
+        self.viewport().update()
+        self.line_number_area.update()
+
+    def update_symbol_index(self, change):
+        """Sadece değişen blokları yeniden tarayarak sembol tablosunu günceller."""
+        document = self.document()
+        first = document.findBlock(change.position).blockNumber()
+        last_block = document.findBlock(change.position + change.added)
+        last = last_block.blockNumber() if last_block.isValid() else document.blockCount() - 1
+        first = max(first, 0)
+        self.symbol_index.apply_blocks(first, last, document.blockCount(),
+                                       lambda number: document.findBlockByNumber(number).text())
+
+    def check_for_create_node(self, change):
+        """Ortak `nuke.createNode` tamamlayıcısını bu editör için çalıştırır."""
+        if not change.bulk:
+            self.createNodeCompleter.check_for_create_node()
+
+    def focusInEvent(self, event):
+        """Odaklanan editöre ortak tamamlayıcıları bağlar."""
+        EditorServices.instance().attach(self)
+        super().focusInEvent(event)
+
+    @contextmanager
+    def bulk_edit(self):
+        """
+        Groups programmatic edits into one edit block and one undo step.
+
+        Document listeners are notified once when the block ends; typing helpers (completer popup, ghost
+        text) ignore that notification.
+        """
+        cursor = QTextCursor(self.document())
+        self.bulk_editing = True
+        cursor.beginEditBlock()
+        try:
+            yield cursor
+        finally:
+            cursor.endEditBlock()
+            self.bulk_editing = False
 
-    def handle_text_change(self):
+    def update_completer(self, change=None):
         """Yazarken tamamlayıcıyı her harf değişiminde tetikleme"""
+        if change is not None and change.bulk:
+            return  # Toplu düzenleme (ör. replace-all) yazma sayılmaz
+        EditorServices.instance().attach(self)
         self.completer.update_completions()
 
+    def update_ghosting(self, change=None):
+        if change is not None and change.bulk:
+            return
         # Inline ghosting ayarını kontrol et
-        if CodeEditorSettings().ENABLE_INLINE_GHOSTING:
+        if get_settings().ENABLE_INLINE_GHOSTING:
             self.update_ghost_text()  # inline ghost text özelliğini tetikle
         else:
             self.ghost_text = ""  # Ghost text özelliği kapalıysa boş bırak
@@ -78,15 +150,15 @@ class CodeEditor(InlineGhosting):
         # QPalette oluştur
         palette = self.palette()
         # QPalette ile arka plan rengini QPalette.Base kısmına uygula
-        palette.setColor(QPalette.Base, CodeEditorSettings().code_background_color)
+        palette.setColor(QPalette.Base, get_settings().code_background_color)
         # Arka plan rengini uygula
         self.setPalette(palette)
 
     def setup_fonts(self):
         # JSON'dan font bilgilerini yükle
 
-        default_font = CodeEditorSettings().main_default_font  # Ayar dosyasındaki font ismi
-        default_font_size = CodeEditorSettings().main_font_size  # Ayar dosyasındaki font boyutu
+        default_font = get_settings().main_default_font  # Ayar dosyasındaki font ismi
+        default_font_size = get_settings().main_font_size  # Ayar dosyasındaki font boyutu
 
         self.setFont(QFont(default_font, default_font_size))  # Fontu ayarla
         print (default_font, default_font_size, "font info")
@@ -124,6 +196,19 @@ class CodeEditor(InlineGhosting):
         self.setTextCursor(cursor)  # Yeni formatı uyguluyoruz
 
     def keyPressEvent(self, event):
+        """Profiler açıkken tuşu, IMMEDIATE değişiklik şeridi teslim edilene kadar ölçer."""
+        profiler = TypingProfiler.instance()
+        if not profiler.enabled:
+            self.handle_key_press(event)
+            return
+        profiler.begin_key(event.text() or QKeySequence(event.key()).toString())
+        try:
+            self.handle_key_press(event)
+        finally:
+            if self.changes.pending[IMMEDIATE] is None:
+                profiler.end_key()  # Belge değişmedi (ör. ok tuşu); aksi halde dağıtıcı kapatır
+
+    def handle_key_press(self, event):
         cursor = self.textCursor()
 
         # Eğer tamamlama popup'ı açık ise Enter/Return tuşunu popup ile kullanmak
@@ -211,17 +296,20 @@ class CodeEditor(InlineGhosting):
         cursor = self.textCursor()
         line = cursor.blockNumber() + 1
         column = cursor.columnNumber() + 1
-        total_characters = len(self.toPlainText())
+        total_characters = self.document().characterCount() - 1  # Son paragraf ayracı sayılmaz
 
         main_window = self.get_main_window()
         if main_window:
             main_window.status_bar.showMessage(f"{line}:{column} | Characters: {total_characters}")
 
     def get_main_window(self):
-        parent = self.parent()
-        while parent and not isinstance(parent, QMainWindow):
-            parent = parent.parent()
-        return parent
+        """Editörü içeren QMainWindow'u döndürür; ilk bulunduğunda önbelleğe alınır."""
+        if self.main_window is None:
+            parent = self.editor_window if isinstance(self.editor_window, QMainWindow) else self.parent()
+            while parent and not isinstance(parent, QMainWindow):
+                parent = parent.parent()
+            self.main_window = parent
+        return self.main_window
 
     def contextMenuEvent(self, event):
         # Varsayılan bağlam menüsünü oluştur
@@ -240,79 +328,62 @@ class CodeEditor(InlineGhosting):
 
         # Replace All seçeneği
         replace_action = QAction("Replace", self)
-        replace_action.triggered.connect(
-            lambda: ReplaceDialogs(self).show()
-            if self.textCursor().selectedText().strip()
-            else self.get_main_window().status_bar.showMessage("Please select the text you want to replace.", 5000)
-        )
+        replace_action.triggered.connect(self.show_replace_dialog)
 
         menu.addAction(replace_action)
         # Menüyü göster
         menu.exec_(event.globalPos())
 
-    def get_main_window(self):
-        parent = self.parent()
-        while parent and not isinstance(parent, QMainWindow):
-            parent = parent.parent()
-        return parent
-
-    def highlight_current_word(self):
-        extra_selections = []
-        selected_text = self.textCursor().selectedText()
-
-        if selected_text and len(selected_text) >= 2:
-            document = self.document()
-            cursor = QTextCursor(document)
-            highlight_format = QTextCharFormat()
-            highlight_format.setBackground(QColor(125, 81, 0))
-
-            while not cursor.isNull() and not cursor.atEnd():
-                cursor = document.find(selected_text, cursor)
-                if not cursor.isNull():
-                    selection = QTextEdit.ExtraSelection()
-                    selection.cursor = cursor
-                    selection.format = highlight_format
-                    extra_selections.append(selection)
-
-        self.setExtraSelections(extra_selections)
-
-    def update_cursor_position(self):
-        cursor = self.textCursor()
-        line = cursor.blockNumber() + 1
-        column = cursor.columnNumber() + 1
-
-        main_window = self.get_main_window()
-        if main_window:
-            main_window.status_bar.showMessage(f"{line}:{column}")
+    def show_replace_dialog(self):
+        """Seçili metin için Replace diyalogunu açar; diyalog modülü ilk kullanımda yüklenir."""
+        if not self.textCursor().selectedText().strip():
+            self.get_main_window().status_bar.showMessage("Please select the text you want to replace.", 5000)
+            return
+        from editor.dialogs.replaceDialogs import ReplaceDialogs
+        ReplaceDialogs(self).show()
+
+    def make_indent_pen(self):
+        """Girinti çizgilerinin kalemini ayarlardan oluşturur."""
+        settings = get_settings()
+        pen = QPen(QColor(settings.intender_color))
+        pen.setWidth(settings.intender_width)  # Çizgi kalınlığını buradan ayarlayabilirsiniz (örnek: 2 piksel)
+        return pen
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.FontChange:
+            self.indent_step = None
+        super().changeEvent(event)
 
     def paintEvent(self, event):
         super().paintEvent(event)
-        painter = QPainter(self.viewport())
-
-        pen = QPen(QColor(CodeEditorSettings().intender_color))
-        pen.setWidth(CodeEditorSettings().intender_width)  # Çizgi kalınlığını buradan ayarlayabilirsiniz (örnek: 2 piksel)
-        painter.setPen(pen)
+        if self.indent_step is None:
+            self.indent_step = 4 * self.fontMetrics().horizontalAdvance(' ')
 
+        # Girinti derinliği bloğun BlockData'sından okunur; tüm çizgiler tek drawLines ile çizilir
+        lines = []
+        rect = event.rect()
         block = self.firstVisibleBlock()
         top = self.blockBoundingGeometry(block).translated(self.contentOffset()).top()
         bottom = top + self.blockBoundingRect(block).height()
 
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
-                text = block.text()
-                indentation_level = len(text) - len(text.lstrip())
-                font_metrics = self.fontMetrics()
-                char_width = font_metrics.horizontalAdvance(' ')
-
-                for i in range(1, (indentation_level // 4) + 1):
-                    x = i * 4 * char_width
-                    painter.drawLine(x, top, x, bottom)
+        while block.isValid() and top <= rect.bottom():
+            if block.isVisible() and bottom >= rect.top():
+                data = block.userData()
+                if not isinstance(data, BlockData):
+                    data = BlockData(block.text())
+                for i in range(1, (data.indent // 4) + 1):
+                    x = i * self.indent_step
+                    lines.append(QLineF(x, top, x, bottom))
 
             block = block.next()
             top = bottom
             bottom = top + self.blockBoundingRect(block).height()
 
-        painter.end()
+        if lines:
+            painter = QPainter(self.viewport())
+            painter.setPen(self.indent_pen)
+            painter.drawLines(lines)
+            painter.end()
 
     def line_number_area_width(self):
         digits = len(str(self.blockCount()))
@@ -335,6 +406,13 @@ class CodeEditor(InlineGhosting):
         super().resizeEvent(event)
         cr = self.contentsRect()
         self.line_number_area.setGeometry(QRect(cr.left(), cr.top(), self.line_number_area_width(), cr.height()))
+        self.update_highlight_viewport()
+
+    def update_highlight_viewport(self, *args):
+        """Tembel renklendirme için görünür blok aralığını highlighter'a bildirir."""
+        first = self.firstVisibleBlock().blockNumber()
+        lines = self.viewport().height() // max(1, self.fontMetrics().height()) + 1
+        self.highlighter.set_visible_blocks(first, first + lines)
 
     def highlight_current_line(self):
         extraSelections = []
@@ -346,38 +424,30 @@ class CodeEditor(InlineGhosting):
             selection.cursor = self.textCursor()
             selection.cursor.clearSelection()
             extraSelections.append(selection)
-        self.setExtraSelections(extraSelections)
+        self.selection_layers.set("current_line", extraSelections)
 
     def line_number_area_paint_event(self, event):
-        painter = QPainter(self.line_number_area)
-        painter.fillRect(event.rect(), CodeEditorSettings().line_number_background_color)
+        """Yalnızca kirli alandaki satır numaralarını önbellekteki glifler ve BlockData bayraklarıyla çizer."""
+        settings = get_settings()
+        area = self.line_number_area
+        rect = event.rect()
+        painter = QPainter(area)
+        painter.fillRect(rect, settings.line_number_background_color)
+        painter.setFont(area.gutter_font())
+        painter.setPen(settings.line_number_color)
 
         block = self.firstVisibleBlock()
         block_number = block.blockNumber()
         top = self.blockBoundingGeometry(block).translated(self.contentOffset()).top()
         bottom = top + self.blockBoundingRect(block).height()
 
-        font = painter.font()
-        font.setBold(CodeEditorSettings().line_number_weight)
-        font.setPointSize(CodeEditorSettings().main_font_size)
-        painter.setFont(font)
-
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
-                number = str(block_number + 1)
-                text = block.text().strip()
-
-                # Satırın "def" veya "class" ile başlayıp başlamadığını kontrol ediyoruz
-                if text.startswith('def ') or text.startswith('class '):
-                    painter.setPen(CodeEditorSettings().line_number_color)
-                    # Satır numarasının sağ tarafına ">" sembolü ekliyoruz
-                    painter.drawText(5, top, self.line_number_area.width() - 5, self.fontMetrics().height(),
-                                     Qt.AlignLeft, number + u" \u2192")
-                else:
-                    # Diğer satırlara sadece numara yaz
-                    painter.setPen(CodeEditorSettings().line_number_color)
-                    painter.drawText(5, top, self.line_number_area.width() - 5, self.fontMetrics().height(),
-                                     Qt.AlignLeft, number)
+        while block.isValid() and top <= rect.bottom():
+            if block.isVisible() and bottom >= rect.top():
+                data = block.userData()
+                if not isinstance(data, BlockData):
+                    data = BlockData(block.text())
+                # "def" veya "class" satırlarında numaranın sağına "→" sembolü eklenir
+                painter.drawStaticText(QPointF(5, top), area.glyph(block_number + 1, data.is_definition))
 
             # Bir sonraki bloğa geçerken block_number'ı arttır
             block_number += 1
@@ -385,9 +455,9 @@ class CodeEditor(InlineGhosting):
             top = bottom
             bottom = top + self.blockBoundingRect(block).height()
 
-        painter.setPen(CodeEditorSettings().line_number_draw_line)
-        painter.drawLine(self.line_number_area.width() - 1, event.rect().top(), self.line_number_area.width() - 1,
-                         event.rect().bottom())
+        painter.setPen(settings.line_number_draw_line)
+        painter.drawLine(area.width() - 1, rect.top(), area.width() - 1, rect.bottom())
+        painter.end()
 
     def mousePressEvent(self, event):
         """Satır numarası alanına tıklama kontrolü ve satır renklendirme"""
@@ -402,27 +472,53 @@ class CodeEditor(InlineGhosting):
         selection = QTextEdit.ExtraSelection()
 
         # Transparan arka plan rengi ayarlama
-        line_color = CodeEditorSettings().clicked_line_color
+        line_color = get_settings().clicked_line_color
         selection.format.setBackground(line_color)
         selection.format.setProperty(QTextFormat.FullWidthSelection, True)
 
         selection.cursor = cursor
         selection.cursor.clearSelection()
 
-        # Mevcut renklendirmeleri temizle
-        extraSelections = self.extraSelections()
-
-        # Diğer renklendirmeleri kontrol et ve temizle
-        extraSelections = [sel for sel in extraSelections if sel.format.background() != line_color]
-
-        # Yeni renklendirme ekle
-        extraSelections.append(selection)
-        self.setExtraSelections(extraSelections)
+        # Önceki tıklama vurgusunu yenisiyle değiştir
+        self.selection_layers.set("clicked_line", [selection])
 
 class LineNumberArea(QWidget):
+    max_glyphs = 4096  # Önbellekte tutulan en fazla satır etiketi
+
     def __init__(self, editor):
         super().__init__(editor)
         self.code_editor = editor
+        self.font_cache = None
+        self.glyphs = {}  # (satır numarası, tanım mı) -> QStaticText
+
+    def gutter_font(self):
+        """Satır numarası fontu; ayarlar değişene kadar önbellekte tutulur."""
+        if self.font_cache is None:
+            settings = get_settings()
+            font = self.font()
+            font.setBold(settings.line_number_weight)
+            font.setPointSize(settings.main_font_size)
+            self.font_cache = font
+        return self.font_cache
+
+    def glyph(self, number, is_definition):
+        """Returns the cached, pre-laid-out QStaticText of a line number label."""
+        key = (number, is_definition)
+        static_text = self.glyphs.get(key)
+        if static_text is None:
+            if len(self.glyphs) >= self.max_glyphs:
+                self.glyphs.clear()
+            static_text = QStaticText(f"{number} \u2192" if is_definition else str(number))
+            static_text.setTextFormat(Qt.PlainText)
+            static_text.prepare(QTransform(), self.gutter_font())
+            self.glyphs[key] = static_text
+        return static_text
+
+    def invalidate(self):
+        """Font veya ayarlar değiştiğinde glif önbelleğini temizler."""
+        self.font_cache = None
+        self.glyphs.clear()
+        self.update()
 
     def sizeHint(self):
         return QSize(self.code_editor.line_number_area_width(), 0)
@@ -512,50 +608,294 @@ class PyCharmDarkStyle(Style):
     }
 
 
+class StatefulPythonLexer(PythonLexer):
+    """
+    PythonLexer that starts from, and reports, an arbitrary lexer state stack.
+
+    Mirrors `RegexLexer.get_tokens_unprocessed` but also returns the stack left at the end of the
+    text, so multi-line strings and docstrings can be carried from one QTextBlock to the next.
+    """
+    # Satır başında açılıp aynı satırda kapanmayan üçlü tırnak bir docstring başlatır
+    docstring_start = re.compile(r'^\s*[rRuUbB]{,2}("""|\'\'\')')
+
+    def lex_line(self, text, stack=('root',), docstring=False):
+        """Returns ([(index, token_type, value), ...], end_stack, docstring) for a single line."""
+        tokens = []
+        pos = 0
+        tokendefs = self._tokens
+        statestack = list(stack)
+        statetokens = tokendefs[statestack[-1]]
+        if len(statestack) == 1 and self.docstring_start.match(text):
+            docstring = True
+        while True:
+            for rexmatch, action, new_state in statetokens:
+                m = rexmatch(text, pos)
+                if m:
+                    depth_before = len(statestack)
+                    if action is None:
+                        matched = ()
+                    elif type(action) is _TokenType:
+                        matched = ((pos, action, m.group()),)
+                    else:
+                        matched = tuple(action(self, m))
+                    pos = m.end()
+                    if new_state is not None:
+                        if isinstance(new_state, tuple):
+                            for state in new_state:
+                                if state == '#pop':
+                                    if len(statestack) > 1:
+                                        statestack.pop()
+                                elif state == '#push':
+                                    statestack.append(statestack[-1])
+                                else:
+                                    statestack.append(state)
+                        elif isinstance(new_state, int):
+                            if abs(new_state) >= len(statestack):
+                                del statestack[1:]
+                            else:
+                                del statestack[new_state:]
+                        elif new_state == '#push':
+                            statestack.append(statestack[-1])
+                        statetokens = tokendefs[statestack[-1]]
+
+                    if docstring and (depth_before > 1 or len(statestack) > 1):
+                        # Docstring root'ta açılır; root'un üstündeki her durum docstring'in içidir
+                        matched = tuple((index, String.Doc if token_type in String else token_type, value)
+                                        for index, token_type, value in matched)
+                        if len(statestack) == 1:
+                            docstring = False
+                    tokens.extend(matched)
+                    break
+            else:
+                # Hiçbir kural eşleşmediyse: satır sonunda root'a dön, aksi halde tek karakteri hata say
+                if pos >= len(text):
+                    break
+                if text[pos] == '\n':
+                    statestack = ['root']
+                    statetokens = tokendefs['root']
+                    docstring = False
+                    tokens.append((pos, Text.Whitespace, '\n'))
+                else:
+                    tokens.append((pos, Error, text[pos]))
+                pos += 1
+        return tokens, tuple(statestack), docstring and len(statestack) > 1
+
+
+class BlockData(QTextBlockUserData):
+    """Per-block values that are recomputed only when the block's text changes (see `highlightBlock`)."""
+
+    def __init__(self, text=""):
+        super().__init__()
+        self.update(text)
+
+    def update(self, text):
+        """Girinti derinliğini ve satırın def/class tanımı olup olmadığını günceller."""
+        stripped = text.lstrip()
+        self.indent = len(text) - len(stripped)
+        self.is_definition = stripped.startswith(('def ', 'class '))
+
+
+class StyleTable(dict):
+    """
+    Ready-made QTextCharFormats of one Pygments style, keyed by token type.
+
+    Token types the style does not list (e.g. `Name.Builtin.Pseudo`) are resolved once through their
+    parent chain and memoized. Tokens without any styling map to None so the highlighter can skip them.
+    """
+
+    def __init__(self, style):
+        super().__init__()
+        for token, token_style in get_style_by_name(style):
+            self[token] = self._make_format(token_style)
+
+    @staticmethod
+    def _make_format(token_style):
+        """Pygments token stilini QTextCharFormat'a çevirir (stilsiz token için None)."""
+        if not (token_style['color'] or token_style['bold'] or token_style['italic']):
+            return None
+        text_format = QTextCharFormat()
+        if token_style['color']:
+            text_format.setForeground(QColor(f"#{token_style['color']}"))
+        if token_style['bold']:
+            text_format.setFontWeight(QFont.Bold)
+        if token_style['italic']:
+            text_format.setFontItalic(True)
+        return text_format
+
+    def __missing__(self, token):
+        # Stilde tanımlı olmayan alt tip: ebeveyn zincirinden çöz ve sakla
+        text_format = self[token.parent] if token.parent is not None else None
+        self[token] = text_format
+        return text_format
+
+
 class PygmentsHighlighter(QSyntaxHighlighter):
+    """
+    Incremental Pygments highlighter.
+
+    Every block stores the id of the lexer state stack it ends in (`setCurrentBlockState`), and the
+    next block resumes lexing from that stack. Qt re-highlights the following block only while its
+    incoming state changes, so an edit re-lexes from the edited block until the state converges.
+
+    Documents above `LAZY_HIGHLIGHT_THRESHOLD` are highlighted lazily: only blocks around the viewport
+    are lexed immediately, the rest are marked `PENDING` and processed in order in short idle chunks.
+    """
+    # (lexer state stack, docstring) <-> block state id eşlemesi (tüm highlighter'lar arasında paylaşılır)
+    _state_ids = {(('root',), False): 0}
+    _state_stacks = [(('root',), False)]
+    # Stil adı -> StyleTable (tüm highlighter'lar arasında paylaşılır)
+    _style_tables = {}
+
+    # Tembel modda henüz renklendirilmemiş blokların durumu
+    PENDING = -2
+    lazy_margin = 100  # Görünür alanın üstünde/altında hemen renklendirilen blok sayısı
+    idle_budget = 0.008  # Bir boşta diliminde harcanacak en fazla süre (saniye)
+
     def __init__(self, document):
-        # Settings dosyasını yükle
-        style = "monokai"  # Varsayılan stil
-        # Settings.json'dan style'ı oku
-        try:
-            with open(settings_path, "r") as settings_file:
-                settings = json.load(settings_file)
-                style = settings.get("General", {}).get("syntax_style_dropdown", style)
-                print("Code Style: ",style)
-        except FileNotFoundError:
-            print(f"Settings file not found at {settings_path}. Using default style: {style}.")
-        except json.JSONDecodeError:
-            print(f"Settings file is not a valid JSON. Using default style: {style}.")
-        super().__init__(document)
-
-        # Formatter ve lexer ayarla
-        self.formatter = HtmlFormatter(style=style)
-        self.lexer = PythonLexer()
-        self.token_styles = self._generate_token_styles()
-
-    def _generate_token_styles(self):
-        """Pygments token stillerini PyQt formatına çevir."""
-        token_styles = {}
-        for token, style in self.formatter.style:
-            text_format = QTextCharFormat()
-
-            if style['color']:
-                text_format.setForeground(QColor(f"#{style['color']}"))
-            if style['bold']:
-                text_format.setFontWeight(QFont.Bold)
-            if style['italic']:
-                text_format.setFontItalic(True)
-
-            token_styles[token] = text_format
-        return token_styles
+        # Style, önbelleğe alınmış settings.json'dan okunur
+        style = SettingsStore.instance().get("General", "syntax_style_dropdown", "monokai")
+        super().__init__(None)
+        self.setParent(document)
+
+        # Lexer ayarla
+        self.style_name = None
+        self.lexer = StatefulPythonLexer()
+
+        # Büyük dosyalar için tembel renklendirme
+        self.lazy_threshold = get_settings().LAZY_HIGHLIGHT_THRESHOLD
+        self.visible_range = (0, self.lazy_margin)
+        self.done_until = -1  # Sırayla (doğru lexer durumuyla) renklendirilmiş son blok
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.setInterval(0)
+        self.idle_timer.timeout.connect(self.highlight_idle_chunk)
+
+        # Belge sonradan atanır: tüm metni değiştiren düzenlemeler (setPlainText), Qt bloklarını yeniden
+        # renklendirmeden önce on_contents_change'e ulaşmalı
+        self.character_count = document.characterCount()
+        document.contentsChange.connect(self.on_contents_change)
+        self.setDocument(document)
+        self.apply_style(style)
+
+    @classmethod
+    def style_table(cls, style):
+        """Returns the shared StyleTable of a style, building it on first use."""
+        table = cls._style_tables.get(style)
+        if table is None:
+            table = cls._style_tables[style] = StyleTable(style)
+        return table
+
+    def apply_style(self, style):
+        """Switches the Pygments style and re-highlights only when it actually changed."""
+        if style == self.style_name:
+            return
+        self.style_name = style
+        self.token_styles = self.style_table(style)
+        if self.is_lazy():
+            self.done_until = -1  # Görünmeyen bloklar boşta dilimlerde yeniden renklendirilir
+        self.rehighlight()
+
+    def is_lazy(self):
+        """True if the document is larger than the lazy highlighting threshold."""
+        document = self.document()
+        return 0 < self.lazy_threshold < (document.characterCount() if document is not None else 0)
+
+    def on_contents_change(self, position, removed, added):
+        """
+        Resets the lazy highlighting progress when the whole text is replaced (`setPlainText`, select-all
+        and paste), so the new text is again highlighted around the viewport first and in idle chunks after.
+        """
+        replaced = position == 0 and removed >= self.character_count - 1
+        self.character_count = self.document().characterCount()
+        if replaced:
+            self.done_until = -1
+            self.visible_range = (0, self.lazy_margin)
+            self.idle_timer.stop()
+
+    def set_visible_blocks(self, first, last):
+        """
+        Updates the visible block range and, in lazy mode, highlights pending blocks in it right away.
+
+        Visible blocks whose predecessors are still pending are lexed from the root state; the idle
+        pass re-highlights them with the correct state when it reaches them.
+        """
+        first = max(0, first - self.lazy_margin)
+        last += self.lazy_margin
+        self.visible_range = (first, last)
+        if last <= self.done_until:
+            return
+        block = self.document().findBlockByNumber(max(first, self.done_until + 1))
+        while block.isValid() and block.blockNumber() <= last:
+            if block.userState() == self.PENDING:
+                self.rehighlightBlock(block)
+            block = block.next()
+
+    def highlight_idle_chunk(self):
+        """Highlights pending blocks in order for `idle_budget` seconds, then yields to the event loop."""
+        document = self.document()
+        if document is None:
+            return
+        block = document.findBlockByNumber(self.done_until + 1)
+        deadline = time.perf_counter() + self.idle_budget
+        while block.isValid():
+            self.done_until = block.blockNumber()
+            self.rehighlightBlock(block)
+            block = block.next()
+            if time.perf_counter() >= deadline:
+                break
+        if block.isValid():
+            self.idle_timer.start()
+
+    @classmethod
+    def _state_id(cls, state):
+        """Returns a stable integer id for a (lexer state stack, docstring) pair."""
+        state_id = cls._state_ids.get(state)
+        if state_id is None:
+            state_id = len(cls._state_stacks)
+            cls._state_ids[state] = state_id
+            cls._state_stacks.append(state)
+        return state_id
 
     def highlightBlock(self, text):
-        """Metni token'lara böl ve stilleri uygula."""
-        tokens = self.lexer.get_tokens(text)
-        for token_type, token_value in tokens:
-            if token_type in self.token_styles:
-                start_index = text.find(token_value)
-                while start_index != -1:
-                    length = len(token_value)
-                    self.setFormat(start_index, length, self.token_styles[token_type])
-                    start_index = text.find(token_value, start_index + length)
\ No newline at end of file
+        profiler = TypingProfiler.instance()
+        if not profiler.enabled:
+            self.highlight_line(text)
+            return
+        start = time.perf_counter()
+        self.highlight_line(text)
+        profiler.add_span("highlighter", start, time.perf_counter() - start)
+
+    def highlight_line(self, text):
+        """Bloğu önceki bloğun lexer durumundan başlayarak token ofsetleriyle renklendirir."""
+        data = self.currentBlockUserData()
+        if data is None:
+            self.setCurrentBlockUserData(BlockData(text))
+        else:
+            data.update(text)
+
+        block_number = self.currentBlock().blockNumber()
+        if block_number > self.done_until and self.is_lazy() and \
+                not self.visible_range[0] <= block_number <= self.visible_range[1]:
+            # Büyük dosyada görünür alanın dışı: boşta dilimlerde sırayla renklendirilir
+            self.setCurrentBlockState(self.PENDING)
+            if not self.idle_timer.isActive():
+                self.idle_timer.start()
+            return
+
+        previous_state = self.previousBlockState()
+        if 0 <= previous_state < len(self._state_stacks):
+            stack, docstring = self._state_stacks[previous_state]
+        else:
+            stack, docstring = ('root',), False
+
+        tokens, end_stack, end_docstring = self.lexer.lex_line(text + "\n", stack, docstring)
+        length = len(text)
+        token_styles = self.token_styles
+        for index, token_type, value in tokens:
+            if index >= length:
+                break
+            text_format = token_styles[token_type]
+            if text_format is not None:
+                self.setFormat(index, min(len(value), length - index), text_format)
+
+        self.setCurrentBlockState(self._state_id((end_stack, end_docstring)))
@@ -11,16 +11,16 @@ import types  # Python tür bilgilerini almak için
 import sys  # Python sistem modülü, modüllere erişim için
 import json  # JSON dosyalarıyla çalışmak için
 import os  # İşletim sistemi işlemleri için
-import re  # Düzenli ifadelerle çalışmak için
-from collections import deque  # Çift uçlu kuyruk yapısı (deque) için
-from difflib import get_close_matches  # Yakın eşleşmeleri bulmak için
+from collections import deque  # Çift uçlu kuyruk ve sayaç yapıları için
+from difflib import SequenceMatcher  # Yakın eşleşmeleri bulmak için
+import heapq  # Sınırlı sayıda en iyi eşleşmeyi seçmek için
 
 # PySide2 GUI (grafik arayüz) bileşenlerini içe aktarıyoruz
 from PySide2.QtWidgets import QCompleter, QListView, QStyledItemDelegate, QStyleOptionViewItem, QLabel, QVBoxLayout, \
     QShortcut
 from PySide2.QtCore import QStringListModel, Qt, QSize, QPoint
 from PySide2.QtGui import QTextCursor, QFont, QColor, QPainter
-from editor.core import CodeEditorSettings  # Özelleştirilmiş ayarları almak için
+from editor.core import get_settings  # Önbelleğe alınmış ayarları almak için
 from PySide2.QtGui import QColor, QFont, QPainter
 from PySide2.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
 from PySide2.QtCore import Qt
@@ -117,19 +117,19 @@ class CustomDelegate(QStyledItemDelegate):
 
 
 class Completer(CustomDelegate):
-    def __init__(self, editor):
+    def __init__(self, editor=None):
         super().__init__()
-        self.editor = editor  # Tamamlama yapılacak metin editörü
+        self.editor = None  # Tamamlama yapılacak metin editörü (bkz. attach)
         self.completer_model = QStringListModel()  # Tamamlama verisi için model
         self.completion_popup = QCompleter(self.completer_model)  # Tamamlama popup'u
         self.completion_popup.popup().setStyleSheet(self.get_popup_styles())  # Popup stilini ayarla
-        self.completion_popup.setWidget(self.editor)
         self.completion_popup.setCompletionMode(QCompleter.PopupCompletion)
         self.completion_popup.setCaseSensitivity(Qt.CaseInsensitive)
         self.completion_popup.popup().setItemDelegate(CustomDelegate())  # Her öğe için özel delegate
         self.completion_popup.popup().setFont(self.get_custom_font())  # Yazı tipi
         self.completion_popup.activated[str].connect(self.insert_completion)
         self.recent_completions = deque(maxlen=10)  # Son 10 tamamlama için bir deque
+        self.max_results = 100  # Popup'ta gösterilecek en fazla öneri
 
         # Durum çubuğu tanımlama
         self.status_bar = QLabel("Description will appear here.")
@@ -149,6 +149,16 @@ class Completer(CustomDelegate):
         self.completion_popup.popup().setMouseTracking(True)
         self.completion_popup.popup().entered.connect(self.show_item_description)
 
+        if editor is not None:
+            self.attach(editor)
+
+    def attach(self, editor):
+        """Tamamlayıcıyı (ve popup'unu) verilen editöre bağlar; tüm sekmeler tek bir örneği paylaşır."""
+        if self.editor is editor:
+            return
+        self.completion_popup.popup().hide()
+        self.editor = editor
+        self.completion_popup.setWidget(editor)
 
 
     def show_item_description(self, index):
@@ -278,7 +288,8 @@ class Completer(CustomDelegate):
 
     def update_completions(self):
         """Editördeki metne göre tamamlama önerilerini al ve popup göster"""
-        if not CodeEditorSettings().ENABLE_COMPLETER:  # Completer özelliği kapalıysa pop-up gösterme
+        settings = get_settings()
+        if not settings.ENABLE_COMPLETER:  # Completer özelliği kapalıysa pop-up gösterme
             self.completion_popup.popup().hide()
             return
 
@@ -286,20 +297,25 @@ class Completer(CustomDelegate):
         cursor.select(QTextCursor.WordUnderCursor)
         current_word = cursor.selectedText()
 
-        if not current_word or self.editor.toPlainText().strip() == "":
+        if not current_word or not current_word.strip():
             self.completion_popup.popup().hide()
             return
 
-        completions = self.get_all_python_completions()
-        exact_matches = [comp for comp in completions if comp.startswith(current_word)]
+        index = CompletionIndex.instance()
+        document_words = self.editor.symbol_index
+        exact_matches = index.prefix_matches(current_word, self.max_results)
+        exact_matches += document_words.prefix_matches(current_word, self.max_results)
 
-        if CodeEditorSettings().ENABLE_FUZZY_COMPLETION:
-            fuzzy_matches = get_close_matches(current_word, completions, n=10, cutoff=0.5)
+        if settings.ENABLE_FUZZY_COMPLETION:
+            fuzzy_matches = index.fuzzy_matches(current_word, extra=document_words)
         else:
             fuzzy_matches = []
 
+        # Son kullanılan tamamlamalar en yeniden eskiye doğru en üstte gösterilir
+        recent_rank = {comp: rank for rank, comp in enumerate(self.recent_completions)}
+        no_rank = len(recent_rank)
         combined_completions = sorted(set(exact_matches + fuzzy_matches),
-                                      key=lambda comp: (comp not in self.recent_completions, comp))
+                                      key=lambda comp: (recent_rank.get(comp, no_rank), comp))[:self.max_results]
 
         if combined_completions:
             self.completer_model.setStringList(combined_completions)
@@ -319,71 +335,192 @@ class Completer(CustomDelegate):
             self.completion_popup.popup().hide()
 
     def extract_existing_variables(self):
-        """Editördeki mevcut metinden değişkenleri, fonksiyonları ve sınıf adlarını çıkarır"""
-        text = self.editor.toPlainText()
-
-        variable_pattern = r'\b([a-zA-Z_][a-zA-Z_0-9]*)\b'
-        function_pattern = r'\bdef\s+([a-zA-Z_][a-zA-Z_0-9]*)\b'
-        class_pattern = r'\bclass\s+([a-zA-Z_][a-zA-Z_0-9]*)\b'
-
-        variables = set(re.findall(variable_pattern, text))
-        functions = set(re.findall(function_pattern, text))
-        classes = set(re.findall(class_pattern, text))
-
-        all_identifiers = variables.union(functions).union(classes)
-        return list(all_identifiers)
+        """Editördeki değişken, fonksiyon ve sınıf adlarını artımlı sembol tablosundan döndürür"""
+        return self.editor.symbol_index.names()
 
     def get_all_python_completions(self):
         """Nuke ve Python'daki tüm kategorilerden ve editördeki mevcut tanımlamalardan tamamlama önerilerini al"""
-        completions = []
-
-        if nuke:
-            try:
-                for item in dir(nuke):
-                    if callable(getattr(nuke, item)) or isinstance(getattr(nuke, item), (nuke.Knob, nuke.Node)):
-                        completions.append(item)
-            except Exception as e:
-                print(f"Nuke tamamlama hatası: {e}")
-
-        try:
-            completions.extend(dir(builtins))
-        except Exception as e:
-            print(f"Python yerleşik fonksiyon hatası: {e}")
+        completions = list(CompletionIndex.instance().all_words())
+        completions.extend(self.extract_existing_variables())
+        return completions
 
-        try:
-            completions.extend(keyword.kwlist)
-        except Exception as e:
-            print(f"Python keyword error: {e}")
 
-        try:
-            completions.extend(dir(types))
-        except Exception as e:
-            print(f"Python type error: {e}")
+def collect_static_completions():
+    """Nuke, builtins, keyword ve types kaynaklarından değişmeyen tamamlama önerilerini toplar."""
+    completions = []
 
+    if nuke:
         try:
-            for item in dir(object):
-                if item.startswith('__') and item.endswith('__'):
+            for item in dir(nuke):
+                if callable(getattr(nuke, item)) or isinstance(getattr(nuke, item), (nuke.Knob, nuke.Node)):
                     completions.append(item)
         except Exception as e:
-            print(f"Special method error: {e}")
-
-        try:
-            async_decorators = ['@staticmethod', '@classmethod', '@property', 'async def', 'await']
-            completions.extend(async_decorators)
-        except Exception as e:
-            print(f"Decorator error: {e}")
-
-        try:
-            completions.extend(sys.modules.keys())
-        except Exception as e:
-            print(f"Python module error: {e}")
-
-        try:
-            exceptions = [exc for exc in dir(builtins) if 'Error' in exc or 'Exception' in exc]
-            completions.extend(exceptions)
-        except Exception as e:
-            print(f"Python exception error: {e}")
+            print(f"Nuke tamamlama hatası: {e}")
+
+    try:
+        completions.extend(dir(builtins))
+    except Exception as e:
+        print(f"Python yerleşik fonksiyon hatası: {e}")
+
+    try:
+        completions.extend(keyword.kwlist)
+    except Exception as e:
+        print(f"Python keyword error: {e}")
+
+    try:
+        completions.extend(dir(types))
+    except Exception as e:
+        print(f"Python type error: {e}")
+
+    try:
+        for item in dir(object):
+            if item.startswith('__') and item.endswith('__'):
+                completions.append(item)
+    except Exception as e:
+        print(f"Special method error: {e}")
+
+    try:
+        async_decorators = ['@staticmethod', '@classmethod', '@property', 'async def', 'await']
+        completions.extend(async_decorators)
+    except Exception as e:
+        print(f"Decorator error: {e}")
+
+    try:
+        exceptions = [exc for exc in dir(builtins) if 'Error' in exc or 'Exception' in exc]
+        completions.extend(exceptions)
+    except Exception as e:
+        print(f"Python exception error: {e}")
+
+    return completions
+
+
+class PrefixTrie:
+    """
+    Sorted, de-duplicated word list with a character trie over it.
+
+    Because the words are sorted, every trie node maps to a contiguous slice of `words`, so a prefix
+    lookup is a walk of len(prefix) nodes followed by a slice.
+    """
+
+    def __init__(self, words=()):
+        self.words = sorted(set(words))
+        self._root = [{}, 0, len(self.words)]  # [children, start, end]
+        for position, word in enumerate(self.words):
+            node = self._root
+            for char in word:
+                child = node[0].get(char)
+                if child is None:
+                    child = node[0][char] = [{}, position, position + 1]
+                else:
+                    child[2] = position + 1
+                node = child
+        # Bulanık arama için kelimeleri ilk harfe göre grupla
+        self.buckets = {}
+        for word in self.words:
+            self.buckets.setdefault(word[:1].lower(), []).append(word)
+
+    def __len__(self):
+        return len(self.words)
+
+    def _find(self, prefix):
+        node = self._root
+        for char in prefix:
+            node = node[0].get(char)
+            if node is None:
+                return None
+        return node
+
+    def lookup(self, prefix, limit=None):
+        """Returns words starting with `prefix` in sorted order, at most `limit` of them."""
+        node = self._find(prefix)
+        if node is None:
+            return []
+        _, start, end = node
+        if limit is not None:
+            end = min(end, start + limit)
+        return self.words[start:end]
+
+    def fuzzy_candidates(self, word):
+        """
+        Returns words that can reach a difflib ratio of 0.5 against `word`.
 
+        Only the bucket sharing the first letter is searched, and only words between a third and three
+        times the length of `word`; longer or shorter words cannot reach the 0.5 cutoff.
+        """
+        length = len(word)
+        return [candidate for candidate in self.buckets.get(word[:1].lower(), ())
+                if length / 3 <= len(candidate) <= length * 3]
+
+
+class CompletionIndex:
+    """
+    Process-wide completion index shared by every Completer.
+
+    Static candidates (nuke, builtins, keywords, types) are indexed once; module names are re-indexed
+    only when the size of `sys.modules` changes. Fuzzy results are cached per word until a rebuild.
+    """
+    _instance = None
+    fuzzy_cache_size = 512
+    max_fuzzy_candidates = 2000
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self.static = PrefixTrie(collect_static_completions())
+        self.modules = PrefixTrie()
+        self._module_count = -1
+        self._fuzzy_cache = {}
+
+    def refresh_modules(self):
+        """sys.modules değiştiyse modül isimlerini yeniden indeksler."""
+        if len(sys.modules) != self._module_count:
+            self._module_count = len(sys.modules)
+            self.modules = PrefixTrie(list(sys.modules.keys()))
+            self._fuzzy_cache.clear()
+
+    def all_words(self):
+        self.refresh_modules()
+        return self.static.words + self.modules.words
+
+    def prefix_matches(self, prefix, limit=None):
+        """Statik ve modül kaynaklarında `prefix` ile başlayan öneriler."""
+        self.refresh_modules()
+        matches = self.static.lookup(prefix, limit)
+        matches += self.modules.lookup(prefix, limit)
+        return matches
+
+    def fuzzy_matches(self, word, n=10, cutoff=0.5, extra=None):
+        """
+        Bounded difflib matching over the indexed words and optionally an `extra` source
+        (PrefixTrie or DocumentSymbolIndex).
 
-        completions.extend(self.extract_existing_variables())
-        return completions
+        Results for the indexed sources are cached per word; `extra` results are not cached since they
+        come from the editor document.
+        """
+        self.refresh_modules()
+        scored = self._fuzzy_cache.get(word)
+        if scored is None:
+            candidates = self.static.fuzzy_candidates(word) + self.modules.fuzzy_candidates(word)
+            scored = heapq.nlargest(n, self._score(word, candidates, cutoff))
+            if len(self._fuzzy_cache) >= self.fuzzy_cache_size:
+                self._fuzzy_cache.clear()
+            self._fuzzy_cache[word] = scored
+        if extra is not None:
+            scored = set(scored).union(self._score(word, extra.fuzzy_candidates(word), cutoff))
+        return [match for _, match in heapq.nlargest(n, scored)]
+
+    def _score(self, word, candidates, cutoff):
+        """difflib.get_close_matches ile aynı puanlama, aday sayısı sınırlandırılmış olarak."""
+        matcher = SequenceMatcher()
+        matcher.set_seq2(word)
+        scored = []
+        for candidate in candidates[:self.max_fuzzy_candidates]:
+            matcher.set_seq1(candidate)
+            if (matcher.real_quick_ratio() >= cutoff and matcher.quick_ratio() >= cutoff
+                    and matcher.ratio() >= cutoff):
+                scored.append((matcher.ratio(), candidate))
+        return scored
@@ -1,9 +1,7 @@
 import os
-from PySide2.QtCore import QSize
+from PySide2.QtCore import QSize, QObject, Signal, QFileSystemWatcher
 from PySide2.QtGui import QColor, Qt
 import json
-from init_ide import settings_path
-from editor.settings.settings_ui import SettingsWindow
 
 def load_nuke_function_descriptions(json_path):
     """Nuke işlev açıklamalarını JSON'dan yükler."""
@@ -30,8 +28,89 @@ class PathFromOS:
         self.jet_fonts_var = os.path.join(self.project_root, 'assets', 'jetBrains','ttf',"variable")
         self.jet_fonts_italic = os.path.join(self.project_root, 'assets', 'jetBrains','ttf')
 
-class CodeEditorSettings:
+class SettingsStore(QObject):
+    """
+    Process-wide cache of settings.json.
+
+    The file is parsed once and kept in memory. A QFileSystemWatcher invalidates the cache when the
+    file's mtime changes and `SettingsWindow.to_json` calls `reload()` after saving, so paint and
+    keystroke handlers never touch the disk. `settings_changed` is emitted after every reload.
+    """
+    settings_changed = Signal()
+    # Sınıf niteliği yeniden atanmaz, sözlük güncellenir: bazı PySide2/Python eşleşmelerinde (ör. 5.13 ve 3.11)
+    # Shiboken tiplerine yapılan atama öznitelik önbelleğini geçersiz kılmaz ve eski değer okunmaya devam eder
+    _instances = {}
+
+    @classmethod
+    def instance(cls):
+        """Returns the shared store, creating it on first use."""
+        instance = cls._instances.get(cls)
+        if instance is None:
+            instance = cls._instances[cls] = cls()
+        return instance
+
     def __init__(self):
+        super().__init__()
+        self.settings_json = os.path.join(PathFromOS().settings_db, "settings.json")
+        self._data = {}
+        self._mtime = None
+        self._snapshot = None
+        self._load()
+
+        self._watcher = QFileSystemWatcher(self)
+        if os.path.exists(self.settings_json):
+            self._watcher.addPath(self.settings_json)
+        self._watcher.fileChanged.connect(self.check_for_changes)
+
+    def _load(self):
+        """settings.json dosyasını okur, hata durumunda son geçerli veriyi korur."""
+        try:
+            self._mtime = os.path.getmtime(self.settings_json)
+            with open(self.settings_json, "r", encoding="utf-8") as file:
+                self._data = json.load(file)
+        except (OSError, ValueError) as e:
+            print(f"Settings could not be loaded: {e}")
+        self._snapshot = None
+
+    def check_for_changes(self, path=None):
+        """Reloads the cache only when the file's mtime differs from the cached one."""
+        # Editörler dosyayı silip yeniden yazabildiği için watcher yolu düşürebilir
+        if os.path.exists(self.settings_json) and self.settings_json not in self._watcher.files():
+            self._watcher.addPath(self.settings_json)
+        try:
+            mtime = os.path.getmtime(self.settings_json)
+        except OSError:
+            return
+        if mtime != self._mtime:
+            self.reload()
+
+    def reload(self):
+        """Re-reads settings.json and notifies open editors."""
+        self._load()
+        self.settings_changed.emit()
+
+    def data(self):
+        """Returns the parsed settings dictionary. Treat it as read-only."""
+        return self._data
+
+    def get(self, section, key, default=None):
+        """Returns a single value from the given settings section."""
+        return self._data.get(section, {}).get(key, default)
+
+    def current(self):
+        """Returns the shared read-only CodeEditorSettings snapshot for hot paths."""
+        if self._snapshot is None:
+            self._snapshot = CodeEditorSettings(self._data, read_only=True)
+        return self._snapshot
+
+
+def get_settings():
+    """Shortcut for the cached, read-only settings used in paint and keystroke handlers."""
+    return SettingsStore.instance().current()
+
+
+class CodeEditorSettings:
+    def __init__(self, settings=None, read_only=False):
         """Kod yazım ayarları burada döner"""
         self.settings_json = os.path.join(PathFromOS().settings_db, "settings.json")
         # TEMP CODES
@@ -43,9 +122,10 @@ class CodeEditorSettings:
         self.main_default_font = "Consolas"  # Varsayılan font
         self.ctrlWheel = True  # Varsayılan Ctrl+Wheel ayarı
 
-        with open(self.settings_json, "r") as file:
-            settings = json.load(file)
-            code_editor_settings = settings.get("Code Editor",{})
+        # Ayarlar diskten değil, SettingsStore önbelleğinden okunur
+        if settings is None:
+            settings = SettingsStore.instance().data()
+        code_editor_settings = settings.get("Code Editor",{})
 
         self.main_font_size = code_editor_settings.get("default_font_size", self.main_font_size)
         self.main_default_font = code_editor_settings.get("default_selected_font", self.main_default_font)
@@ -89,6 +169,16 @@ class CodeEditorSettings:
         self.ENABLE_INLINE_GHOSTING = code_editor_settings.get("disable_suggestion", self.ENABLE_INLINE_GHOSTING)
         self.CREATE_NODE_COMPLETER =  code_editor_settings.get("disable_node_completer", self.CREATE_NODE_COMPLETER)
 
+        # Bu boyutun (KB) üzerindeki dosyalarda yalnızca görünür alan hemen renklendirilir; 0: kapalı
+        self.LAZY_HIGHLIGHT_THRESHOLD = code_editor_settings.get("lazy_highlight_threshold", 256) * 1024
+        # Tuş başına gecikme ölçümü (p50/p95/p99, Chrome trace); bkz. editor/profiler.py
+        self.TYPING_PROFILER = code_editor_settings.get("typing_profiler", False)
+
+        # OUTPUT SETTINGS
+        output_settings = settings.get("Output", {})
+        self.OUTPUT_MAX_BLOCKS = output_settings.get("max_block_count", 10000)  # 0: sınırsız
+        self.OUTPUT_LOG_FILE = output_settings.get("log_file", "")  # Boş değilse tüm çıktı bu dosyaya da yazılır
+
         # TEMP UI SETTINGS DONT TOUCH
         self.OUTLINER_DOCK_POS = Qt.LeftDockWidgetArea
         self.HEADER_DOCK_POS = Qt.LeftDockWidgetArea
@@ -127,4 +217,9 @@ class CodeEditorSettings:
         elif interface_mode == "Saitama (immersive)":
             set_focus_mode()
 
+        self._read_only = read_only
 
+    def __setattr__(self, name, value):
+        if getattr(self, "_read_only", False):
+            raise AttributeError(f"Shared settings are read-only, use CodeEditorSettings() for a private copy: {name}")
+        super().__setattr__(name, value)
@@ -1,7 +1,10 @@
 # editor/dialogs/replaceDialogs.py
-from PySide2.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QCheckBox, QMessageBox, QFrame
-from PySide2.QtGui import QTextCursor, QColor, QPainter, QPainterPath, QBrush
+import re
+from PySide2.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QCheckBox, QMessageBox, \
+    QFrame, QPlainTextEdit
+from PySide2.QtGui import QColor, QPainter, QPainterPath, QBrush, QFont
 from PySide2.QtCore import Qt, QPropertyAnimation, QEasingCurve
+from editor.search import build_pattern, replace_spans, replace_in_editor, ProjectReplace
 
 class ReplaceDialogs(QDialog):
     def __init__(self, editor):
@@ -10,7 +13,7 @@ class ReplaceDialogs(QDialog):
         self.setWindowTitle("Replace Word")
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
         self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setFixedSize(500, 80)  # Dikey olarak daraltıldı
+        self.setFixedSize(500, 110)  # Dikey olarak daraltıldı
         self.is_dragging = False  # Taşıma durumu
 
         # Seçili kelimeyi kontrol et; yoksa pencereyi kapat
@@ -88,6 +91,23 @@ class ReplaceDialogs(QDialog):
         self.replace_button.clicked.connect(self.perform_replace)
         bottom_layout.addWidget(self.replace_button)
 
+        # Eşleştirme seçenekleri ve proje genelinde değiştirme
+        options_layout = QHBoxLayout()
+        layout.addLayout(options_layout)
+        self.regex_checkbox = QCheckBox("Regex", self)
+        self.case_checkbox = QCheckBox("Match case", self)
+        self.case_checkbox.setChecked(True)  # str.replace gibi büyük/küçük harfe duyarlı
+        self.word_checkbox = QCheckBox("Whole words", self)
+        for checkbox in (self.regex_checkbox, self.case_checkbox, self.word_checkbox):
+            checkbox.setStyleSheet("color: rgba(255, 255, 255, 0.6); font-size: 12px;")
+            options_layout.addWidget(checkbox)
+        self.project_button = QPushButton("In Project...", self)
+        self.project_button.setEnabled(False)
+        self.project_button.setToolTip("Preview and replace in all open tabs and project files")
+        self.project_button.setStyleSheet(self.replace_button.styleSheet())
+        self.project_button.clicked.connect(self.preview_project_replace)
+        options_layout.addWidget(self.project_button)
+
         # Sağ üst köşede kapatma butonu
         close_button = QPushButton("X", self)
         close_button.setFixedSize(20, 20)
@@ -119,7 +139,9 @@ class ReplaceDialogs(QDialog):
 
     def update_button_state(self):
         """Replace butonunu etkinleştir veya devre dışı bırak"""
-        self.replace_button.setEnabled(bool(self.replace_input.text().strip()))
+        enabled = bool(self.replace_input.text().strip())
+        self.replace_button.setEnabled(enabled)
+        self.project_button.setEnabled(enabled)
 
     def move_below_cursor(self):
         """Diyaloğu düzenleyicideki imleç pozisyonunun altında gösterir."""
@@ -129,30 +151,57 @@ class ReplaceDialogs(QDialog):
             editor_global_pos = current_editor.mapToGlobal(cursor_rect.bottomLeft())
             self.move(editor_global_pos.x(), editor_global_pos.y() + 10)
 
+    def current_pattern(self):
+        """Seçili metni seçeneklere göre derler; geçersiz regex'te uyarı verip None döner."""
+        term = self.selected_text.replace("\u2029", "\n")  # Qt paragraf ayracı -> satır sonu
+        try:
+            return build_pattern(term, regex=self.regex_checkbox.isChecked(),
+                                 case_sensitive=self.case_checkbox.isChecked(),
+                                 whole_word=self.word_checkbox.isChecked())
+        except re.error as e:
+            QMessageBox.warning(self, "Warning", f"Invalid regular expression: {e}")
+            return None
+
     def perform_replace(self):
-        """Kelimeyi tüm belgede veya seçili alanda değiştirir."""
+        """Kelimeyi tüm belgede veya seçili alanda yerinde, tek geri alma adımıyla değiştirir."""
         new_word = self.replace_input.text()
         if not new_word:
             QMessageBox.warning(self, "Warning", "Please enter the new word.")
             return
+        pattern = self.current_pattern()
+        if pattern is None:
+            return
 
-        document = self.editor.document()
-        cursor = QTextCursor(document)
-        cursor.beginEditBlock()
-
+        # Eşleşmeler bir kez hesaplanır, değişiklikler sondan başa minimal düzenlemeler olarak uygulanır
         if self.selection_only_checkbox.isChecked():
-            selected_text = self.editor.textCursor().selectedText()
-            new_text = selected_text.replace(self.selected_text, new_word)
-            self.editor.textCursor().insertText(new_text)
+            cursor = self.editor.textCursor()
+            offset = cursor.selectionStart()
+            text = cursor.selectedText().replace("\u2029", "\n")
         else:
+            offset = 0
             text = self.editor.toPlainText()
-            new_text = text.replace(self.selected_text, new_word)
-            cursor.select(QTextCursor.Document)
-            cursor.insertText(new_text)
+        try:
+            spans = replace_spans(pattern, text, new_word, self.regex_checkbox.isChecked())
+        except re.error as e:
+            QMessageBox.warning(self, "Warning", f"Invalid replacement: {e}")
+            return
 
-        cursor.endEditBlock()
+        replace_in_editor(self.editor, text, spans, offset)
+        main_window = self.editor.get_main_window()
+        if main_window:
+            main_window.status_bar.showMessage(f"{len(spans)} occurrences replaced", 5000)
         self.accept()  # İşlem tamamlandıktan sonra pencereyi kapat
 
+    def preview_project_replace(self):
+        """Açık sekmeler ve proje dosyaları için değiştirme önizlemesini açar."""
+        pattern = self.current_pattern()
+        main_window = self.editor.get_main_window()
+        if pattern is None or main_window is None:
+            return
+        preview = ReplacePreviewDialog(main_window, pattern, self.replace_input.text(), self.regex_checkbox.isChecked())
+        self.accept()
+        preview.exec_()
+
     def mousePressEvent(self, event):
         """Diyaloğun taşınabilmesi için mouse event'leri."""
         if event.button() == Qt.LeftButton:
@@ -175,3 +224,71 @@ class ReplaceDialogs(QDialog):
         path = QPainterPath()
         path.addRoundedRect(rect, 15, 15)
         painter.fillPath(path, QBrush(QColor(51, 51, 51, 230)))
+
+
+class ReplacePreviewDialog(QDialog):
+    """Shows the unified diff of a project-wide replace while it is computed and applies it on request."""
+
+    def __init__(self, main_window, pattern, replacement, regex=False):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.setWindowTitle("Replace in Project - Preview")
+        self.resize(900, 600)
+
+        layout = QVBoxLayout(self)
+        self.summary_label = QLabel("Computing changes...", self)
+        layout.addWidget(self.summary_label)
+
+        self.diff_view = QPlainTextEdit(self)
+        self.diff_view.setReadOnly(True)
+        self.diff_view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.diff_view.setFont(QFont("Consolas", 10))
+        layout.addWidget(self.diff_view)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        self.apply_button = QPushButton("Apply", self)
+        self.apply_button.setEnabled(False)
+        self.apply_button.clicked.connect(self.apply)
+        cancel_button = QPushButton("Cancel", self)
+        cancel_button.clicked.connect(self.reject)
+        buttons.addWidget(self.apply_button)
+        buttons.addWidget(cancel_button)
+        layout.addLayout(buttons)
+
+        # Açık sekmeler diskteki hallerinin yerine geçer ve yerinde düzenlenir
+        self.editors = {}
+        documents = {}
+        tab_widget = main_window.tab_widget
+        for index in range(tab_widget.count()):
+            editor = tab_widget.widget(index)
+            path = getattr(editor, "file_path", None)
+            if path:
+                self.editors[path] = editor
+                documents[path] = editor.toPlainText()
+
+        self.replace = ProjectReplace(self)
+        self.replace.file_ready.connect(self.add_diff)
+        self.replace.finished.connect(self.on_finished)
+        self.replace.start(pattern, replacement, documents, main_window.project_dir, regex)
+
+    def add_diff(self, path, diff):
+        self.diff_view.appendPlainText(diff)
+
+    def on_finished(self, file_count, change_count):
+        summary = f"{change_count} replacements in {file_count} files"
+        if self.replace.errors:
+            summary += f" ({len(self.replace.errors)} files skipped)"
+        self.summary_label.setText(summary)
+        self.apply_button.setEnabled(file_count > 0)
+
+    def apply(self):
+        errors = self.replace.apply(self.editors)
+        if errors:
+            QMessageBox.warning(self, "Replace in Project", "\n".join(errors))
+        self.accept()
+
+    def done(self, result):
+        """Dialog kapanırken bekleyen hesaplamaları geçersiz kılar."""
+        self.replace.cancel()
+        super().done(result)
@@ -1,21 +1,27 @@
 from PySide2.QtWidgets import QDialog, QHBoxLayout, QLineEdit, QLabel, QFrame, QPushButton, QTextEdit
-from PySide2.QtGui import QColor, QPixmap, QTextCursor, QTextCharFormat, QPainter, QPainterPath, QBrush, QIcon
+from PySide2.QtGui import QColor, QPixmap, QTextCharFormat, QPainter, QPainterPath, QBrush, QIcon
 from PySide2.QtCore import Qt, QEasingCurve, QPropertyAnimation, QTimer
 import os
+import re
 from editor.core import PathFromOS
+from editor.search import build_pattern, ProjectSearch
 
 
 class SearchDialog(QDialog):
     def __init__(self, main_window=None):
         super().__init__(main_window)
         self.main_window = main_window
-        self.matches = []
-        self.current_match_index = -1
+        self.search = None  # Geçerli editörün DocumentSearch'ü
+        self.project_search = ProjectSearch(self)
+        self.project_search.file_matches.connect(self.show_file_matches)
+        self.project_search.finished.connect(self.on_project_search_finished)
+        # Sekme değişince arama yeni editöre taşınır
+        main_window.tab_widget.currentChanged.connect(self.on_search_text_changed)
 
         # Çerçevesiz ve başlıksız yapmak için dialog ayarları
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
         self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setFixedSize(400, 60)
+        self.setFixedSize(560, 60)
 
         # Ana çerçeve, dialog etrafında daha hafif beyaz bir stroke olacak
         main_frame = QFrame(self)
@@ -72,6 +78,18 @@ class SearchDialog(QDialog):
         self.search_input.textChanged.connect(self.on_search_text_changed)
         layout.addWidget(self.search_input)
 
+        # Arama seçenekleri: regex, büyük/küçük harf, tam kelime ve tüm sekmeler + proje
+        self.regex_button = self.make_option_button(".*", "Regular expression")
+        self.case_button = self.make_option_button("Aa", "Match case")
+        self.word_button = self.make_option_button("W", "Whole words")
+        for button in (self.regex_button, self.case_button, self.word_button):
+            button.setCheckable(True)
+            button.toggled.connect(self.on_search_text_changed)
+            layout.addWidget(button)
+        self.all_button = self.make_option_button("All", "Search all open tabs and the project (results in OUTPUT)")
+        self.all_button.clicked.connect(self.search_all)
+        layout.addWidget(self.all_button)
+
         # Sonuç sayısını gösteren etiket
         self.result_count_label = QLabel("0 Matches")
         self.result_count_label.setStyleSheet("color: rgba(255, 255, 255, 0.6); font-size: 12px;")
@@ -113,48 +131,104 @@ class SearchDialog(QDialog):
             editor_global_pos = current_editor.mapToGlobal(cursor_rect.bottomLeft())
             self.move(editor_global_pos.x(), editor_global_pos.y())
 
-    def on_search_text_changed(self):
-        """Arama kutusuna yazı girildikçe eşleşme sayısını günceller."""
+    def make_option_button(self, text, tooltip):
+        button = QPushButton(text, self)
+        button.setFlat(True)
+        button.setFixedSize(28, 24)
+        button.setToolTip(tooltip)
+        button.setStyleSheet("""
+            QPushButton { color: rgba(255, 255, 255, 0.6); border: none; border-radius: 4px; }
+            QPushButton:hover, QPushButton:checked { color: #FFFFFF; background-color: rgba(255, 180, 100, 80); }
+        """)
+        return button
+
+    def current_pattern(self):
+        """
+        Compiles the search box text with the selected options.
+
+        Returns:
+            The compiled pattern, or None if the search box is empty or the regular expression is invalid.
+        """
         search_term = self.search_input.text().strip()
-        match_count = self.find_and_highlight(search_term) if search_term else 0
-        self.result_count_label.setText(f"{match_count} Matches")
+        if not search_term:
+            self.result_count_label.setText("0 Matches")
+            return None
+        try:
+            return build_pattern(search_term, regex=self.regex_button.isChecked(),
+                                 case_sensitive=self.case_button.isChecked(),
+                                 whole_word=self.word_button.isChecked())
+        except re.error:
+            self.result_count_label.setText("Invalid pattern")
+            return None
+
+    def on_search_text_changed(self):
+        """Arama kutusuna yazı girildikçe editörde akan (parça parça) aramayı yeniden başlatır."""
+        current_editor = self.main_window.tab_widget.currentWidget()
+        if current_editor is None or not hasattr(current_editor, "document_search"):
+            return
+        self.bind_search(current_editor)
+
+        pattern = self.current_pattern()
+        if pattern is None:
+            self.search.cancel()
+            self.search.matches = []
+            current_editor.selection_layers.clear("search")
+            return
+        self.search.start(pattern, self.get_transparent_highlight())
+
+    def bind_search(self, editor):
+        """Diyaloğu editörün DocumentSearch'üne bağlar; önceki editördeki arama durur ve vurguları silinir."""
+        search = editor.document_search
+        if search is self.search:
+            return
+        if self.search is not None:
+            self.search.progress.disconnect(self.on_search_progress)
+            self.search.finished.disconnect(self.on_search_finished)
+            self.search.cancel()
+            self.search.matches = []
+            self.search.editor.selection_layers.clear("search")
+        self.search = search
+        search.progress.connect(self.on_search_progress)
+        search.finished.connect(self.on_search_finished)
+
+    def on_search_progress(self, count):
+        self.result_count_label.setText(f"{count} Matches…")
+
+    def on_search_finished(self, count):
+        self.result_count_label.setText(f"{count} Matches")
 
     def on_search_clicked(self):
         """Arama işlemini başlatır."""
-        search_term = self.search_input.text().strip()
-        match_count = self.find_and_highlight(search_term) if search_term else 0
-        self.result_count_label.setText(f"{match_count} Matches")
+        self.on_search_text_changed()
         self.accept()
 
     def find_and_highlight(self, search_term):
-        """Kod düzenleyicide arama terimiyle eşleşen kelimeleri vurgular ve eşleşme sayısını döner."""
-        current_editor = self.main_window.tab_widget.currentWidget()
-        if current_editor is None:
-            return 0
-
-        cursor = current_editor.textCursor()
-        document = current_editor.document()
-        current_editor.setExtraSelections([])
-
-        self.matches.clear()
-        extra_selections = []
-        cursor.beginEditBlock()
-        cursor.movePosition(QTextCursor.Start)
-
-        match_count = 0
-        while not cursor.isNull() and not cursor.atEnd():
-            cursor = document.find(search_term, cursor)
-            if not cursor.isNull():
-                selection = QTextEdit.ExtraSelection()
-                selection.cursor = cursor
-                selection.format = self.get_transparent_highlight()
-                extra_selections.append(selection)
-                self.matches.append(cursor.blockNumber() + 1)  # Satır numarasını kaydet
-                match_count += 1
-
-        cursor.endEditBlock()
-        current_editor.setExtraSelections(extra_selections)
-        return match_count
+        """Kod düzenleyicide arama terimiyle eşleşen kelimeleri vurgular; sonuç sayısı akışla güncellenir."""
+        self.search_input.setText(search_term)
+
+    def search_all(self):
+        """Tüm açık sekmelerde ve proje klasöründe worker thread'ler üzerinde arar; sonuçlar OUTPUT'a yazılır."""
+        self.all_button.setChecked(False)
+        pattern = self.current_pattern()
+        if pattern is None:
+            return
+        tab_widget = self.main_window.tab_widget
+        documents = {}
+        for index in range(tab_widget.count()):
+            editor = tab_widget.widget(index)
+            path = getattr(editor, "file_path", None) or tab_widget.tabText(index).replace("*", "")
+            documents[path] = editor.toPlainText()
+        self.main_window.output_widget.clear()
+        self.main_window.output_widget.append_info_output(f"Searching '{pattern.pattern}'...")
+        self.project_search.start(pattern, documents, self.main_window.project_dir)
+
+    def show_file_matches(self, path, results):
+        output = self.main_window.output_widget
+        for line, column, length, line_text in results:
+            output.append_output(f"{path}:{line + 1}:{column + 1}: {line_text.strip()}")
+
+    def on_project_search_finished(self, file_count, match_count):
+        self.main_window.output_widget.append_info_output(f"{match_count} matches in {file_count} files")
 
     def get_transparent_highlight(self):
         """Saydam, pastel turuncu vurgulama formatı."""
@@ -163,36 +237,39 @@ class SearchDialog(QDialog):
         return highlight_format
 
     def navigate_matches(self):
-        """Bulunan sonuçlar arasında yukarı ve aşağı geçiş yapar ve gidilen satırı parlak şekilde gösterir."""
-        sender = self.sender()
-        if sender == self.up_button:
-            self.current_match_index = (self.current_match_index - 1) % len(self.matches)
-        elif sender == self.down_button:
-            self.current_match_index = (self.current_match_index + 1) % len(self.matches)
-
-        # İlgili satıra git ve parlak göster
-        if self.current_match_index != -1 and self.matches:
-            editor = self.main_window.tab_widget.currentWidget()
-            cursor = editor.textCursor()
-            cursor.movePosition(QTextCursor.Start)
-            cursor.movePosition(QTextCursor.Down, QTextCursor.MoveAnchor, self.matches[self.current_match_index] - 1)
-            editor.setTextCursor(cursor)
-            self.flash_current_line(editor)
-
-    def flash_current_line(self, editor):
-        """Gidilen satırı parlak bir renkle geçici olarak gösterir."""
+        """Bulunan sonuçlar arasında yukarı ve aşağı geçiş yapar ve gidilen eşleşmeyi parlak şekilde gösterir."""
+        if self.search is None or not self.search.matches:
+            return
+        editor = self.search.editor
+        cursor = editor.textCursor()
+        if self.sender() == self.up_button:
+            index = self.search.previous_index(cursor.selectionStart())
+        else:
+            index = self.search.next_index(cursor.selectionEnd())
+
+        # İlgili eşleşmeyi seç ve parlak göster
+        self.search.select(index)
+        self.search.highlight(editor.textCursor().position())
+        self.flash_current_match(editor)
+
+    def flash_current_match(self, editor):
+        """Gidilen eşleşmeyi parlak bir renkle geçici olarak gösterir."""
+        selections = list(editor.selection_layers.get("search"))
         extra_selection = QTextEdit.ExtraSelection()
         extra_selection.format.setBackground(QColor(255, 230, 100, 150))  # Parlak renk
         extra_selection.cursor = editor.textCursor()
-        editor.setExtraSelections([extra_selection])
+        editor.selection_layers.set("search", selections + [extra_selection])
 
         # Parlaklığı azaltan animasyon
-        QTimer.singleShot(300, lambda: self.dim_highlight(extra_selection, editor))
+        QTimer.singleShot(300, lambda: editor.selection_layers.set("search", selections))
 
-    def dim_highlight(self, selection, editor):
-        """Seçimin parlaklığını düşürür."""
-        selection.format.setBackground(QColor(255, 180, 100, 80))
-        editor.setExtraSelections([selection])
+    def done(self, result):
+        """Dialog kapanırken arka plandaki aramaları durdurur; vurgular bir sonraki imleç hareketinde silinir."""
+        self.main_window.tab_widget.currentChanged.disconnect(self.on_search_text_changed)
+        if self.search is not None:
+            self.search.release()
+        self.project_search.cancel()
+        super().done(result)
 
     def paintEvent(self, event):
         """Dialog arka plan ve kenar için özel çerçeve tasarımı."""
@@ -0,0 +1,102 @@
+import sys
+import time
+import traceback
+from PySide2.QtCore import QObject, QTimer
+from editor.changes import PendingChange
+from editor.profiler import TypingProfiler
+
+IMMEDIATE = 0  # Olay döngüsünün bir sonraki turunda
+IDLE = 1  # Yazma `idle_delay` ms durduktan sonra
+
+
+class ChangeDispatcher(QObject):
+    """
+    Per-editor hub that turns `QTextDocument.contentsChange` bursts into one coalesced `DocumentChange`.
+
+    Handlers are registered under a unique name, so registering the same name again replaces the handler
+    instead of connecting it twice. The `IMMEDIATE` lane is delivered once per event-loop turn, in
+    registration order; the `IDLE` lane once typing has paused for `idle_delay` ms. A handler that raises is
+    logged to stderr and the rest of its lane still runs. Every handler call is timed into `stats`
+    (name -> [calls, total seconds, max seconds]) and, when enabled, reported to the `TypingProfiler`, whose
+    open keystroke ends with the IMMEDIATE delivery.
+    """
+    idle_delay = 150  # ms
+
+    def __init__(self, editor):
+        super().__init__(editor)
+        self.editor = editor
+        self.handlers = {IMMEDIATE: {}, IDLE: {}}
+        self.pending = {IMMEDIATE: None, IDLE: None}
+        self.stats = {}
+
+        self.timers = {}
+        for lane, interval in ((IMMEDIATE, 0), (IDLE, self.idle_delay)):
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(interval)
+            timer.timeout.connect(lambda lane=lane: self.deliver(lane))
+            self.timers[lane] = timer
+        editor.document().contentsChange.connect(self.on_contents_change)
+
+    def register(self, name, handler, lane=IMMEDIATE):
+        """Registers `handler(change)` under `name`, replacing any handler with the same name."""
+        self.unregister(name)
+        self.handlers[lane][name] = handler
+
+    def unregister(self, name):
+        for handlers in self.handlers.values():
+            handlers.pop(name, None)
+
+    def on_contents_change(self, position, removed, added):
+        bulk = getattr(self.editor, "bulk_editing", False)
+        for lane in (IMMEDIATE, IDLE):
+            pending = self.pending[lane]
+            if pending is None:
+                self.pending[lane] = PendingChange(position, removed, added, bulk)
+            else:
+                pending.merge(position, removed, added, bulk)
+            self.timers[lane].start()
+
+    def flush(self, lane=IMMEDIATE):
+        """Delivers a pending change of `lane` right away (e.g. before connecting handlers that should skip it)."""
+        if self.pending[lane] is not None:
+            self.timers[lane].stop()
+            self.deliver(lane)
+
+    def deliver(self, lane):
+        pending = self.pending[lane]
+        if pending is None:
+            return
+        self.pending[lane] = None
+        change = pending.change()
+        profiler = TypingProfiler.instance()
+        try:
+            for name, handler in list(self.handlers[lane].items()):
+                try:
+                    self.call(name, handler, change, profiler)
+                except Exception:
+                    # Bir işleyicinin hatası aynı şeritteki diğer işleyicileri durdurmaz
+                    print(f"Change handler '{name}' failed:\n{traceback.format_exc()}", file=sys.stderr)
+        finally:
+            if lane == IMMEDIATE:
+                profiler.end_key()
+
+    def call(self, name, handler, change, profiler):
+        start = time.perf_counter()
+        try:
+            handler(change)
+        finally:
+            elapsed = time.perf_counter() - start
+            stat = self.stats.get(name)
+            if stat is None:
+                self.stats[name] = [1, elapsed, elapsed]
+            else:
+                stat[0] += 1
+                stat[1] += elapsed
+                stat[2] = max(stat[2], elapsed)
+            profiler.add_span(name, start, elapsed)
+
+    def report(self):
+        """Returns (name, calls, total ms, max ms) rows, slowest total first."""
+        rows = [(name, calls, total * 1000, peak * 1000) for name, (calls, total, peak) in self.stats.items()]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
@@ -1,5 +1,3 @@
-import ast
-import importlib
 import json
 import os
 import re
@@ -13,39 +11,24 @@ from PySide2.QtGui import QPixmap, QPainter, QPainterPath, QBrush
 from PySide2.QtGui import QTextCursor, QGuiApplication
 from PySide2.QtWidgets import *
 from PySide2.QtWidgets import QDialog, QVBoxLayout, QLineEdit, QLabel, QGraphicsDropShadowEffect, QFrame
-import editor.code_editor
-import editor.core
-import editor.output
-import editor.new_nuke_project
-import editor.dialogs.searchDialogs
-import settings.github_utils
-import main_toolbar
-from editor.nlink import update_nuke_functions, load_nuke_functions
-from editor.core import PathFromOS, CodeEditorSettings
+from editor.nlink import update_nuke_functions, load_nuke_functions, load_reference_classes
+from editor.core import PathFromOS, CodeEditorSettings, SettingsStore
 from editor.code_editor import CodeEditor
+from editor.structure import StructureService
+from editor.outliner import OutlinerModel, OutlinerFilterProxy
+from editor.workplace import DirectoryScanner, DIRECTORY_ROLE
+from editor.profiler import TypingProfiler
 from PySide2.QtWidgets import QDockWidget, QTextEdit, QMainWindow, QPushButton, QHBoxLayout, QWidget
-from PySide2.QtCore import Qt, QRect, QSize
+from PySide2.QtCore import Qt, QRect, QSize, QTimer
 from PySide2.QtGui import QColor, QTextCharFormat, QFont
 from editor.output import OutputWidget
-import traceback
 import platform
 import socket
 import nuke
-from editor.output import execute_python_code, execute_nuke_code  # output.py dosyasından fonksiyonları çekiyoruz
+from editor.output import ExecutionEngine  # output.py dosyasından çalıştırma motorunu çekiyoruz
 from editor.console import ConsoleWidget
-from editor.new_nuke_project import NewNukeProjectDialog
-from editor.dialogs.searchDialogs import SearchDialog
-from editor.dialogs.replaceDialogs import ReplaceDialogs  # Döngüsel içe aktarma sorununu çözmek için fonksiyon içinde import
-from editor.dialogs.goToLineDialogs import GoToLineDialog
-# from init_ide import settings_path
-from settings.github_utils import commit_changes, push_to_github, pull_from_github, get_status
-importlib.reload(editor.core)
-importlib.reload(editor.code_editor)
-importlib.reload(editor.output)
-importlib.reload(editor.new_nuke_project)
-importlib.reload(editor.dialogs.searchDialogs)
-importlib.reload(settings.github_utils)
-importlib.reload(main_toolbar)
+from editor.search import build_pattern
+from editor.dispatcher import IDLE
 from editor.code_editor import PygmentsHighlighter
 from main_toolbar import MainToolbar
 class EditorApp(QMainWindow):
@@ -97,6 +80,18 @@ class EditorApp(QMainWindow):
         self.status_bar.addPermanentWidget(self.replace_status_label)  # Add to the right corner
         self.replace_status_label.setText("Status")  # Initial message
 
+        # Yazma gecikmesi (profiler açıkken); tıklanınca Chrome trace dışa aktarılır
+        self.latency_label = QLabel()
+        self.latency_label.setCursor(Qt.PointingHandCursor)
+        self.latency_label.mousePressEvent = lambda event: self.export_typing_trace()
+        self.status_bar.addPermanentWidget(self.latency_label)
+        self.latency_timer = QTimer(self)
+        self.latency_timer.setInterval(500)
+        self.latency_timer.timeout.connect(self.update_latency_label)
+        TypingProfiler.instance()  # Profiler ayarı, göstergeden önce yenilenmesi için önce bağlanır
+        SettingsStore.instance().settings_changed.connect(self.apply_profiler_settings)
+        self.apply_profiler_settings()
+
         # Project settings paths and other configurations
         self.item_colors = {} # Dictionary to manage item-specific colors
         self.color_settings_path = os.path.join(os.getcwd(), "assets", "item_colors.json")
@@ -174,6 +169,39 @@ class EditorApp(QMainWindow):
         self.replace_shortcut = QShortcut(QKeySequence("Ctrl+Shift+R"), self)
         self.replace_shortcut.activated.connect(self.open_replace_dialog)
 
+    def apply_profiler_settings(self):
+        """Gecikme göstergesini profiler ayarına göre açar/kapatır."""
+        enabled = TypingProfiler.instance().enabled
+        self.latency_label.setVisible(enabled)
+        if enabled:
+            self.latency_timer.start()
+        else:
+            self.latency_timer.stop()
+
+    def update_latency_label(self):
+        summary = TypingProfiler.instance().summary()
+        keystroke = summary.pop("keystroke", None)
+        if keystroke is None:
+            self.latency_label.setText("Typing: - ")
+            return
+        self.latency_label.setText("Typing p50/p95/p99: {:.1f}/{:.1f}/{:.1f} ms ".format(*keystroke[:3]))
+        rows = ["{}: {:.2f}/{:.2f}/{:.2f} ms ({})".format(name, *values)
+                for name, values in sorted(summary.items(), key=lambda item: item[1][1], reverse=True)]
+        self.latency_label.setToolTip("\n".join(["{} keystrokes; p50/p95/p99 per handler:".format(keystroke[3])]
+                                               + rows + ["", "Click to export a Chrome trace."]))
+
+    def export_typing_trace(self):
+        """Profiler kayıtlarını chrome://tracing / Perfetto ile açılabilen JSON olarak kaydeder."""
+        path, _ = QFileDialog.getSaveFileName(self, "Export Typing Trace", "typing_trace.json", "JSON (*.json)")
+        if not path:
+            return
+        try:
+            TypingProfiler.instance().export_chrome_trace(path)
+        except OSError as error:
+            QMessageBox.warning(self, "Export Typing Trace", str(error))
+            return
+        self.status_bar.showMessage(f"Typing trace exported: {path}", 5000)
+
     def keyPressEvent(self, event):
         """
         Captures key press events and handles specific shortcuts.
@@ -210,6 +238,11 @@ class EditorApp(QMainWindow):
         self.output_widget.setFont(title_font)
         self.output_widget.setReadOnly(True)
         self.output_dock.setWidget(self.output_widget)
+
+        # Kod çalıştırma motoru; çıktıyı satır grupları halinde OUTPUT paneline akıtır
+        self.execution_engine = ExecutionEngine(self)
+        self.execution_engine.output_ready.connect(self.append_execution_output)
+        self.execution_engine.finished.connect(self.on_execution_finished)
         self.output_dock.setAllowedAreas(Qt.AllDockWidgetAreas)
         self.output_dock.setFloating(False)
         output_icon = QIcon(os.path.join(PathFromOS().icons_path, "play_orange.svg"))
@@ -363,6 +396,10 @@ class EditorApp(QMainWindow):
         - Handles both Python and Nuke-specific code execution.
         - Outputs success or error messages back to the output panel.
         """
+        if self.execution_engine.is_running():
+            self.output_widget.append_info_output("Code is already running. Press Stop to cancel it.")
+            return
+
         # Clear the Output Widget
         self.output_widget.clear()
 
@@ -381,11 +418,9 @@ class EditorApp(QMainWindow):
 
         # Display system and environment info in the output
         info_message = (
-            f'<span style="color: grey;">'
             f'Python: {python_version} | Nuke: {nuke_version} | Active File: {active_tab_name} | Computer: {computer_name} | {formatted_time}'
-            f'</span>'
         )
-        self.output_widget.append(info_message)
+        self.output_widget.append_info_output(info_message)
 
         # Execute the code from the active editor
         current_editor = self.tab_widget.currentWidget()
@@ -393,24 +428,23 @@ class EditorApp(QMainWindow):
         if isinstance(current_editor, QPlainTextEdit):
             cursor = current_editor.textCursor()
             code = cursor.selectedText().strip() or current_editor.toPlainText()
-            try:
-                if "nuke." in code:
-                    # Execute Nuke-specific code
-                    execute_nuke_code(code, self.output_widget)
-                else:
-                    # Execute standard Python code
-                    execute_python_code(code, self.output_widget)
+            # Kod arka planda (Nuke API kullanıyorsa ana thread'de) çalışır; çıktı geldikçe yazılır
+            self.execution_engine.run(code)
 
-                # Add a success message
-                success_message = '<span style="color: grey;">...End of the line</span>'
-                self.output_widget.append(success_message)
+    def append_execution_output(self, text, kind):
+        """ExecutionEngine'den gelen satır gruplarını OUTPUT paneline yazar."""
+        if kind == "error":
+            self.output_widget.append_error_output(text)
+        else:
+            self.output_widget.append_output(text)
 
-            except Exception as e:
-                # Handle and display errors
-                error_message = traceback.format_exc()
-                user_friendly_message = f"<b style='color: red;'>Problem encountered while running: {str(e)}</b>"
-                self.output_widget.append_error_output(user_friendly_message)
-                self.output_widget.append_error_output(error_message)
+    def on_execution_finished(self, stats):
+        """Çalıştırma bitince durum ve süre bilgisini OUTPUT paneline yazar."""
+        timing = f"wall {stats['wall']:.3f}s | CPU {stats['cpu']:.3f}s"
+        if stats["status"] == "cancelled":
+            self.output_widget.append_info_output(f"...Execution stopped ({timing})")
+        else:
+            self.output_widget.append_info_output(f"...End of the line ({timing})")
 
     def update_toolbar_spacer(self, orientation: Qt.Orientation, spacer: QWidget):
         """
@@ -439,6 +473,7 @@ class EditorApp(QMainWindow):
             - Instantiates the `SearchDialog` with the main window as its parent.
             - Displays the dialog in a modal state to block interaction with other windows until closed.
         """
+        from editor.dialogs.searchDialogs import SearchDialog
         dialog = SearchDialog(self)  # Pass the main window reference
         dialog.exec_()  # Open the dialog modally
 
@@ -450,8 +485,8 @@ class EditorApp(QMainWindow):
             search_term (str): The term to search and highlight in the editor.
 
         Behavior:
-            - Searches for all occurrences of the `search_term` in the current editor.
-            - Applies a yellow background to highlight matching terms.
+            - Searches the current editor with its streaming `DocumentSearch` (case-insensitive, literal).
+            - Applies a yellow background to the matches around the cursor once the scan finishes.
             - If no editor is open, displays an error message in the output widget.
         """
         current_editor = self.tab_widget.currentWidget()
@@ -459,39 +494,9 @@ class EditorApp(QMainWindow):
             self.output_widget.append_error_output("Please open an active tab for coding...")
             return
 
-        cursor = current_editor.textCursor()  # Get the editor's cursor
-        document = current_editor.document()  # Get the text document
-
-        # Clear existing highlights
-        current_editor.setExtraSelections([])
-
-        # Store results for highlighting
-        extra_selections = []
-
-        # Begin bulk changes to the cursor
-        cursor.beginEditBlock()
-
-        # Move cursor to the start of the document
-        cursor.movePosition(QTextCursor.Start)
-
         highlight_format = QTextCharFormat()
         highlight_format.setBackground(QColor("yellow"))  # Set highlight color to yellow
-
-        # Search for all matches of the term
-        while not cursor.isNull() and not cursor.atEnd():
-            cursor = document.find(search_term, cursor)
-            if not cursor.isNull():
-                # Create a selection for the found term
-                selection = QTextEdit.ExtraSelection()
-                selection.cursor = cursor
-                selection.format = highlight_format
-                extra_selections.append(selection)
-
-        # End bulk changes
-        cursor.endEditBlock()
-
-        # Apply highlights to the editor
-        current_editor.setExtraSelections(extra_selections)
+        current_editor.document_search.start(build_pattern(search_term), highlight_format)
 
     def populate_outliner_with_functions(self):
         """
@@ -540,85 +545,30 @@ class EditorApp(QMainWindow):
             4. Expand only the "Nuke Functions" category for better organization.
         """
         if nuke_functions:
-            # Search for "Nuke Functions" header in OUTLINER
-            parent_item = None
-            for i in range(self.outliner_list.topLevelItemCount()):
-                item = self.outliner_list.topLevelItem(i)
-                if item.text(0) == "Nuke Functions":
-                    parent_item = item
-                    break
-
-            if not parent_item:
-                # Create "Nuke Functions" header if not present
-                parent_item = QTreeWidgetItem(self.outliner_list)
-                parent_item.setText(0, "Nuke Functions")
-                parent_item.setIcon(0, QIcon(os.path.join(PathFromOS().icons_path, 'folder_tree.svg')))  # Folder Icon
-
-            # Add each function under "Nuke Functions"
-            for func in nuke_functions:
-                func_item = QTreeWidgetItem(parent_item)
-                func_item.setText(0, func["name"])  # Extract function name
-                func_item.setIcon(0, QIcon(
-                    os.path.join(PathFromOS().icons_path, 'M_red.svg')))  # Set the function icon
+            # "Nuke Functions" başlığı yoksa oluşturulur, varsa fonksiyonlar altına eklenir
+            row = self.outliner_model.add_group("Nuke Functions", "Folder",
+                                                (func["name"] for func in nuke_functions), "Function")
 
             # Expand only the "Nuke Functions" category
-            self.outliner_list.expandItem(parent_item)
+            source_index = self.outliner_model.index(row, 0)
+            self.outliner_list.expand(self.outliner_proxy.mapFromSource(source_index))
 
     def add_classes_and_functions_to_tree(self, classes):
         """
-        Adds classes and their methods directly to the OUTLINER.
+        Adds classes and their methods to the OUTLINER model.
         Parameters:
             classes (list of tuples): A list where each tuple contains:
                 - class_name (str): The name of the class.
                 - methods (list of str): A list of method names belonging to the class.
         Behavior:
-            - Each class is added as a top-level item in the OUTLINER.
-            - Each method of a class is added as a child of the corresponding class item.
-            - Icons are assigned to both classes and methods for better visual representation.
-            - All items in the OUTLINER are expanded for visibility.
-        Steps:
-            1. Loop through the provided list of classes.
-            2. Add each class as a top-level item with an associated class icon.
-            3. For each class, add its methods as child items with an associated method icon.
-            4. Expand all items in the OUTLINER for improved visibility.
+            - Each class becomes a top-level row and its methods become child rows of `OutlinerModel`.
+            - Rows are not materialized as widgets; the view only queries the rows it paints.
         """
-        for class_name, methods in classes:
-            # Add class to OUTLINER
-            class_item = QTreeWidgetItem(self.outliner_list)
-            class_item.setText(0, class_name)
-            class_item.setIcon(0, QIcon(os.path.join(PathFromOS().icons_path, 'C_logo.svg')))  # Assign class icon
-
-            # Add methods for the class
-            for method in methods:
-                method_item = QTreeWidgetItem(class_item)
-                method_item.setText(0, method)
-                method_item.setIcon(0, QIcon(os.path.join(PathFromOS().icons_path, 'M_logo.svg')))  # Assign method icon
-
-        # Expand all items in the OUTLINER for better visibility
-        self.outliner_list.expandAll()
+        self.outliner_model.add_classes(classes)
 
-    # DEVAM EDECEK
     def list_classes_from_file(self, file_path):
-        """Verilen dosyadaki sınıfları ve metotları bulur, özel metotları filtreler."""
-        if not os.path.exists(file_path):
-            print(f"Error: {file_path} dosyası bulunamadı!")
-            return []
-
-        # Dosya içeriğini okuyor ve AST'ye dönüştürüyoruz
-        with open(file_path, 'r') as file:
-            file_content = file.read()
-        tree = ast.parse(file_content)
-        classes = []
-
-        # AST üzerinde gezinerek sınıf ve metodları buluyoruz
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                class_name = node.name
-                # Sınıf içinde, __init__ gibi özel metodları filtreliyoruz
-                methods = [n.name for n in node.body if isinstance(n, ast.FunctionDef) and not n.name.startswith('__')]
-                classes.append((class_name, methods))
-
-        return classes
+        """Verilen dosyadaki sınıfları ve metotları bulur; sonuç diskteki önbellekten okunur."""
+        return load_reference_classes(file_path)
 
     def create_menu(self):
         """Genişletilmiş ve yeniden düzenlenmiş menü çubuğunu oluşturur."""
@@ -765,10 +715,10 @@ class EditorApp(QMainWindow):
         github_menu.addAction(git_status_action)
 
         # Menü eylemleri için fonksiyon bağlama
-        git_commit_action.triggered.connect(lambda: commit_changes(self))
-        git_push_action.triggered.connect(lambda: push_to_github(self))
-        git_pull_action.triggered.connect(lambda: pull_from_github(self))
-        git_status_action.triggered.connect(lambda: get_status(self))
+        git_commit_action.triggered.connect(lambda: self.run_git_command("commit_changes"))
+        git_push_action.triggered.connect(lambda: self.run_git_command("push_to_github"))
+        git_pull_action.triggered.connect(lambda: self.run_git_command("pull_from_github"))
+        git_status_action.triggered.connect(lambda: self.run_git_command("get_status"))
 
         tools_menu.addAction(live_connection_action)
 
@@ -840,12 +790,19 @@ class EditorApp(QMainWindow):
         """Go To Line diyalogunu gösterir."""
         current_editor = self.tab_widget.currentWidget()
         if current_editor:
+            from editor.dialogs.goToLineDialogs import GoToLineDialog
             dialog = GoToLineDialog(current_editor)
             dialog.exec_()
 
     def stop_code(self):
-        # Kodun çalışmasını durdurmak için işlemleri buraya yazın
-        print("Execution stopped FUNC.")
+        """Çalışan kodu iptal eder (bir sonraki satırda ExecutionCancelled fırlatılır)."""
+        if self.execution_engine.is_running():
+            self.execution_engine.cancel()
+
+    def run_git_command(self, name):
+        """Git menü komutlarını çalıştırır; GitPython ilk kullanımda yüklenir."""
+        import settings.github_utils
+        getattr(settings.github_utils, name)(self)
 
     def open_settings(self):
         """Preferences menüsüne tıklanınca settings_ui.py'yi açar."""
@@ -1211,6 +1168,7 @@ class EditorApp(QMainWindow):
 
     def open_nuke_project_dialog(self):
     # Returns the workplace after generating a project specific to Nuke
+        from editor.new_nuke_project import NewNukeProjectDialog
         dialog = NewNukeProjectDialog(self)
         dialog.setWindowFlags(dialog.windowFlags() | Qt.WindowStaysOnTopHint) # Make dialog Z +1
         if dialog.exec_():
@@ -1256,6 +1214,7 @@ class EditorApp(QMainWindow):
         if current_editor:
             # Seçili metni kontrol et
             if current_editor.textCursor().selectedText().strip():
+                from editor.dialogs.replaceDialogs import ReplaceDialogs
                 dialog = ReplaceDialogs(current_editor)
                 dialog.show()
             else:
@@ -1269,6 +1228,7 @@ class EditorApp(QMainWindow):
         # Eğer aktif düzenleyici bir CodeEditor ise ve metin seçiliyse ReplaceDialogs fonksiyonunu çağırıyoruz
         if isinstance(current_editor, CodeEditor):
             if current_editor.textCursor().selectedText().strip():
+                from editor.dialogs.replaceDialogs import ReplaceDialogs
                 dialog = ReplaceDialogs(current_editor)  # current_editor'ü parametre olarak geçiyoruz
                 dialog.show()  # Diyaloğu gösteriyoruz
             else:
@@ -1291,14 +1251,7 @@ class EditorApp(QMainWindow):
     def load_last_project(self):
         """recent_paths listesinin ilk elemanını settings.json'daki resume_last_project durumuna göre yükler."""
         # Settings.json kontrolü
-        resume_last_project = False
-        if os.path.exists(self.settings_path):
-            try:
-                with open(self.settings_path, 'r') as settings_file:
-                    settings_data = json.load(settings_file)
-                    resume_last_project = settings_data["General"].get("resume_last_project", False)
-            except Exception as e:
-                print(f"Error reading settings.json: {e}")
+        resume_last_project = SettingsStore.instance().get("General", "resume_last_project", False)
         # Eğer settings.json'daki resume_last_project false ise işlem yapma
         if not resume_last_project:
             print("Resume last project is disabled in settings.json.!!")
@@ -1362,46 +1315,97 @@ class EditorApp(QMainWindow):
             self.populate_workplace(self.project_dir)
 
     def populate_workplace(self, directory):
-        """Workplace'ı proje dizini ile doldurur."""
+        """Workplace'ı proje dizini ile doldurur; klasörler açıldıkça arka planda yüklenir."""
         self.workplace_tree.clear()  # Önceki dizini temizle
+        self.workplace_scanner.reset()
+        self.workplace_folders = {}
+        self.workplace_files = {}
+        self.workplace_loaded = set()
+
         root_item = QTreeWidgetItem(self.workplace_tree)
         root_item.setText(0, os.path.basename(directory))
-        self.add_items_to_tree(root_item, directory)
-        self.workplace_tree.expandAll()
-
-    def add_items_to_tree(self, parent_item, directory):
-        """Belirli uzantılara sahip dosyaları tree'ye ekler."""
-        # İzin verilen uzantılar
-        allowed_extensions = {'.py', '.txt', '.sh', '.cpp', '.png', '.jpg', '.jpeg'}
-
-        for file_name in os.listdir(directory):
-            file_path = os.path.join(directory, file_name)
-
-            # Eğer bir klasörse, içine girip tekrar `add_items_to_tree` çağır
-            if os.path.isdir(file_path):
-                folder_item = QTreeWidgetItem(parent_item)
-                folder_item.setText(0, file_name)
-                folder_item.setIcon(0, QIcon(os.path.join(PathFromOS().icons_path, 'folder_tree.svg')))
-                self.add_items_to_tree(folder_item, file_path)
-            else:
-                # Dosya uzantısını kontrol et ve sadece izin verilenleri ekle
-                _, extension = os.path.splitext(file_name)
-                if extension.lower() in allowed_extensions:
-                    file_item = QTreeWidgetItem(parent_item)
-                    file_item.setText(0, file_name)
-                    file_item.setData(0, Qt.UserRole, file_path)  # Sağ tık menüsü için yol bilgisi ekle
-
-                    # Dosya tipine göre ikon ekle
-                    if extension.lower() == '.py':
-                        file_item.setIcon(0, QIcon(os.path.join(PathFromOS().icons_path, 'python_tab.svg')))
-                    elif extension.lower() == '.txt':
-                        file_item.setIcon(0, QIcon(os.path.join(PathFromOS().icons_path, 'text_icon.svg')))
-                    elif extension.lower() == '.sh':
-                        file_item.setIcon(0, QIcon(os.path.join(PathFromOS().icons_path, 'shell_icon.svg')))
-                    elif extension.lower() == '.cpp':
-                        file_item.setIcon(0, QIcon(os.path.join(PathFromOS().icons_path, 'cpp_icon.svg')))
-                    elif extension.lower() in {'.png', '.jpg', '.jpeg'}:
-                        file_item.setIcon(0, QIcon(os.path.join(PathFromOS().icons_path, 'image_icon.svg')))
+        root_item.setData(0, DIRECTORY_ROLE, directory)
+        root_item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+        self.workplace_folders[directory] = root_item
+        root_item.setExpanded(True)  # itemExpanded ile kök dizin taranır
+
+    def load_workplace_folder(self, item):
+        """Açılan bir klasörün içeriğini ilk açılışta arka planda taratır."""
+        directory = item.data(0, DIRECTORY_ROLE)
+        if directory and directory not in self.workplace_loaded:
+            self.workplace_loaded.add(directory)
+            self.workplace_scanner.scan(directory)
+
+    def refresh_workplace_directory(self, directory):
+        """Sadece verilen dizini yeniden taratır (yükleneli ise)."""
+        if directory in self.workplace_loaded:
+            self.workplace_scanner.scan(directory)
+
+    def apply_workplace_entries(self, directory, entries):
+        """
+        Applies one scanned directory level to the WORKPLACE tree.
+
+        New entries are added and vanished ones removed; existing items are left untouched.
+        """
+        parent_item = self.workplace_folders.get(directory)
+        if parent_item is None:
+            return  # Klasör bu arada ağaçtan kaldırıldı
+        if entries is None:
+            # Dizin silinmiş ya da okunamıyor
+            if parent_item.parent() is not None:
+                self.forget_workplace_item(parent_item)
+                parent_item.parent().removeChild(parent_item)
+            return
+
+        existing = {}
+        for i in range(parent_item.childCount()):
+            child = parent_item.child(i)
+            existing[child.data(0, Qt.UserRole) or child.data(0, DIRECTORY_ROLE)] = child
+
+        paths = set()
+        for file_name, file_path, is_dir in entries:
+            paths.add(file_path)
+            if file_path not in existing:
+                self.add_workplace_item(parent_item, file_name, file_path, is_dir)
+
+        for file_path, child in existing.items():
+            if file_path not in paths:
+                self.forget_workplace_item(child)
+                parent_item.removeChild(child)
+        parent_item.setChildIndicatorPolicy(QTreeWidgetItem.DontShowIndicatorWhenChildless)
+
+    def add_workplace_item(self, parent_item, file_name, file_path, is_dir):
+        """Tek bir klasör ya da dosya öğesi oluşturur ve yol indekslerine ekler."""
+        item = QTreeWidgetItem(parent_item)
+        item.setText(0, file_name)
+        if is_dir:
+            item.setIcon(0, self.workplace_icons["folder"])
+            item.setData(0, DIRECTORY_ROLE, file_path)
+            item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)  # İçerik açılınca yüklenir
+            self.workplace_folders[file_path] = item
+            return item
+
+        item.setData(0, Qt.UserRole, file_path)  # Sağ tık menüsü için yol bilgisi ekle
+        # Dosya tipine göre ikon ekle
+        icon = self.workplace_icons.get(os.path.splitext(file_name)[1].lower())
+        if icon is not None:
+            item.setIcon(0, icon)
+        if file_path in self.item_colors:
+            item.setBackground(0, QBrush(QColor(self.item_colors[file_path])))
+        self.workplace_files[file_path] = item
+        return item
+
+    def forget_workplace_item(self, item):
+        """Kaldırılan bir öğeyi ve alt öğelerini yol indekslerinden ve izleyiciden çıkarır."""
+        directory = item.data(0, DIRECTORY_ROLE)
+        if directory:
+            self.workplace_folders.pop(directory, None)
+            self.workplace_loaded.discard(directory)
+            self.workplace_scanner.unwatch(directory)
+            for i in range(item.childCount()):
+                self.forget_workplace_item(item.child(i))
+        else:
+            self.workplace_files.pop(item.data(0, Qt.UserRole), None)
 
     def on_workplace_item_double_clicked(self, item, column):
         """Workplace'deki bir dosya çift tıklanınca dosyayı aç."""
@@ -1474,8 +1478,9 @@ class EditorApp(QMainWindow):
         menu.exec_(self.workplace_tree.viewport().mapToGlobal(position))
 
     def expand_all_items(self):
-        """Expands all items in Workplace."""
-        self.workplace_tree.expandAll()
+        """Expands all loaded folders in Workplace; unloaded ones are scanned as they expand."""
+        for item in list(self.workplace_folders.values()):
+            item.setExpanded(True)
 
     def collapse_all_items(self):
         """Collapses all items in Workplace."""
@@ -1524,7 +1529,7 @@ class EditorApp(QMainWindow):
             dest_file = os.path.join(dest_dir, os.path.basename(file_path))
             try:
                 shutil.copy(file_path, dest_file)
-                self.populate_workplace(self.project_dir)  # Yüklemeyi yenile
+                self.refresh_workplace_directory(dest_dir)  # Sadece hedef dizini yenile
             except Exception as e:
                 QMessageBox.warning(self, "Hata", f"Dosya yapıştırılamadı: {str(e)}")
         else:
@@ -1538,7 +1543,7 @@ class EditorApp(QMainWindow):
             if confirm == QMessageBox.Yes:
                 try:
                     os.remove(file_path)
-                    self.populate_workplace(self.project_dir)  # Workspace'i güncelle
+                    self.refresh_workplace_directory(os.path.dirname(file_path))  # Sadece üst dizini yenile
                 except Exception as e:
                     QMessageBox.warning(self, "Hata", f"Dosya silinemedi: {str(e)}")
         else:
@@ -1563,20 +1568,11 @@ class EditorApp(QMainWindow):
             with open(self.color_settings_path, 'r') as file:
                 self.item_colors = json.load(file)
 
-            # Ağaçtaki renkleri geri yüklemek için
-            def apply_color_to_item(item):
-                file_path = item.data(0, Qt.UserRole)
-                if file_path in self.item_colors:
-                    color = QColor(self.item_colors[file_path])
-                    item.setBackground(0, QBrush(color))
-
-            # Tüm öğeleri dolaşarak renkleri uygula
-            def iterate_tree_items(item):
-                apply_color_to_item(item)
-                for i in range(item.childCount()):
-                    iterate_tree_items(item.child(i))
-
-            iterate_tree_items(self.workplace_tree.invisibleRootItem())
+            # Renkleri yol indeksi üzerinden geri yükle
+            for file_path, color in self.item_colors.items():
+                item = self.workplace_files.get(file_path)
+                if item is not None:
+                    item.setBackground(0, QBrush(QColor(color)))
 
     def update_item_color(self, item, color):
         file_path = item.data(0, Qt.UserRole)  # Dosya yolunu al
@@ -1781,14 +1777,15 @@ class EditorApp(QMainWindow):
 
         self.add_new_tab(full_path)  # Yeni dosya ile bir sekme aç
         print ("add_new_tab 1500")
-        self.populate_workplace(self.project_dir)  # "Workplace" görünümünü güncelle
+        self.refresh_workplace_directory(self.project_dir)  # "Workplace" görünümünü güncelle
         dialog.close()
 
     def add_new_tab(self, file_path, initial_content=""):
         """Yeni bir sekme oluşturur ve dosyayı yükler."""
         editor = CodeEditor()  # QPlainTextEdit yerine CodeEditor kullanıyoruz
+        editor.file_path = os.path.abspath(file_path)
         print ("add_new tab 1001")
-        editor.textChanged.connect(self.update_header_tree)  # Direkt editor widget'ine bağlama yaptık
+        editor.changes.register("header", lambda change: self.update_header_tree(), IDLE)
 
         # Dosya içeriği eğer mevcutsa yüklüyoruz, yoksa varsayılan içerik ile açıyoruz
         if os.path.exists(file_path):
@@ -1798,7 +1795,9 @@ class EditorApp(QMainWindow):
         else:
             editor.setPlainText(initial_content)
 
-        editor.textChanged.connect(lambda: self.mark_as_modified(editor))
+        # Yükleme değişikliği teslim edildikten sonra bağlanır; böylece sekme değişmiş sayılmaz
+        editor.changes.flush()
+        editor.changes.register("modified", lambda change: self.mark_as_modified(editor))
 
         self.tab_widget.addTab(editor, self.python_icon, os.path.basename(file_path))
         self.tab_widget.setCurrentWidget(editor)
@@ -1911,6 +1910,7 @@ class EditorApp(QMainWindow):
                 with open(file_path, 'w') as file:
                     file.write(current_editor.toPlainText())
                 self.tab_widget.setTabText(index, tab_title)
+                current_editor.file_path = os.path.abspath(file_path)
 
     def save_file_as(self):
         """Dosyayı farklı bir yola kaydeder."""
@@ -1923,6 +1923,7 @@ class EditorApp(QMainWindow):
                     file.write(current_editor.toPlainText())
                 index = self.tab_widget.indexOf(current_editor)
                 self.tab_widget.setTabText(index, os.path.basename(file_name))
+                current_editor.file_path = os.path.abspath(file_name)
 
     def close_tab(self, index):
         """Bir sekmeyi kapatmadan önce kontrol eder."""
@@ -2050,6 +2051,25 @@ class EditorApp(QMainWindow):
         self.workplace_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.workplace_tree.customContextMenuRequested.connect(self.context_menu)
         self.workplace_tree.itemDoubleClicked.connect(self.on_workplace_item_double_clicked)
+        self.workplace_tree.itemExpanded.connect(self.load_workplace_folder)
+
+        # İkonlar bir kez yüklenir ve tüm WORKPLACE öğeleri tarafından paylaşılır
+        image_icon = QIcon(os.path.join(PathFromOS().icons_path, 'image_icon.svg'))
+        self.workplace_icons = {
+            "folder": QIcon(os.path.join(PathFromOS().icons_path, 'folder_tree.svg')),
+            ".py": QIcon(os.path.join(PathFromOS().icons_path, 'python_tab.svg')),
+            ".txt": QIcon(os.path.join(PathFromOS().icons_path, 'text_icon.svg')),
+            ".sh": QIcon(os.path.join(PathFromOS().icons_path, 'shell_icon.svg')),
+            ".cpp": QIcon(os.path.join(PathFromOS().icons_path, 'cpp_icon.svg')),
+            ".png": image_icon,
+            ".jpg": image_icon,
+            ".jpeg": image_icon,
+        }
+        self.workplace_folders = {}  # dizin yolu -> klasör öğesi
+        self.workplace_files = {}  # dosya yolu -> dosya öğesi (renkler için yol indeksi)
+        self.workplace_loaded = set()
+        self.workplace_scanner = DirectoryScanner(self)
+        self.workplace_scanner.directory_loaded.connect(self.apply_workplace_entries)
         self.workplace_dock.setWidget(self.workplace_tree)
         self.addDockWidget(self.settings.WORKPLACE_DOCK_POS, self.workplace_dock)
         self.workplace_dock.setVisible(self.settings.WORKPLACE_VISIBLE)
@@ -2116,12 +2136,14 @@ class EditorApp(QMainWindow):
         expand_icon = os.path.join(path_from_os.icons_path, 'expand_icon.svg')
         collapse_icon = os.path.join(path_from_os.icons_path, 'collapse_icon.svg')
 
-        # OUTLINER QTreeWidget tanımla
-        self.outliner_list = QTreeWidget()
+        # OUTLINER QTreeView tanımla (model/view; satırlar OutlinerModel'den okunur)
+        self.outliner_list = QTreeView()
         self.outliner_list.setHeaderHidden(True)  # Başlığı gizle
         self.outliner_list.setAlternatingRowColors(False)
+        self.outliner_list.setUniformRowHeights(True)  # Görünür satırların hızlı hesaplanması için
+        self.outliner_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.outliner_list.setStyleSheet("""
-            QTreeWidget {
+            QTreeView {
                 background-color: #2B2B2B;
                 border: none;
                 font-size: 9pt;  /* Yazı boyutu */
@@ -2131,7 +2153,7 @@ class EditorApp(QMainWindow):
 
         self.outliner_list.setRootIsDecorated(False)  # Klasör simgeleri ve bağlantı çizgilerini gizler
         self.outliner_list.setStyleSheet(
-            "QTreeWidget::branch { background-color: transparent; }")  # Dikey çizgileri kaldırır
+            "QTreeView::branch { background-color: transparent; }")  # Dikey çizgileri kaldırır
 
         # Arama çubuğu için bir widget ve layout oluştur
         self.search_widget = QWidget()
@@ -2174,6 +2196,17 @@ class EditorApp(QMainWindow):
         self.addDockWidget(self.settings.OUTLINER_DOCK_POS, self.outliner_dock)
         self.outliner_dock.setVisible(self.settings.OUTLINER_VISIBLE)
 
+        # İkonlar bir kez yüklenir ve tüm OUTLINER öğeleri tarafından paylaşılır
+        self.outliner_icons = {
+            "Class": QIcon(os.path.join(PathFromOS().icons_path, 'C_logo.svg')),
+            "Method": QIcon(os.path.join(PathFromOS().icons_path, 'M_logo.svg')),
+            "Function": QIcon(os.path.join(PathFromOS().icons_path, 'M_red.svg')),
+            "Folder": QIcon(os.path.join(PathFromOS().icons_path, 'folder_tree.svg')),
+        }
+        self.outliner_model = OutlinerModel(self.outliner_icons, self)
+        self.outliner_proxy = OutlinerFilterProxy(self)
+        self.outliner_proxy.setSourceModel(self.outliner_model)
+        self.outliner_list.setModel(self.outliner_proxy)
         self.populate_outliner_with_functions()
         # Sağ tıklama menüsü ekle (Context Menu)
         self.outliner_list.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -2288,73 +2321,90 @@ class EditorApp(QMainWindow):
 
         self.header_tree.itemClicked.connect(self.go_to_line_from_header)
 
+        # İkonlar bir kez yüklenir ve tüm HEADER öğeleri tarafından paylaşılır
+        def_icon = QIcon(os.path.join(PathFromOS().icons_path, "def.svg"))
+        self.header_icons = {
+            "Class": QIcon(os.path.join(PathFromOS().icons_path, "C_logo.svg")),
+            "Function": def_icon,
+            "Method": def_icon,
+            "Project": QIcon(os.path.join(PathFromOS().icons_path, "python.svg")),
+        }
+        self.header_outline = []
+        self.header_project_item = None
+        self.structure_service = StructureService(self)
+        self.structure_service.outline_ready.connect(self.apply_header_outline)
+        self.tab_widget.currentChanged.connect(self.update_header_tree)
+
         # HEADER başlığı için özel widget
         self.create_dock_title("HEADER", self.header_dock, expand_icon_path, collapse_icon_path)
 
     def update_header_tree(self):
-        """QPlainTextEdit içindeki metni analiz edip sınıf ve fonksiyonları HEADER'a ekler."""
-        self.header_tree.clear()  # Eski öğeleri temizliyoruz
-
+        """Aktif düzenleyici için HEADER yapısını debounce edilmiş, arka planda çalışan bir parse ile günceller."""
         current_editor = self.tab_widget.currentWidget()
         if current_editor is None:
-            return  # Aktif bir düzenleyici yoksa fonksiyondan çıkın
+            self.apply_header_outline(None, [])  # Aktif bir düzenleyici yoksa HEADER'ı boşalt
+            return
+        self.structure_service.schedule(current_editor)
 
-        code = current_editor.toPlainText()  # Düzenleyicideki tüm metni alıyoruz
+    def apply_header_outline(self, editor, outline):
+        """
+        Applies a parsed outline to the HEADER tree, touching only the items that changed.
 
-        try:
-            tree = ast.parse(code)  # Python kodunu AST'ye çeviriyoruz
-        except (SyntaxError, IndentationError):
-            # Eğer kod geçerli değilse, HEADER'ı güncellemeyin
+        Args:
+            editor (CodeEditor): The editor the outline was parsed from.
+            outline (list): (kind, name, lineno, methods) tuples from `parse_outline`.
+        """
+        if editor is not self.tab_widget.currentWidget():
             return
 
-        # Define the paths for the icons
-        class_icon_path = os.path.join(PathFromOS().icons_path, "C_logo.svg")
-        def_icon_path = os.path.join(PathFromOS().icons_path, "def.svg")
-        project_icon_path = os.path.join(PathFromOS().icons_path, "python.svg")
-
         # Project header with an icon if a project is set
-        if self.project_dir:
-            project_item = QTreeWidgetItem(self.header_tree)
-            project_item.setText(0, os.path.basename(self.project_dir))  # Project name
-            project_item.setIcon(0, QIcon(project_icon_path))  # Project icon
-            project_item.setFirstColumnSpanned(True)  # Span the project name across the header
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):  # Eğer sınıf tanımıysa
-                class_item = QTreeWidgetItem(self.header_tree)
-                class_item.setText(0, node.name)  # Sınıf ismi
-                class_item.setText(1, "Class")  # Türü
-                class_item.setIcon(0, QIcon(class_icon_path))  # Sınıf için ikon
-                class_item.setData(0, Qt.UserRole, node.lineno)
-
-                # Indentation for class items
-                class_item.setTextAlignment(0, Qt.AlignLeft | Qt.AlignVCenter)
-                class_item.setSizeHint(0, QSize(200, 20))  # Adjust size for better spacing
-
-                # Sınıfın metodlarını ekleyelim
-                for sub_node in node.body:
-                    if isinstance(sub_node, ast.FunctionDef):
-                        method_item = QTreeWidgetItem(class_item)
-                        method_item.setText(0, sub_node.name)
-                        method_item.setText(1, "Method")
-                        method_item.setIcon(0, QIcon(def_icon_path))  # Metod için ikon
-                        method_item.setData(0, Qt.UserRole, sub_node.lineno)
-
-                        # Indentation for method items
-                        method_item.setTextAlignment(0, Qt.AlignLeft | Qt.AlignVCenter)
-                        method_item.setSizeHint(0, QSize(200, 20))  # Adjust size for better spacing
-
-            elif isinstance(node, ast.FunctionDef) and not isinstance(node, ast.ClassDef):
-                # Eğer sınıf dışı bir fonksiyon tanımıysa doğrudan ekleyelim
-                func_item = QTreeWidgetItem(self.header_tree)
-                func_item.setText(0, node.name)  # Fonksiyon ismi
-                func_item.setText(1, "Function")
-                func_item.setIcon(0, QIcon(def_icon_path))  # Fonksiyon için ikon
-                func_item.setData(0, Qt.UserRole, node.lineno)
-
-                # Indentation for function items
-                func_item.setTextAlignment(0, Qt.AlignLeft | Qt.AlignVCenter)
-                func_item.setSizeHint(0, QSize(200, 20))  # Adjust size for better spacing
+        project_name = os.path.basename(self.project_dir) if self.project_dir else None
+        if project_name and self.header_project_item is None:
+            self.header_project_item = QTreeWidgetItem()
+            self.header_project_item.setIcon(0, self.header_icons["Project"])  # Project icon
+            self.header_tree.insertTopLevelItem(0, self.header_project_item)
+            self.header_project_item.setFirstColumnSpanned(True)  # Span the project name across the header
+        elif not project_name and self.header_project_item is not None:
+            self.header_tree.takeTopLevelItem(0)
+            self.header_project_item = None
+        if self.header_project_item is not None and self.header_project_item.text(0) != project_name:
+            self.header_project_item.setText(0, project_name)
+        offset = 1 if self.header_project_item is not None else 0
+
+        # Sadece değişen satırları güncelle, fazlalıkları sil, yenileri ekle
+        previous = self.header_outline
+        for index, entry in enumerate(outline):
+            if index < len(previous):
+                if previous[index] != entry:
+                    self.fill_header_item(self.header_tree.topLevelItem(offset + index), entry, previous[index])
+            else:
+                item = QTreeWidgetItem()
+                self.fill_header_item(item, entry)
+                self.header_tree.addTopLevelItem(item)
+        for index in range(len(previous) - 1, len(outline) - 1, -1):
+            self.header_tree.takeTopLevelItem(offset + index)
+        self.header_outline = list(outline)
+
+    def fill_header_item(self, item, entry, previous=None):
+        """HEADER öğesini outline kaydına göre doldurur; metodlar değişmediyse alt öğelere dokunmaz."""
+        kind, name, lineno, methods = entry
+        item.setText(0, name)
+        item.setText(1, kind)
+        item.setIcon(0, self.header_icons[kind])
+        item.setData(0, Qt.UserRole, lineno)
+        # Hizalama atanmaz: delegate'in varsayılanı zaten AlignLeft | AlignVCenter
+        item.setSizeHint(0, QSize(200, 20))  # Adjust size for better spacing
+
+        if previous is not None and previous[3] == methods:
+            return
+        item.takeChildren()
+        for method_name, method_lineno in methods:
+            method_item = QTreeWidgetItem(item)
+            method_item.setText(0, method_name)
+            method_item.setText(1, "Method")
+            method_item.setIcon(0, self.header_icons["Method"])  # Metod için ikon
+            method_item.setData(0, Qt.UserRole, method_lineno)
+            method_item.setSizeHint(0, QSize(200, 20))
 
     def go_to_line_from_header(self, item, column):
         """HEADER'da bir öğeye tıklandığında ilgili satıra gitme işlemi."""
@@ -2366,10 +2416,10 @@ class EditorApp(QMainWindow):
             self.tab_widget.currentWidget().setTextCursor(cursor)
             self.tab_widget.currentWidget().setFocus()
 
-    def insert_into_editor(self, item, column):
-        """OUTLINER'da çift tıklanan öğeyi aktif metin düzenleyiciye ekler."""
+    def insert_into_editor(self, index, column=0):
+        """OUTLINER'da seçilen öğeyi aktif metin düzenleyiciye ekler."""
         # Seçilen sınıf ya da fonksiyon adını al
-        selected_text = item.text(0)
+        selected_text = index.data(Qt.DisplayRole)
 
         # Aktif düzenleyiciye eriş
         current_editor = self.tab_widget.currentWidget()
@@ -2385,19 +2435,19 @@ class EditorApp(QMainWindow):
 
     def context_menu_outliner(self, position):
         """OUTLINER'da sağ tıklama menüsü oluşturur."""
-        item = self.outliner_list.itemAt(position)
-        if item is None:
+        index = self.outliner_list.indexAt(position)
+        if not index.isValid():
             return
 
         menu = QMenu()
 
         # "Insert the Code" seçeneği
         insert_action = QAction("Insert the Code", self)
-        insert_action.triggered.connect(lambda: self.insert_into_editor(item, 0))
+        insert_action.triggered.connect(lambda: self.insert_into_editor(index, 0))
 
         # "Go to Information" seçeneği
         go_to_info_action = QAction("Search API Reference", self)
-        go_to_info_action.triggered.connect(lambda: self.go_to_information(item))
+        go_to_info_action.triggered.connect(lambda: self.go_to_information(index))
 
         # Menü öğelerini ekleyin
         menu.addAction(insert_action)
@@ -2442,9 +2492,9 @@ class EditorApp(QMainWindow):
         else:
             self.hide_search_bar(event)  # Arama çubuğunu gizle
 
-    def go_to_information(self, item):
+    def go_to_information(self, index):
         """Seçilen öğeyi geliştirici kılavuzunda arar."""
-        selected_text = item.text(0)  # Seçilen öğe
+        selected_text = index.data(Qt.DisplayRole)  # Seçilen öğe
 
         # URL şablonu
         base_url = "https://learn.foundry.com/nuke/developers/15.0/pythondevguide/search.html"
@@ -2455,67 +2505,22 @@ class EditorApp(QMainWindow):
         # Tarayıcıda aç
         webbrowser.open(search_url)
 
-    def custom_outliner_action(self, item):
+    def custom_outliner_action(self, index):
         """OUTLINER'da özel bir işlem gerçekleştirir."""
-        selected_text = item.text(0)
+        selected_text = index.data(Qt.DisplayRole)
         QMessageBox.information(self, "Custom Action", f"You selected: {selected_text}")
 
     def filter_outliner(self, text):
         """Filters items in OUTLINER based on text in the search bar"""
-        root = self.outliner_list.invisibleRootItem()  # OUTLINER'ın kök öğesi
-
-        # Filtre metni boşsa tüm öğeleri göster
-        if not text:
-            for i in range(root.childCount()):
-                item = root.child(i)
-                item.setHidden(False)
-                for j in range(item.childCount()):
-                    sub_item = item.child(j)
-                    sub_item.setHidden(False)
-            return
-
-        # Filter classes and methods based on search text
-        for i in range(root.childCount()):  # Ana öğeler (sınıflar)
-            item = root.child(i)
-            match_found = False  # Ana öğeyi gösterip göstermeme durumu
-
-            # Ana öğe metniyle arama metni eşleşiyor mu?
-            if text.lower() in item.text(0).lower():
-                item.setHidden(False)
-                match_found = True
-            else:
-                item.setHidden(True)
-
-            # Alt öğeleri kontrol et (metotlar)
-            for j in range(item.childCount()):
-                sub_item = item.child(j)
-
-                if text.lower() in sub_item.text(0).lower():  # Arama metni alt öğeyle eşleşiyor mu?
-                    sub_item.setHidden(False)
-                    match_found = True  # Eğer bir alt öğe eşleşiyorsa ana öğeyi de göster
-                else:
-                    sub_item.setHidden(True)
-
-            # Eğer alt öğelerden biri eşleştiyse ana öğeyi göster
-            if match_found:
-                item.setHidden(False)
+        # Eşleşmeler sembol indeksinden okunur; satırlar tek tek gezilmez
+        self.outliner_proxy.set_filter_text(text)
+        if text:
+            self.outliner_list.expandAll()  # Eşleşen metotları görünür kıl
 
     def update_completer_from_outliner(self):
         """OUTLINER'daki sınıf ve fonksiyon isimlerini QCompleter'e ekler."""
-        outliner_items = []
-        root = self.outliner_list.invisibleRootItem()  # OUTLINER'ın kök öğesi
-
-        # OUTLINER'daki tüm öğeleri dolaşarak listeye ekle
-        for i in range(root.childCount()):  # Ana öğeler (class'lar)
-            item = root.child(i)
-            outliner_items.append(item.text(0))  # Class ismini ekle
-
-            for j in range(item.childCount()):  # Alt öğeler (methods'ler)
-                sub_item = item.child(j)
-                outliner_items.append(sub_item.text(0))  # Method ismini ekle
-
         # Tamamlama önerileri için QStringListModel kullanarak model oluşturuyoruz
-        model = QStringListModel(outliner_items, self.completer)
+        model = QStringListModel(self.outliner_model.all_names(), self.completer)
         self.completer.setModel(model)
 
     def is_valid_python_identifier(self, name):
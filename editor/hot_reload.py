@@ -0,0 +1,36 @@
+import os
+import sys
+
+EDITOR_DIR = os.path.normcase(os.path.dirname(os.path.abspath(__file__)))
+# Paketlenmiş üçüncü parti modüller (Pygments, GitPython) yeniden yüklenmez
+BUNDLED_DIR = os.path.join(EDITOR_DIR, "settings", "modules")
+
+
+def editor_modules():
+    """Names of the loaded modules whose files live in the editor directory, bundled modules excluded."""
+    names = []
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if not path:
+            continue
+        path = os.path.normcase(os.path.abspath(path))
+        if path.startswith(EDITOR_DIR + os.sep) and not path.startswith(BUNDLED_DIR + os.sep):
+            names.append(name)
+    return names
+
+
+def purge_editor_modules():
+    """
+    Developer hot reload: drops the editor's modules so that the next import executes them again.
+
+    Every module then runs exactly once and in import order, unlike chained `importlib.reload` calls,
+    and singletons (SettingsStore, EditorServices, ...) start fresh together with their classes. Windows
+    that are already open keep using the old modules.
+
+    Returns:
+        list: The names of the dropped modules.
+    """
+    names = editor_modules()
+    for name in names:
+        del sys.modules[name]
+    return names
@@ -1,9 +1,12 @@
+import atexit
+import bisect
 import inspect
+import json
+import sys
 from PySide2.QtGui import QColor, QPainter, QTextCursor, QFont
 from PySide2.QtWidgets import QPlainTextEdit, QListWidget, QListWidgetItem
 from PySide2.QtCore import Qt, QPoint
 import importlib
-import editor.core
 import os
 
 try:
@@ -11,8 +14,226 @@ try:
 except ImportError:
     nuke = None
 
-importlib.reload(editor.core)
-from editor.core import CodeEditorSettings, PathFromOS
+from editor.core import get_settings, PathFromOS
+
+
+def get_completion_text(module, attr):
+    """
+    Retrieves the completion text for a given attribute in a module.
+
+    Args:
+        module: The module to inspect.
+        attr: The attribute name.
+
+    Returns:
+        str: Completion text based on the function's signature or docstring.
+    """
+    item = getattr(module, attr)
+    if inspect.isfunction(item) or inspect.ismethod(item):
+        try:
+            params = inspect.signature(item).parameters
+            param_list = ", ".join(param.name for param in params.values())
+            return f"{attr}({param_list})"
+        except (ValueError, TypeError):
+            # Fallback: Use the first line of the docstring if available
+            docstring = getattr(item, "__doc__", "")
+            if docstring:
+                first_line = docstring.splitlines()[0]
+                return f"{attr}({first_line})"
+            else:
+                return f"{attr}()"
+    elif isinstance(item, str):
+        return f"{attr}('')"
+    elif isinstance(item, (int, float)):
+        return f"{attr}"
+    else:
+        return f"{attr}()"
+
+
+class SuggestionCatalog:
+    """
+    Process-wide catalog of `nuke` / `nukescripts` ghost suggestions.
+
+    The catalog is keyed on `nuke.env['NukeVersionString']` and persisted to
+    `assets/dynamic_data/ghost_catalog.json`. Only the public names (and the module that provides them) are
+    listed up front; the completion text of a name is built with `get_completion_text` on its first lookup,
+    then cached and written back to disk at exit. Every editor tab shares the same catalog and prefix index.
+    """
+    _instance = None
+    modules = ("nuke", "nukescripts")
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self.path = os.path.join(PathFromOS().json_dynamic_path, "ghost_catalog.json")
+        self.key = self.nuke_version()
+        self.sources = {}  # name -> modül adı
+        self.completions = {}  # name -> completion text (ilk erişimde doldurulur)
+        self.dirty = False
+
+        if not self.load():
+            self.collect_names()
+            self.dirty = True
+        self.index = SuggestionIndex(self)
+        atexit.register(self.save)
+
+    @staticmethod
+    def nuke_version():
+        """Katalog anahtarı olarak kullanılan Nuke sürümü (Nuke dışında boş)."""
+        try:
+            return str(nuke.env['NukeVersionString'])
+        except (AttributeError, KeyError, TypeError):
+            return ""
+
+    def load(self):
+        """Diskteki katalog aynı Nuke sürümüne aitse onu kullanır."""
+        try:
+            with open(self.path, "r") as file:
+                data = json.load(file)
+            if data.get("key") != self.key:
+                return False
+            self.sources = dict(data["names"])
+            self.completions = dict(data.get("completions", {}))
+            return True
+        except (OSError, ValueError, KeyError, AttributeError, TypeError):
+            return False
+
+    def collect_names(self):
+        """Modüllerdeki public isimleri listeler (completion metinleri henüz üretilmez)."""
+        for module_name in self.modules:
+            module = self.module(module_name)
+            if module is None:
+                continue
+            for attr in dir(module):
+                if not attr.startswith("_"):
+                    self.sources[attr] = module_name
+
+    def module(self, module_name):
+        if module_name == "nuke":
+            return nuke
+        module = sys.modules.get(module_name)
+        if module is None:
+            try:
+                module = importlib.import_module(module_name)
+            except ImportError:
+                return None
+        return module
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w") as file:
+                json.dump({"key": self.key, "names": self.sources, "completions": self.completions}, file,
+                          separators=(",", ":"))
+            self.dirty = False
+        except OSError as e:
+            print(f"Error saving suggestion catalog: {e}")
+
+    # Mapping arayüzü (isim -> completion text)
+    def __contains__(self, name):
+        return name in self.sources
+
+    def __iter__(self):
+        return iter(self.sources)
+
+    def __len__(self):
+        return len(self.sources)
+
+    def __getitem__(self, name):
+        completion = self.completions.get(name)
+        if completion is None:
+            module_name = self.sources[name]
+            module = self.module(module_name)
+            try:
+                completion = get_completion_text(module, name) if module is not None else f"{name}()"
+            except AttributeError:
+                completion = f"{name}()"
+            self.completions[name] = completion
+            self.dirty = True
+        return completion
+
+
+class GhostUsage:
+    """
+    Process-wide, persisted usage counts of accepted ghost suggestions.
+
+    Counts are only incremented when a suggestion is accepted with Alt+Return and are stored in
+    `assets/dynamic_data/ghost_usage.json` so the ordering survives sessions.
+    """
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self.path = os.path.join(PathFromOS().json_dynamic_path, "ghost_usage.json")
+        self.version = 0  # Her kabulde artar; indeks önbellekleri bununla geçersiz olur
+        try:
+            with open(self.path, "r") as file:
+                self.counts = {str(k): int(v) for k, v in json.load(file).items()}
+        except (OSError, ValueError, AttributeError):
+            self.counts = {}
+
+    def get(self, name):
+        return self.counts.get(name, 0)
+
+    def accept(self, name):
+        """Kabul edilen öneriyi sayar ve diske yazar."""
+        self.counts[name] = self.counts.get(name, 0) + 1
+        self.version += 1
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w") as file:
+                json.dump(self.counts, file)
+        except OSError as e:
+            print(f"Error saving ghost usage: {e}")
+
+
+class SuggestionIndex:
+    """
+    Prefix index over ghost suggestions.
+
+    Names are kept in a sorted array so a prefix maps to a contiguous range found with `bisect`. The
+    most-used name of each prefix range is memoized and the memo is dropped when a usage count changes,
+    so repeated keystrokes cost a dict lookup instead of a sort and substring scan of every suggestion.
+    """
+
+    def __init__(self, suggestions, usage=None):
+        self.suggestions = suggestions
+        self.names = sorted(suggestions)
+        self.usage = usage or GhostUsage.instance()
+        self._best = {}
+        self._usage_version = self.usage.version
+
+    def best(self, prefix):
+        """Returns the most used suggestion name starting with `prefix` (other than `prefix` itself)."""
+        if self._usage_version != self.usage.version:
+            self._best.clear()
+            self._usage_version = self.usage.version
+        if prefix in self._best:
+            return self._best[prefix]
+
+        lo = bisect.bisect_left(self.names, prefix)
+        hi = bisect.bisect_left(self.names, prefix + "\uffff", lo)
+        best_name, best_count = None, -1
+        counts = self.usage.counts
+        for name in self.names[lo:hi]:
+            if name == prefix:
+                continue
+            count = counts.get(name, 0)
+            if count > best_count:
+                best_name, best_count = name, count
+        self._best[prefix] = best_name
+        return best_name
 
 
 class InlineGhosting(QPlainTextEdit):
@@ -28,10 +249,10 @@ class InlineGhosting(QPlainTextEdit):
         super().__init__(*args, **kwargs)
 
         self.suggestions = self.load_suggestions_from_modules()
-        self.usage_count = {key: 0 for key in self.suggestions}  # Tracks usage frequency of commands
+        self.suggestion_index = self.suggestions.index  # Tüm sekmelerde ortak
+        self.ghost_suggestion = None  # Gösterilen ghost text'in ait olduğu öneri
         self.ghost_text = ""
-        self.accepting_suggestion = False
-        self.textChanged.connect(self.update_ghost_text)
+        self.accepting_suggestion = False  # Ghost text, CodeEditor.update_ghosting üzerinden güncellenir
 
         # Popup list for displaying node suggestions
         self.node_list_popup = QListWidget(self)
@@ -40,59 +261,16 @@ class InlineGhosting(QPlainTextEdit):
 
     def load_suggestions_from_modules(self):
         """
-        Loads function suggestions from the `nuke` and `nukescripts` modules.
+        Returns the shared suggestions of the `nuke` and `nukescripts` modules.
 
         Returns:
-            dict: A dictionary containing suggestion names and their completion text.
+            SuggestionCatalog: A mapping of suggestion names to their completion text.
         """
-        suggestions = {}
-
-        if nuke:
-            for attr in dir(nuke):
-                if not attr.startswith("_"):
-                    suggestions[attr] = self.get_completion_text(nuke, attr)
-
-        try:
-            import nukescripts
-            for attr in dir(nukescripts):
-                if not attr.startswith("_"):
-                    suggestions[attr] = self.get_completion_text(nukescripts, attr)
-        except ImportError:
-            pass
-
-        return suggestions
+        return SuggestionCatalog.instance()
 
     def get_completion_text(self, module, attr):
-        """
-        Retrieves the completion text for a given attribute in a module.
-
-        Args:
-            module: The module to inspect.
-            attr: The attribute name.
-
-        Returns:
-            str: Completion text based on the function's signature or docstring.
-        """
-        item = getattr(module, attr)
-        if inspect.isfunction(item) or inspect.ismethod(item):
-            try:
-                params = inspect.signature(item).parameters
-                param_list = ", ".join(param.name for param in params.values())
-                return f"{attr}({param_list})"
-            except (ValueError, TypeError):
-                # Fallback: Use the first line of the docstring if available
-                docstring = getattr(item, "__doc__", "")
-                if docstring:
-                    first_line = docstring.splitlines()[0]
-                    return f"{attr}({first_line})"
-                else:
-                    return f"{attr}()"
-        elif isinstance(item, str):
-            return f"{attr}('')"
-        elif isinstance(item, (int, float)):
-            return f"{attr}"
-        else:
-            return f"{attr}()"
+        """Retrieves the completion text for a given attribute in a module."""
+        return get_completion_text(module, attr)
 
     def update_ghost_text(self):
         """
@@ -102,33 +280,25 @@ class InlineGhosting(QPlainTextEdit):
         cursor.select(QTextCursor.WordUnderCursor)
         current_word = cursor.selectedText()
 
-        # Sort suggestions by usage count (most used first)
-        sorted_suggestions = dict(sorted(self.suggestions.items(), key=lambda item: -self.usage_count[item[0]]))
-
-        if current_word and any(current_word.startswith(suggestion) for suggestion in sorted_suggestions):
-            self.ghost_text = self.find_suggestion(current_word, sorted_suggestions)
+        self.ghost_suggestion = self.find_suggestion(current_word) if current_word else None
+        if self.ghost_suggestion:
+            self.ghost_text = self.suggestions[self.ghost_suggestion][len(current_word):]
         else:
             self.ghost_text = ""
 
         self.viewport().update()
 
-    def find_suggestion(self, word, sorted_suggestions):
+    def find_suggestion(self, word):
         """
-        Finds a relevant suggestion based on the typed word, including partial matches.
+        Finds the most used suggestion that starts with the typed word.
 
         Args:
             word (str): The current word under the cursor.
-            sorted_suggestions (dict): Dictionary of sorted suggestions.
 
         Returns:
-            str: The completion text for the suggestion.
+            str: The suggestion name, or None.
         """
-        for suggestion, completion_text in sorted_suggestions.items():
-            if word in suggestion and suggestion != word:
-                # Increment usage count
-                self.usage_count[suggestion] += 1
-                return completion_text[len(word):]
-        return ""
+        return self.suggestion_index.best(word)
 
     def keyPressEvent(self, event):
         """
@@ -141,6 +311,8 @@ class InlineGhosting(QPlainTextEdit):
             self.accepting_suggestion = True
             cursor = self.textCursor()
             cursor.insertText(self.ghost_text)
+            if self.ghost_suggestion:
+                GhostUsage.instance().accept(self.ghost_suggestion)  # Sadece kabulde sayılır
             self.ghost_text = ""
             self.accepting_suggestion = False
             self.viewport().update()
@@ -203,7 +375,7 @@ class InlineGhosting(QPlainTextEdit):
         super().paintEvent(event)
         if self.ghost_text:
             painter = QPainter(self.viewport())
-            painter.setPen(CodeEditorSettings().GHOSTING_COLOR)
+            painter.setPen(get_settings().GHOSTING_COLOR)
 
             cursor_rect = self.cursorRect(self.textCursor())
             x_offset, y_offset = cursor_rect.x(), cursor_rect.y() + self.fontMetrics().ascent()
@@ -1,16 +1,8 @@
 import os
-import importlib
 from PySide2.QtWidgets import QToolButton, QAction, QToolBar, QWidget, QSizePolicy, QMenu
 from PySide2.QtCore import QSize, Qt
 from PySide2.QtGui import QIcon
-import editor.core
-import editor.nlink
 import editor.settings.settings_ux as settings_ux
-import nodes.crtNode
-importlib.reload(nodes.crtNode)
-importlib.reload(editor.core)
-importlib.reload(editor.nlink)
-importlib.reload(settings_ux)
 from editor.nlink import update_nuke_functions
 from editor.core import PathFromOS, CodeEditorSettings
 from nodes.crtNode import createNodesCode
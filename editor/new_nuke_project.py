@@ -1,9 +1,6 @@
 import os
 import re
 import zipfile
-import importlib
-import editor.core
-importlib.reload(editor.core)
 from PySide2.QtGui import QFont, QColor, QPainter, QTextFormat
 from PySide2.QtWidgets import QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton, QFrame, QHBoxLayout, QFileDialog, \
     QCheckBox, QPlainTextEdit, QTextEdit
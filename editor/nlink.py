@@ -1,3 +1,5 @@
+import ast
+import hashlib
 import json
 import os
 import nuke
@@ -54,3 +56,79 @@ def load_nuke_functions():
     # Open the JSON file and return its content
     with open(json_path, 'r') as json_file:
         return json.load(json_file)
+
+
+# OUTLINER referans dosyaları (nuke.py, nukescripts.py) için parse önbelleği
+REFERENCE_CACHE_VERSION = 1
+_reference_cache = None
+
+
+def parse_reference_classes(source):
+    """Verilen kaynak koddaki sınıfları ve metotları bulur, özel metotları filtreler."""
+    tree = ast.parse(source)
+    classes = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            methods = [n.name for n in node.body if isinstance(n, ast.FunctionDef) and not n.name.startswith('__')]
+            classes.append((node.name, methods))
+    return classes
+
+
+def _reference_cache_path():
+    return os.path.join(PathFromOS().json_dynamic_path, 'outliner_cache.json')
+
+
+def _load_reference_cache():
+    """Loads the on-disk reference cache once per process."""
+    global _reference_cache
+    if _reference_cache is None:
+        try:
+            with open(_reference_cache_path(), 'r') as json_file:
+                data = json.load(json_file)
+            if data.get("version") != REFERENCE_CACHE_VERSION:
+                raise ValueError("outdated cache")
+            _reference_cache = data["files"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            _reference_cache = {}
+    return _reference_cache
+
+
+def _save_reference_cache():
+    path = _reference_cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as json_file:
+            json.dump({"version": REFERENCE_CACHE_VERSION, "files": _reference_cache}, json_file,
+                      separators=(',', ':'))
+    except OSError as e:
+        print(f"Error writing outliner cache: {e}")
+
+
+def load_reference_classes(file_path):
+    """
+    Returns the (class_name, methods) outline of a reference file, using the on-disk cache when possible.
+
+    The cache entry is reused while the file's mtime and size are unchanged; otherwise the file is hashed
+    and only re-parsed when its SHA-1 differs from the cached one.
+    """
+    if not os.path.exists(file_path):
+        print(f"Error: {file_path} dosyası bulunamadı!")
+        return []
+
+    cache = _load_reference_cache()
+    key = os.path.abspath(file_path)
+    stat = os.stat(file_path)
+    entry = cache.get(key)
+    if entry and entry.get("mtime") == stat.st_mtime and entry.get("size") == stat.st_size:
+        return entry["classes"]
+
+    with open(file_path, 'rb') as file:
+        data = file.read()
+    digest = hashlib.sha1(data).hexdigest()
+    if not entry or entry.get("sha1") != digest:
+        entry = {"sha1": digest, "classes": parse_reference_classes(data)}
+    entry["mtime"] = stat.st_mtime
+    entry["size"] = stat.st_size
+    cache[key] = entry
+    _save_reference_cache()
+    return entry["classes"]
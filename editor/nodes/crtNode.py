@@ -1,4 +1,3 @@
-import importlib
 import os.path
 from PySide2.QtGui import QFont, QTextCursor, QColor
 from PySide2.QtWidgets import QPlainTextEdit, QCompleter, QStyledItemDelegate, QStyleOptionViewItem, QListView, QDialog, \
@@ -8,7 +7,7 @@ from PySide2.QtCore import QStringListModel, Qt, QObject, QModelIndex
 from editor.core import PathFromOS
 import json
 import re
-from editor.core import CodeEditorSettings
+from editor.core import SettingsStore, get_settings
 
 
 class RightAlignedDelegate(QStyledItemDelegate):
@@ -34,10 +33,11 @@ class RightAlignedDelegate(QStyledItemDelegate):
         super().paint(painter, option, index)
 
 class createNodeCompleter(QObject):
-    def __init__(self, editor: QPlainTextEdit):
+    def __init__(self, editor: QPlainTextEdit = None):
         super().__init__()
 
-        self.editor = editor
+        self.editor = None  # bkz. attach; tüm sekmeler tek bir örneği paylaşır
+        self.show_all_nodes = False
         self.createNodeRegex = r"\bnuke\.createNode\(\s*['\"]?"  # nuke.createNode() ifadesi için REGEX
 
         # JSON'dan tam node listesini yükle ve kategori renklerini tanımla
@@ -51,28 +51,44 @@ class createNodeCompleter(QObject):
             "3D":    "#4fa15e",
         }
 
-        # Completer ayarları
+        # Completer ayarları; popup ayar açıkken kurulur (bkz. apply_settings)
         self.completerModel = QStringListModel()
         self.completerModel.setStringList(self.fullNodeList)
-        if not CodeEditorSettings().CREATE_NODE_COMPLETER:
-            self.completer = None
-            return  # Eğer ayar kapalıysa, sınıfı pasif hale getir
-        else:
-            self.completer = QCompleter(self.completerModel, self.editor)
-        self.completer.setCaseSensitivity(Qt.CaseInsensitive)
-        self.completer.setCompletionMode(QCompleter.PopupCompletion)
-        self.completer.popup().setFont(QFont(CodeEditorSettings().main_default_font, CodeEditorSettings().main_font_size))
-        self.completer.setWidget(editor)
-        self.completer.activated.connect(self.insert_selected_to_cursor)
-        # `CREATE_NODE_COMPLETER` ayarını kontrol et
-
+        self.completer = None
+        self.apply_settings()
+        SettingsStore.instance().settings_changed.connect(self.apply_settings)
+
+        if editor is not None:
+            self.attach(editor)
+
+    def apply_settings(self):
+        """`CREATE_NODE_COMPLETER` ayarına göre ortak popup'u kurar veya kaldırır; tüm sekmelere hemen yansır."""
+        settings = get_settings()
+        if not settings.CREATE_NODE_COMPLETER:
+            if self.completer is not None:
+                self.completer.popup().hide()
+                self.completer.activated.disconnect(self.insert_selected_to_cursor)
+                self.completer.deleteLater()
+                self.completer = None
+            return
+        if self.completer is None:
+            self.completer = self.build_completer()
+            if self.editor is not None:
+                self.completer.setWidget(self.editor)
+        self.completer.popup().setFont(QFont(settings.main_default_font, settings.main_font_size))
+
+    def build_completer(self):
+        completer = QCompleter(self.completerModel)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setCompletionMode(QCompleter.PopupCompletion)
+        completer.activated.connect(self.insert_selected_to_cursor)
 
         # Sağa yaslı kategori ve renkli item görünümü için delegate ayarlama
-        delegate = RightAlignedDelegate(self.category_colors, self.completer.popup())
-        self.completer.popup().setItemDelegate(delegate)
+        delegate = RightAlignedDelegate(self.category_colors, completer.popup())
+        completer.popup().setItemDelegate(delegate)
 
         # Popup için stil
-        popup = self.completer.popup()
+        popup = completer.popup()
         popup.setStyleSheet("""
             QListView {
                 background-color: #3a3a3a;
@@ -114,11 +130,17 @@ class createNodeCompleter(QObject):
             }
         """)
 
-        # `textChanged` sinyalini dinle ve `check_for_create_node` fonksiyonunu çağır
-        self.editor.textChanged.connect(self.check_for_create_node)
+        return completer
 
-        # İlk başta tüm listeyi göstermek için bayrak
-        self.show_all_nodes = False
+    def attach(self, editor):
+        """Tamamlayıcıyı verilen editöre bağlar. `textChanged` bağlantısını editör kendisi yapar."""
+        if self.editor is editor:
+            return
+        self.editor = editor
+        self.show_all_nodes = False  # İlk başta tüm listeyi göstermek için bayrak
+        if self.completer is not None:
+            self.completer.popup().hide()
+            self.completer.setWidget(editor)
 
     def load_list_nodes(self):
         """Node listesini JSON dosyasından yükle ve kategorileri ayır."""
@@ -135,6 +157,8 @@ class createNodeCompleter(QObject):
 
     def check_for_create_node(self):
         """nuke.createNode() ifadesini kontrol eder ve eşleşirse, girilen harfleri baz alarak filtreleme yapar."""
+        if self.completer is None or self.editor is None:
+            return  # Ayar kapalı ya da henüz bir editöre bağlanmadı
         cursor = self.editor.textCursor()
         line_text = cursor.block().text()
 
@@ -238,8 +262,6 @@ class createNodesCode(QObject):
         Opens a UI for creating nodes with advanced options.
         source: dialogs/crtNodeDialogs.py
         """
-        import editor.dialogs.crtNodeDialogs
-        importlib.reload(editor.dialogs.crtNodeDialogs)
         from editor.dialogs.crtNodeDialogs import show_nuke_node_creator
         show_nuke_node_creator()
 
@@ -248,8 +270,6 @@ class createNodesCode(QObject):
         Shows MacroBuilder dialog. This function creates dialog if it doesn't exist,
         otherwise brings existing dialog to front.
         """
-        import editor.dialogs.macroUIDialogs
-        importlib.reload(editor.dialogs.macroUIDialogs)
         from editor.dialogs.macroUIDialogs import show_panel_builder
         show_panel_builder()
 
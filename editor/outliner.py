@@ -0,0 +1,175 @@
+from PySide2.QtCore import Qt, QAbstractItemModel, QModelIndex, QSortFilterProxyModel
+
+
+class SymbolIndex:
+    """
+    Flat symbol array with a precomputed lowercase/trigram index for substring search.
+
+    Each symbol is stored once as (name, kind, parent), where `parent` is the symbol id of its group or -1
+    for top-level symbols. Queries of three or more characters intersect the trigram posting sets and only
+    verify the surviving candidates; shorter queries scan the lowercase array.
+    """
+
+    def __init__(self):
+        self.symbols = []
+        self.lowered = []
+        self.trigrams = {}
+
+    def add(self, name, kind, parent=-1):
+        """Yeni bir sembol ekler ve id'sini döndürür."""
+        symbol_id = len(self.symbols)
+        lowered = name.lower()
+        self.symbols.append((name, kind, parent))
+        self.lowered.append(lowered)
+        for i in range(len(lowered) - 2):
+            self.trigrams.setdefault(lowered[i:i + 3], set()).add(symbol_id)
+        return symbol_id
+
+    def match(self, text):
+        """Returns the ids of all symbols whose name contains `text` (case-insensitive)."""
+        text = text.lower()
+        if len(text) < 3:
+            return {i for i, lowered in enumerate(self.lowered) if text in lowered}
+
+        postings = [self.trigrams.get(text[i:i + 3]) for i in range(len(text) - 2)]
+        if not all(postings):
+            return set()
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        if len(text) == 3:
+            return candidates
+        return {i for i in candidates if text in self.lowered[i]}
+
+
+class OutlinerModel(QAbstractItemModel):
+    """
+    Two-level OUTLINER model (groups/classes and their members) backed by a `SymbolIndex`.
+
+    No per-row objects are created; the view only queries the rows it paints. Internal ids encode the
+    hierarchy: 0 for top-level rows, `top_row + 1` for their children.
+    """
+
+    def __init__(self, icons, parent=None):
+        super().__init__(parent)
+        self.icons = icons
+        self.index_ = SymbolIndex()
+        self.tops = []  # top-level symbol ids
+        self.children = []  # top row -> member symbol ids
+
+    # Veri ekleme
+    def add_group(self, name, kind, members, member_kind):
+        """
+        Adds a top-level row with members, or appends the members to an existing row of the same name.
+
+        Returns:
+            int: The top-level row of the group.
+        """
+        for row, symbol_id in enumerate(self.tops):
+            if self.index_.symbols[symbol_id][0] == name:
+                break
+        else:
+            row = len(self.tops)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.tops.append(self.index_.add(name, kind))
+            self.children.append([])
+            self.endInsertRows()
+
+        members = list(members)
+        if members:
+            parent_id = self.tops[row]
+            first = len(self.children[row])
+            self.beginInsertRows(self.createIndex(row, 0, 0), first, first + len(members) - 1)
+            self.children[row].extend(self.index_.add(member, member_kind, parent_id) for member in members)
+            self.endInsertRows()
+        return row
+
+    def add_classes(self, classes):
+        """(class_name, methods) listesini sınıf ve metot satırları olarak ekler."""
+        for class_name, methods in classes:
+            self.add_group(class_name, "Class", methods, "Method")
+
+    def all_names(self):
+        """Tüm sembol isimlerini döndürür."""
+        return [name for name, _, _ in self.index_.symbols]
+
+    def symbol_id(self, index):
+        """Returns the symbol id behind a model index, or None."""
+        if not index.isValid():
+            return None
+        top = index.internalId()
+        if top == 0:
+            return self.tops[index.row()]
+        return self.children[top - 1][index.row()]
+
+    # QAbstractItemModel arayüzü
+    def index(self, row, column, parent=QModelIndex()):
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            if row < len(self.tops):
+                return self.createIndex(row, column, 0)
+            return QModelIndex()
+        if parent.internalId() == 0 and row < len(self.children[parent.row()]):
+            return self.createIndex(row, column, parent.row() + 1)
+        return QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self.tops)
+        if parent.internalId() == 0:
+            return len(self.children[parent.row()])
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        symbol_id = self.symbol_id(index)
+        if symbol_id is None:
+            return None
+        name, kind, _ = self.index_.symbols[symbol_id]
+        if role == Qt.DisplayRole:
+            return name
+        if role == Qt.DecorationRole:
+            return self.icons.get(kind)
+        if role == Qt.UserRole:
+            return kind
+        return None
+
+
+class OutlinerFilterProxy(QSortFilterProxyModel):
+    """
+    Filters the OUTLINER through the model's `SymbolIndex` instead of comparing row texts.
+
+    A top-level row is kept when it or one of its members matches; members are kept only if they match.
+    The matching ids are computed once per filter text, so `filterAcceptsRow` is a set lookup.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.matches = None
+        self.groups = None
+
+    def set_filter_text(self, text):
+        """Filtre metnini ayarlar; boş metin tüm satırları gösterir."""
+        source = self.sourceModel()
+        if not text or source is None:
+            self.matches = self.groups = None
+        else:
+            self.matches = source.index_.match(text)
+            symbols = source.index_.symbols
+            self.groups = {symbols[i][2] if symbols[i][2] >= 0 else i for i in self.matches}
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self.matches is None:
+            return True
+        source = self.sourceModel()
+        if not source_parent.isValid():
+            return source.tops[source_row] in self.groups
+        return source.children[source_parent.row()][source_row] in self.matches
@@ -1,10 +1,17 @@
+import ast
+import builtins
+import ctypes
+import importlib.util
 import sys
+import sysconfig
+import threading
+import time
 import traceback
-import io
 import os
+from PySide2.QtCore import QObject, Signal, QCoreApplication, QTimer
 from PySide2.QtWidgets import QTextEdit
-from PySide2.QtGui import QFontDatabase, QFont
-from editor.core import PathFromOS
+from PySide2.QtGui import QFontDatabase, QFont, QTextCharFormat, QTextCursor, QColor
+from editor.core import PathFromOS, SettingsStore, get_settings
 import logging
 
 try:
@@ -32,67 +39,272 @@ class DebugLogger:
             self.logger.error(message)
         else:
             self.logger.info(message)
-def validate_code(code):
+
+
+class ExecutionCancelled(BaseException):
+    """
+    Raised inside running editor code when the user presses Stop.
+
+    Derives from BaseException, like KeyboardInterrupt, so `except Exception` blocks in the running code do
+    not swallow it.
+    """
+
+
+# Çalışan kodu GUI thread'i dışına taşıyabilen standart modüller; worker'a izin verilmez
+UNSAFE_STDLIB = {"importlib", "imp", "pkgutil", "runpy", "code", "codeop", "tkinter", "turtle", "idlelib", "ctypes"}
+# Modül yüklemeyi veya kodu gizleyebilen yerleşikler
+UNSAFE_BUILTINS = {"__import__", "__builtins__", "exec", "eval", "compile", "globals", "vars", "breakpoint"}
+
+
+def is_stdlib_module(name):
+    """True for modules of the standard library; installed packages and unknown names are False."""
+    if name in sys.builtin_module_names:
+        return True
+    names = getattr(sys, "stdlib_module_names", None)  # Python 3.10+
+    if names is not None:
+        return name in names
     try:
-        compile(code, "<string>", "exec")
-        return None
-    except SyntaxError as e:
-        return str(e)
-class SysOutputRedirector:
-    def __init__(self, output_widget):
-        self.output_widget = output_widget
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return False
+    if spec is None or not spec.origin:
+        return False
+    if spec.origin in ("built-in", "frozen"):
+        return True
+    origin = os.path.normcase(os.path.abspath(spec.origin))
+    stdlib = os.path.normcase(os.path.abspath(sysconfig.get_paths()["stdlib"]))
+    return origin.startswith(stdlib + os.sep) and "site-packages" not in origin
+
+
+def needs_main_thread(code):
+    """
+    Returns False only if the code provably needs nothing but the standard library (AST based).
+
+    Nuke API names, PySide2/Qt, third-party or studio modules, dynamic imports and exec/eval keep the
+    code on the main thread, like every code that can not be parsed.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return True
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and (node.id in ("nuke", "nukescripts") or node.id in UNSAFE_BUILTINS):
+            return True
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                return True  # Göreli içe aktarma: bilinmeyen paket
+            modules = [node.module or ""]
+        else:
+            continue
+        for module in modules:
+            top = module.split(".")[0]
+            if top in UNSAFE_STDLIB or not is_stdlib_module(top):
+                return True
+    return False
+
+
+class _EngineStream:
+    """
+    sys.stdout/sys.stderr replacement used while editor code runs.
+
+    Writes coming from the executing thread are collected and handed to the engine in line batches;
+    writes from any other thread go to the original stream untouched.
+    """
+
+    def __init__(self, engine, kind, original):
+        self.engine = engine
+        self.kind = kind
+        self.original = original
 
     def write(self, message):
-        if message.strip():
-            self.output_widget.append_output(message)
+        if threading.get_ident() != self.engine.thread_ident:
+            return self.original.write(message) if self.original else len(message)
+        self.engine.buffer_output(self.kind, message)
+        return len(message)
 
     def flush(self):
-        pass
+        if self.original and threading.get_ident() != self.engine.thread_ident:
+            self.original.flush()
 
-def execute_python_code(code, output_widget, debug_mode=False):
-    validation_error = validate_code(code)
-    if validation_error:
-        output_widget.append_error_output(f"Syntax Hatası: {validation_error}")
-        return
 
-    old_stdout = sys.stdout
-    sys.stdout = io.StringIO()
-
-    try:
-        exec(code, {'__builtins__': __builtins__}, {})
-        output = sys.stdout.getvalue()
-        output_widget.append_output(output)
-    except Exception as e:
-        error_message = traceback.format_exc()
-        output_widget.append_error_output(error_message)
-    finally:
-        sys.stdout = old_stdout
-
-def execute_nuke_code(code, output_widget):
+class ExecutionEngine(QObject):
     """
-    Executes the given Nuke code and directs the result to the output_widget.
+    Runs editor code without blocking the UI and streams its output.
+
+    Code runs on the main thread, like Nuke's own Script Editor, under a trace hook that periodically
+    flushes output and pumps the event loop, so the OUTPUT dock updates and Stop stays clickable. Only code
+    that provably needs nothing but the standard library (`needs_main_thread`) runs on a worker thread. Output is emitted as `output_ready(text, kind)` line
+    batches (kind is "output" or "error"), and `finished` reports wall and CPU time of the run.
     """
-    sys.stdout = SysOutputRedirector(output_widget)
-    sys.stderr = SysOutputRedirector(output_widget)
+    output_ready = Signal(str, str)  # text, "output" | "error"
+    finished = Signal(dict)  # {"status", "wall", "cpu", "main_thread"}
 
-    try:
-        # Run Nuke code
-        result = nuke.executeInMainThreadWithResult(lambda: exec(code))
-        if result is not None:
-            print(result)
-    except Exception as e:
-        # If an error occurs, write it to the Output with the Traceback.
-        error_message = traceback.format_exc()
-        output_widget.append_error_output(error_message)
-    finally:
-        sys.stdout = sys.__stdout__
-        sys.stderr = sys.__stderr__
+    flush_interval = 0.05  # saniye; çıktı en geç bu aralıkla gönderilir
+    filename = "<editor>"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.thread_ident = None
+        self.cancel_requested = False
+        self._buffer = []
+        self._buffer_kind = "output"
+        self._last_flush = 0.0
+        self._lock = threading.Lock()
+        self._cancel_lock = threading.Lock()
+
+    def is_running(self):
+        return self.thread_ident is not None
+
+    def run(self, code):
+        """
+        Starts executing `code`. Returns False if a run is already in progress.
+        """
+        if self.is_running():
+            return False
+        try:
+            compiled = compile(code, self.filename, "exec")
+        except SyntaxError as e:
+            self.output_ready.emit(f"Syntax Hatası: {e}", "error")
+            self.finished.emit({"status": "error", "wall": 0.0, "cpu": 0.0, "main_thread": True})
+            return True
+
+        namespace = {"__builtins__": builtins, "__name__": "__main__"}
+        if nuke is not None:
+            namespace.update(nuke=nuke, nukescripts=nukescripts)
+
+        self.cancel_requested = False
+        main_thread = needs_main_thread(code)
+        if main_thread:
+            self._execute(compiled, namespace, main_thread=True)
+        else:
+            worker = threading.Thread(target=self._execute, args=(compiled, namespace), daemon=True)
+            self.thread_ident = -1  # worker başlayana kadar meşgul
+            worker.start()
+        return True
+
+    def cancel(self):
+        """Requests cooperative cancellation of the running code."""
+        if not self.is_running():
+            return
+        self.cancel_requested = True
+        with self._cancel_lock:
+            ident = self.thread_ident
+            if ident and ident > 0 and ident != threading.main_thread().ident:
+                # Worker thread'e bir sonraki bytecode'da ExecutionCancelled fırlatılır
+                ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(ident),
+                                                           ctypes.py_object(ExecutionCancelled))
+
+    def buffer_output(self, kind, message):
+        """Çıktıyı tamponlar; tür değişince veya süre dolunca gönderir."""
+        with self._lock:
+            if self._buffer and kind != self._buffer_kind:
+                self._flush_locked(final=True)
+            self._buffer_kind = kind
+            self._buffer.append(message)
+            if time.perf_counter() - self._last_flush >= self.flush_interval:
+                self._flush_locked(final=False)
+
+    def flush_output(self, final=False):
+        with self._lock:
+            self._flush_locked(final)
+
+    def _flush_locked(self, final=True):
+        # Sadece tamamlanmış satırlar gönderilir; yarım satır bir sonraki gruba kalır
+        self._last_flush = time.perf_counter()
+        if not self._buffer:
+            return
+        text = "".join(self._buffer)
+        if not final:
+            cut = text.rfind("\n") + 1
+            text, rest = text[:cut], text[cut:]
+            self._buffer = [rest] if rest else []
+        else:
+            self._buffer = []
+        if text.strip():
+            self.output_ready.emit(text.rstrip("\n"), self._buffer_kind)
+
+    def _trace(self, frame, event, arg):
+        # Ana thread modunda: iptali kontrol et, çıktıyı gönder ve olay döngüsünü çalıştır
+        if self.cancel_requested:
+            raise ExecutionCancelled()
+        if time.perf_counter() - self._last_flush >= self.flush_interval:
+            self.flush_output()
+            QCoreApplication.processEvents()
+        if event == "call" and frame.f_code.co_filename != self.filename:
+            return None  # Kütüphane kodunu satır satır izleme
+        return self._trace
+
+    def _execute(self, compiled, namespace, main_thread=False):
+        self.thread_ident = threading.get_ident()
+        old_stdout, old_stderr = sys.stdout, sys.stderr
+        sys.stdout = _EngineStream(self, "output", old_stdout)
+        sys.stderr = _EngineStream(self, "error", old_stderr)
+        status = "ok"
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            try:
+                if self.cancel_requested:
+                    raise ExecutionCancelled()
+                if main_thread:
+                    sys.settrace(self._trace)
+                exec(compiled, namespace)
+            finally:
+                if main_thread:
+                    sys.settrace(None)
+                # Bundan sonra cancel() bu thread'e istisna göndermez
+                with self._cancel_lock:
+                    self.thread_ident = None
+        except ExecutionCancelled:
+            status = "cancelled"
+        except Exception:
+            status = "error"
+            _, error, tb = sys.exc_info()
+            # Motorun kendi çerçevesini traceback'ten çıkar
+            self.buffer_output("error", "".join(traceback.format_exception(type(error), error, tb.tb_next)))
+        finally:
+            wall, cpu = time.perf_counter() - wall_start, time.thread_time() - cpu_start
+            sys.stdout, sys.stderr = old_stdout, old_stderr
+            self.flush_output(final=True)
+            self.thread_ident = None
+        self.finished.emit({"status": status, "wall": wall, "cpu": cpu, "main_thread": main_thread})
 
 
 class OutputWidget(QTextEdit):
+    """
+    OUTPUT panel that buffers writes and flushes them in batches.
+
+    `write` and the `append_*` helpers only queue text; a short timer inserts everything queued since
+    the last flush with one cursor and pre-built QTextCharFormats (no HTML). The document keeps at most
+    `OUTPUT_MAX_BLOCKS` lines, dropping the oldest first, and the full log can be mirrored to
+    `OUTPUT_LOG_FILE`.
+    """
+    flush_interval = 30  # ms
+    padding = "  "
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.load_custom_font()
+        self.setUndoRedoEnabled(False)
+
+        self.formats = {}
+        for kind, color in (("output", QColor("white")), ("error", QColor("#fe8c86")), ("info", QColor("grey"))):
+            text_format = QTextCharFormat()
+            text_format.setForeground(color)
+            self.formats[kind] = text_format
+
+        self.pending = []  # (kind, [text parçaları])
+        self.owed_newline = False  # Son yazımın sonundaki "\n" henüz belgeye eklenmedi
+        self.log_file = None
+        self.log_path = None
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(self.flush_interval)
+        self.flush_timer.timeout.connect(self.flush)
+
+        self.apply_settings()
+        SettingsStore.instance().settings_changed.connect(self.apply_settings)
 
     def load_custom_font(self):
         font_path = os.path.join(PathFromOS().jet_fonts, 'JetBrainsMono-Regular.ttf')
@@ -102,24 +314,87 @@ class OutputWidget(QTextEdit):
         else:
             self.setFont(QFont("JetBrains Mono"))
 
+    def apply_settings(self):
+        """Satır sınırını ve log dosyasını ayarlardan uygular."""
+        settings = get_settings()
+        self.document().setMaximumBlockCount(max(0, int(settings.OUTPUT_MAX_BLOCKS)))
+        if settings.OUTPUT_LOG_FILE != self.log_path:
+            self.close_log_file()
+            self.log_path = settings.OUTPUT_LOG_FILE
+            if self.log_path:
+                try:
+                    self.log_file = open(self.log_path, "a", encoding="utf-8")
+                except OSError as e:
+                    print(f"Output log file could not be opened: {e}")
+                    self.log_file = None
+
+    def close_log_file(self):
+        if self.log_file is not None:
+            self.log_file.close()
+            self.log_file = None
+
+    def write(self, text, kind="output"):
+        """Ham metni tampona ekler (satır sonları korunur)."""
+        if not text:
+            return
+        if self.pending and self.pending[-1][0] == kind:
+            self.pending[-1][1].append(text)
+        else:
+            self.pending.append((kind, [text]))
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
     def append_output(self, message):
-        formatted_message = f'<pre style="color: white; font-family: \'JetBrains Mono\';">{self.add_padding(message)}</pre>'
-        self.append(formatted_message)
-        self.ensureCursorVisible()
+        self.append_line(message, "output")
 
     def append_error_output(self, message):
-        formatted_error = "".join(
-            f"<pre style='color: #fe8c86; font-family: \"JetBrains Mono\";'>{self.add_padding(line)}</pre>"
-            for line in message.split("\n")
-        )
-        self.append(formatted_error)
-        self.ensureCursorVisible()
+        self.append_line(message, "error")
 
     def append_info_output(self, message):
-        formatted_info = f'<pre style="color: grey; font-family: \'JetBrains Mono\';">{self.add_padding(message)}</pre>'
-        self.append(formatted_info)
-        self.ensureCursorVisible()
+        self.append_line(message, "info")
+
+    def append_line(self, message, kind):
+        """Mesajı yeni bir satırda başlatır."""
+        if self.pending:
+            line_open = not self.pending[-1][1][-1].endswith("\n")
+        else:
+            line_open = not self.owed_newline and not self.document().isEmpty()
+        self.write(("\n" if line_open else "") + message + "\n", kind)
+
+    def flush(self):
+        """Tampondaki tüm metni tek bir düzenleme bloğunda belgeye ekler."""
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, []
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for kind, parts in pending:
+            text = "".join(parts)
+            if self.log_file is not None:
+                self.log_file.write(text)
+            # Belgenin sonunda boş satır kalmaması için son "\n" bir sonraki yazıma ertelenir
+            if self.owed_newline:
+                text = "\n" + text
+            self.owed_newline = text.endswith("\n")
+            if self.owed_newline:
+                text = text[:-1]
+            text = text.replace("\n", "\n" + self.padding)
+            if cursor.position() == 0:
+                text = self.padding + text
+            cursor.insertText(text, self.formats[kind])
+        cursor.endEditBlock()
+        if self.log_file is not None:
+            self.log_file.flush()
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
 
-    def add_padding(self, message, spaces=2):
-        padding = '&nbsp;' * spaces
-        return padding + message
\ No newline at end of file
+    def clear(self):
+        self.pending = []
+        self.owed_newline = False
+        self.flush_timer.stop()
+        super().clear()
@@ -0,0 +1,116 @@
+import json
+import math
+import time
+from collections import deque
+from PySide2.QtCore import QObject
+from editor.core import SettingsStore, get_settings
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of an unsorted sequence, or None if it is empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class TypingProfiler(QObject):
+    """
+    Optional typing-latency profiler, enabled with Code Editor -> typing_profiler in the settings.
+
+    A keystroke is opened in `CodeEditor.keyPressEvent` and closed once the editor's IMMEDIATE change lane
+    has been delivered, so its latency covers the key handling, the synchronous highlighting and every
+    immediate change handler. Subsystems report their work with `add_span`. The last `capacity`
+    keystrokes and the last `capacity` calls of every subsystem are kept in ring buffers for percentiles
+    and Chrome-trace export; spans outside a keystroke (e.g. IDLE handlers) are kept separately.
+    """
+    # Sınıf niteliği yeniden atanmaz, sözlük güncellenir: bazı PySide2/Python eşleşmelerinde (ör. 5.13 ve 3.11)
+    # Shiboken tiplerine yapılan atama öznitelik önbelleğini geçersiz kılmaz ve eski değer okunmaya devam eder
+    _instances = {}
+    capacity = 2000
+
+    @classmethod
+    def instance(cls):
+        instance = cls._instances.get(cls)
+        if instance is None:
+            instance = cls._instances[cls] = cls()
+        return instance
+
+    def __init__(self):
+        super().__init__()
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.keys = deque(maxlen=self.capacity)  # (key, start, duration, spans)
+        self.spans = {}  # name -> süre ring buffer'ı
+        self.background = deque(maxlen=self.capacity)  # Tuş dışındaki (name, start, duration) span'leri
+        self.current = None  # Açık tuş: (key, start, spans)
+        self.apply_settings()
+        SettingsStore.instance().settings_changed.connect(self.apply_settings)
+
+    def apply_settings(self):
+        self.enabled = bool(get_settings().TYPING_PROFILER)
+        if not self.enabled:
+            self.current = None
+
+    def clear(self):
+        self.keys.clear()
+        self.spans.clear()
+        self.background.clear()
+        self.current = None
+
+    # Kayıt
+    def begin_key(self, key):
+        self.end_key()  # Önceki tuş henüz teslim edilmediyse burada kapanır
+        if self.enabled:
+            self.current = (key, time.perf_counter(), [])
+
+    def end_key(self):
+        current = self.current
+        if current is None:
+            return
+        self.current = None
+        key, start, spans = current
+        self.keys.append((key, start, time.perf_counter() - start, spans))
+
+    def add_span(self, name, start, duration):
+        """Records `duration` seconds of work by subsystem `name` that started at `start` (perf_counter)."""
+        if not self.enabled:
+            return
+        durations = self.spans.get(name)
+        if durations is None:
+            durations = self.spans[name] = deque(maxlen=self.capacity)
+        durations.append(duration)
+        (self.current[2] if self.current is not None else self.background).append((name, start, duration))
+
+    # Raporlama
+    def summary(self):
+        """
+        Returns:
+            dict: name -> (p50, p95, p99, count) in milliseconds; "keystroke" is the end-to-end latency.
+        """
+        rows = {"keystroke": [duration for _, _, duration, _ in self.keys]}
+        rows.update(self.spans)
+        result = {}
+        for name, durations in rows.items():
+            durations = list(durations)
+            if durations:
+                result[name] = tuple(percentile(durations, fraction) * 1000 for fraction in (0.5, 0.95, 0.99)) + \
+                               (len(durations),)
+        return result
+
+    def chrome_trace(self):
+        """Returns the recorded keystrokes and spans in Chrome trace event format (chrome://tracing, Perfetto)."""
+        def event(name, start, duration, tid, **args):
+            return {"name": name, "ph": "X", "pid": 1, "tid": tid, "ts": (start - self.origin) * 1e6,
+                    "dur": duration * 1e6, "args": args}
+
+        events = []
+        for key, start, duration, spans in self.keys:
+            events.append(event("keystroke", start, duration, 1, key=key))
+            events.extend(event(name, span_start, span_duration, 1) for name, span_start, span_duration in spans)
+        events.extend(event(name, start, duration, 2) for name, start, duration in self.background)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path):
+        with open(path, "w") as file:
+            json.dump(self.chrome_trace(), file)
@@ -0,0 +1,449 @@
+import bisect
+import difflib
+import os
+import re
+import time
+from PySide2.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+from PySide2.QtGui import QTextCursor
+from PySide2.QtWidgets import QTextEdit
+from editor.dispatcher import IDLE
+from editor.utf16 import Utf16Index
+
+# Proje aramasında taranan metin dosyası uzantıları
+SEARCH_EXTENSIONS = {'.py', '.txt', '.sh', '.cpp'}
+
+
+def build_pattern(term, regex=False, case_sensitive=False, whole_word=False):
+    """
+    Compiles a search term into a regular expression.
+
+    Raises:
+        re.error: If `regex` is set and the term is not a valid expression.
+    """
+    expression = term if regex else re.escape(term)
+    if whole_word:
+        expression = rf"\b(?:{expression})\b"
+    return re.compile(expression, 0 if case_sensitive else re.IGNORECASE)
+
+
+def search_text(pattern, text):
+    """
+    Searches a text line by line.
+
+    Returns:
+        list: (line, column, length, line_text) tuples, with 0-based line and column.
+    """
+    results = []
+    for line_number, line in enumerate(text.splitlines()):
+        for match in pattern.finditer(line):
+            if match.end() > match.start():
+                results.append((line_number, match.start(), match.end() - match.start(), line))
+    return results
+
+
+def path_key(path):
+    """Comparable form of a path: absolute and, on Windows, case and separator insensitive."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def project_files(documents, directory=None):
+    """
+    Collects the files of a project search.
+
+    Returns:
+        dict: path -> text for the open documents, plus path -> None for the text files of `directory`
+        that are not open.
+    """
+    paths = dict(documents)
+    open_keys = {path_key(path) for path in documents}
+    if directory and os.path.isdir(directory):
+        for root, dirs, files in os.walk(directory):
+            dirs[:] = [name for name in dirs if not name.startswith('.') and name != '__pycache__']
+            for name in files:
+                path = os.path.join(root, name)
+                if os.path.splitext(name)[1].lower() in SEARCH_EXTENSIONS and path_key(path) not in open_keys:
+                    paths[path] = None
+    return paths
+
+
+def replace_spans(pattern, text, replacement, regex=False):
+    """
+    Computes the replacement of every match in `text` in a single pass.
+
+    With `regex`, group references in `replacement` (\\1, \\g<name>) are expanded; otherwise it is used
+    literally.
+
+    Returns:
+        list: (start, end, new_text) spans in document order.
+
+    Raises:
+        re.error: If the replacement template references a missing group.
+    """
+    spans = []
+    for match in pattern.finditer(text):
+        if match.end() > match.start():
+            spans.append((match.start(), match.end(), match.expand(replacement) if regex else replacement))
+    return spans
+
+
+def apply_spans(text, spans):
+    """Returns `text` with the (start, end, new_text) spans replaced."""
+    parts = []
+    position = 0
+    for start, end, new_text in spans:
+        parts.append(text[position:start])
+        parts.append(new_text)
+        position = end
+    parts.append(text[position:])
+    return "".join(parts)
+
+
+def replace_in_editor(editor, text, spans, offset=0):
+    """
+    Applies (start, end, new_text) spans of `text` to an editor as minimal in-place edits.
+
+    The span indices of `text` are converted to document (UTF-16) positions. The edits run back to front
+    inside one edit block, so earlier positions stay valid, the whole replacement is a single undo step and
+    document listeners are notified once. `offset` is the document position where `text` starts (e.g. the
+    start of the replaced selection).
+    """
+    position = Utf16Index(text)
+    with editor.bulk_edit() as cursor:
+        for start, end, new_text in reversed(spans):
+            cursor.setPosition(offset + position(start))
+            cursor.setPosition(offset + position(end), QTextCursor.KeepAnchor)
+            cursor.insertText(new_text)
+    return len(spans)
+
+
+class DocumentSearch(QObject):
+    """
+    Streaming search over the document of one editor.
+
+    Blocks are scanned in time-sliced chunks on the main thread and `progress` reports the running count
+    after every chunk. Matches are kept as exact (start, end) document positions in document order, so
+    navigation is a bisect plus `setPosition`. An edit stops the scan and the search restarts once typing
+    pauses (the editor's IDLE change lane); `cancel` stops it. Matches never span lines.
+    """
+    progress = Signal(int)
+    finished = Signal(int)
+    chunk_budget = 0.01  # Bir dilimde harcanacak en fazla süre (saniye)
+    max_highlights = 1000  # İmleç çevresinde vurgulanan en fazla eşleşme
+
+    def __init__(self, editor):
+        super().__init__(editor)
+        self.editor = editor
+        self.pattern = None
+        self.highlight_format = None
+        self.matches = []
+        self.block = None
+        self.scanning = False
+        self.clear_pending = False  # Vurgular bir sonraki imleç hareketinde silinecek
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.scan_chunk)
+        # Düzenleme taramayı hemen durdurur, yazma durunca arama yeniden başlar
+        editor.changes.register("search_stop", self.on_contents_changed)
+        editor.changes.register("search", lambda change: self.restart(), IDLE)
+
+    def start(self, pattern, highlight_format=None):
+        """Starts a new search; `highlight_format` also highlights the matches when the scan finishes."""
+        self.keep_highlights()
+        self.pattern = pattern
+        self.highlight_format = highlight_format
+        self.restart()
+
+    def restart(self):
+        if self.pattern is None:
+            return
+        self.matches = []
+        self.block = self.editor.document().firstBlock()
+        self.scanning = True
+        self.timer.start()
+
+    def on_contents_changed(self, change):
+        self.timer.stop()
+
+    def cancel(self):
+        """Taramayı durdurur; düzenlemeler artık aramayı yeniden başlatmaz."""
+        self.timer.stop()
+        self.pattern = None
+        self.scanning = False
+
+    def release(self):
+        """
+        Ends the search when its dialog closes.
+
+        The scan stops, and the highlights stay until the cursor moves next (typing moves it too).
+        """
+        self.cancel()
+        if not self.clear_pending and self.editor.selection_layers.get("search"):
+            self.clear_pending = True
+            self.editor.cursorPositionChanged.connect(self.clear_highlights)
+
+    def keep_highlights(self):
+        if self.clear_pending:
+            self.clear_pending = False
+            self.editor.cursorPositionChanged.disconnect(self.clear_highlights)
+
+    def clear_highlights(self):
+        self.keep_highlights()
+        self.matches = []
+        self.editor.selection_layers.clear("search")
+
+    def scan_chunk(self):
+        pattern = self.pattern
+        matches = self.matches
+        block = self.block
+        deadline = time.perf_counter() + self.chunk_budget
+        while block.isValid():
+            position = block.position()
+            text = block.text()
+            offset = Utf16Index(text)  # str indeksleri -> belge (UTF-16) konumları
+            for match in pattern.finditer(text):
+                if match.end() > match.start():
+                    matches.append((position + offset(match.start()), position + offset(match.end())))
+            block = block.next()
+            if time.perf_counter() >= deadline:
+                break
+        self.block = block
+        if block.isValid():
+            self.progress.emit(len(matches))
+            self.timer.start()
+            return
+        self.scanning = False
+        if self.highlight_format is not None:
+            self.highlight(self.editor.textCursor().position())
+        self.finished.emit(len(matches))
+
+    # Gezinme
+    def next_index(self, position):
+        """Index of the first match starting at or after `position` (wrapping), or -1."""
+        if not self.matches:
+            return -1
+        index = bisect.bisect_left(self.matches, (position,))
+        return index if index < len(self.matches) else 0
+
+    def previous_index(self, position):
+        """Index of the last match starting before `position` (wrapping), or -1."""
+        if not self.matches:
+            return -1
+        return (bisect.bisect_left(self.matches, (position,)) - 1) % len(self.matches)
+
+    def select(self, index):
+        """Eşleşmeyi editörde seçer ve seçili imleci döndürür."""
+        last = self.editor.document().characterCount() - 1
+        start, end = (min(position, last) for position in self.matches[index])  # Yeniden tarama bekliyor olabilir
+        cursor = self.editor.textCursor()
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        self.editor.setTextCursor(cursor)
+        return cursor
+
+    def highlight(self, position):
+        """Highlights at most `max_highlights` matches around `position` in the editor's search layer."""
+        document = self.editor.document()
+        first = max(0, bisect.bisect_left(self.matches, (position,)) - self.max_highlights // 2)
+        selections = []
+        last = document.characterCount() - 1
+        for start, end in self.matches[first:first + self.max_highlights]:
+            if end > last:
+                break
+            cursor = QTextCursor(document)
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = cursor
+            selection.format = self.highlight_format
+            selections.append(selection)
+        self.editor.selection_layers.set("search", selections)
+
+
+class _FileSearchTask(QRunnable):
+    """Bir dosyayı (ya da açık bir belgenin anlık metnini) worker thread üzerinde arar."""
+
+    def __init__(self, signal, generation, path, text, pattern):
+        super().__init__()
+        self.signal = signal
+        self.generation = generation
+        self.path = path
+        self.text = text
+        self.pattern = pattern
+
+    def run(self):
+        text = self.text
+        if text is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8', errors='replace') as file:
+                    text = file.read()
+            except OSError:
+                text = ""
+        self.signal.emit(self.generation, self.path, search_text(self.pattern, text))
+
+
+class ProjectSearch(QObject):
+    """
+    Searches open documents and project files on the global QThreadPool.
+
+    Open documents are searched from a snapshot of their current text and take precedence over the same
+    file on disk. `file_matches` is emitted for every file with results as soon as it is searched, and
+    `finished` once every file has reported. Starting a new search drops the results of the previous one.
+    """
+    file_matches = Signal(str, object)  # path, [(line, column, length, line_text), ...]
+    finished = Signal(int, int)  # eşleşen dosya sayısı, toplam eşleşme
+    _searched = Signal(int, str, object)  # worker -> ana thread
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+        self.remaining = 0
+        self.file_count = 0
+        self.match_count = 0
+        self._searched.connect(self._on_searched)
+
+    def start(self, pattern, documents, directory=None):
+        """
+        Args:
+            pattern: Compiled pattern from `build_pattern`.
+            documents (dict): path -> current text of the open documents.
+            directory (str): Project directory whose files are searched as well, or None.
+        """
+        self.generation += 1
+        self.remaining = self.file_count = self.match_count = 0
+        pool = QThreadPool.globalInstance()
+        for path, text in project_files(documents, directory).items():
+            self.remaining += 1
+            pool.start(_FileSearchTask(self._searched, self.generation, path, text, pattern))
+        if not self.remaining:
+            self.finished.emit(0, 0)
+
+    def cancel(self):
+        self.generation += 1
+
+    def _on_searched(self, generation, path, results):
+        if generation != self.generation:
+            return  # Önceki aramaya ait sonuç
+        self.remaining -= 1
+        if results:
+            self.file_count += 1
+            self.match_count += len(results)
+            self.file_matches.emit(path, results)
+        if not self.remaining:
+            self.finished.emit(self.file_count, self.match_count)
+
+
+class _FileReplaceTask(QRunnable):
+    """Bir dosyadaki değişiklikleri ve önizleme diff'ini worker thread üzerinde hesaplar."""
+
+    def __init__(self, signal, generation, path, text, pattern, replacement, regex):
+        super().__init__()
+        self.signal = signal
+        self.generation = generation
+        self.path = path
+        self.text = text
+        self.pattern = pattern
+        self.replacement = replacement
+        self.regex = regex
+
+    def run(self):
+        text = self.text
+        if text is None:
+            try:
+                # newline='' satır sonlarını korur; çözülemeyen dosyalar değiştirilmez
+                with open(self.path, 'r', encoding='utf-8', newline='') as file:
+                    text = file.read()
+            except (OSError, UnicodeDecodeError):
+                self.signal.emit(self.generation, self.path, None, None, None, "skipped (unreadable or not UTF-8)")
+                return
+        try:
+            spans = replace_spans(self.pattern, text, self.replacement, self.regex)
+        except re.error as e:
+            self.signal.emit(self.generation, self.path, None, None, None, str(e))
+            return
+        if not spans:
+            self.signal.emit(self.generation, self.path, None, None, None, "")
+            return
+        new_text = apply_spans(text, spans)
+        diff = "".join(difflib.unified_diff(text.splitlines(True), new_text.splitlines(True), self.path, self.path))
+        self.signal.emit(self.generation, self.path, text, spans, new_text, diff)
+
+
+class ProjectReplace(QObject):
+    """
+    Replace-in-files over open documents and project files, computed on the global QThreadPool.
+
+    `file_ready` delivers the unified diff of every file that would change, so the caller can show a
+    preview; nothing is modified until `apply`. Open documents are edited in place through
+    `replace_in_editor` (one undo step each), other files are rewritten with their line endings preserved.
+    """
+    file_ready = Signal(str, str)  # path, unified diff
+    finished = Signal(int, int)  # değişecek dosya sayısı, toplam değişiklik
+    _computed = Signal(int, str, object, object, object, str)  # worker -> ana thread
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+        self.remaining = 0
+        self.results = {}  # path -> (text, spans, new_text)
+        self.errors = []
+        self._computed.connect(self._on_computed)
+
+    def start(self, pattern, replacement, documents, directory=None, regex=False):
+        """
+        Args:
+            pattern: Compiled pattern from `build_pattern`.
+            replacement (str): Replacement text (a template when `regex` is set).
+            documents (dict): path -> current text of the open documents.
+            directory (str): Project directory whose files are included as well, or None.
+        """
+        self.generation += 1
+        self.remaining = 0
+        self.results = {}
+        self.errors = []
+        pool = QThreadPool.globalInstance()
+        for path, text in project_files(documents, directory).items():
+            self.remaining += 1
+            pool.start(_FileReplaceTask(self._computed, self.generation, path, text, pattern, replacement, regex))
+        if not self.remaining:
+            self.finished.emit(0, 0)
+
+    def cancel(self):
+        self.generation += 1
+
+    def _on_computed(self, generation, path, text, spans, new_text, message):
+        if generation != self.generation:
+            return  # Önceki isteğe ait sonuç
+        self.remaining -= 1
+        if spans:
+            self.results[path] = (text, spans, new_text)
+            self.file_ready.emit(path, message)
+        elif message:
+            self.errors.append(f"{path}: {message}")
+        if not self.remaining:
+            self.finished.emit(len(self.results), sum(len(spans) for _, spans, _ in self.results.values()))
+
+    def apply(self, editors):
+        """
+        Applies the previewed replacements.
+
+        Args:
+            editors (dict): path -> open editor; these are edited in place instead of on disk.
+
+        Returns:
+            list: Error messages of files that could not be written.
+        """
+        errors = []
+        editors = {path_key(path): editor for path, editor in editors.items()}
+        for path, (text, spans, new_text) in self.results.items():
+            editor = editors.get(path_key(path))
+            if editor is not None:
+                replace_in_editor(editor, text, spans)
+                continue
+            try:
+                with open(path, 'w', encoding='utf-8', newline='') as file:
+                    file.write(new_text)
+            except OSError as e:
+                errors.append(f"{path}: {e}")
+        self.results = {}
+        return errors
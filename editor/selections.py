@@ -0,0 +1,106 @@
+import re
+from PySide2.QtCore import QObject, QTimer
+from PySide2.QtGui import QColor, QTextCharFormat, QTextCursor
+from PySide2.QtWidgets import QTextEdit
+from editor.utf16 import Utf16Index
+
+
+class SelectionLayers:
+    """
+    Composes an editor's extra selections from named layers.
+
+    Each feature (current line, clicked line, occurrences, search results) owns one layer and only replaces
+    that layer; the editor receives the layers concatenated in `order`, so later layers are painted on top.
+    """
+    order = ("current_line", "clicked_line", "occurrences", "search")
+
+    def __init__(self, editor):
+        self.editor = editor
+        self.layers = {}
+
+    def get(self, name):
+        return self.layers.get(name, [])
+
+    def set(self, name, selections):
+        """Bir katmanın seçimlerini değiştirir ve editöre uygular."""
+        selections = list(selections)
+        if not selections and not self.layers.get(name):
+            return  # Boş katman yine boş: değişiklik yok
+        self.layers[name] = selections
+        self.apply()
+
+    def clear(self, name):
+        self.set(name, [])
+
+    def apply(self):
+        composed = []
+        for name in self.order:
+            composed.extend(self.layers.get(name, ()))
+        self.editor.setExtraSelections(composed)
+
+
+class OccurrenceHighlighter(QObject):
+    """
+    Debounced highlighting of the occurrences of the selected text.
+
+    Only the visible blocks plus `margin` blocks above and below are searched, at most `max_occurrences`
+    decorations are created, and the pass is repeated when the view scrolls. Matching is case-insensitive
+    like `QTextDocument.find` without flags.
+    """
+    delay = 150  # ms
+    margin = 200  # Görünür alanın üstünde/altında aranan blok sayısı
+    max_occurrences = 500
+
+    def __init__(self, editor, layers):
+        super().__init__(editor)
+        self.editor = editor
+        self.layers = layers
+        self.term = ""
+        self.format = QTextCharFormat()
+        self.format.setBackground(QColor(125, 81, 0))
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(self.delay)
+        self.timer.timeout.connect(self.update_occurrences)
+        editor.cursorPositionChanged.connect(self.timer.start)
+        editor.verticalScrollBar().valueChanged.connect(self.schedule_scroll)
+
+    def schedule_scroll(self, *args):
+        """Kaydırmada yalnızca vurgulanan bir metin varsa yeniden arar."""
+        if self.term:
+            self.timer.start()
+
+    def update_occurrences(self):
+        text = self.editor.textCursor().selectedText()
+        if len(text) < 2 or "\u2029" in text:
+            self.term = ""
+            self.layers.clear("occurrences")
+            return
+        self.term = text
+
+        editor = self.editor
+        document = editor.document()
+        first = editor.firstVisibleBlock().blockNumber()
+        lines = editor.viewport().height() // max(1, editor.fontMetrics().height()) + 1
+        last = first + lines + self.margin
+        pattern = re.compile(re.escape(text), re.IGNORECASE)
+
+        selections = []
+        block = document.findBlockByNumber(max(0, first - self.margin))
+        while block.isValid() and block.blockNumber() <= last and len(selections) < self.max_occurrences:
+            position = block.position()
+            line = block.text()
+            offset = Utf16Index(line)  # str indeksleri -> belge (UTF-16) konumları
+            for match in pattern.finditer(line):
+                cursor = QTextCursor(document)
+                cursor.setPosition(position + offset(match.start()))
+                cursor.setPosition(position + offset(match.end()), QTextCursor.KeepAnchor)
+                selection = QTextEdit.ExtraSelection()
+                selection.cursor = cursor
+                selection.format = self.format
+                selections.append(selection)
+                if len(selections) >= self.max_occurrences:
+                    break
+            block = block.next()
+        self.layers.set("occurrences", selections)
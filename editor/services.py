@@ -0,0 +1,43 @@
+from editor.completer import Completer
+from nodes.crtNode import createNodeCompleter
+
+
+class EditorServices:
+    """
+    Application-level registry of the heavy editor components shared by every tab.
+
+    One `Completer` (QCompleter, popup, delegate, description bar) and one `createNodeCompleter`
+    (node list loaded once from nodeList.json) serve all editors; they are re-bound to whichever editor
+    is being typed in with `attach`. Per-editor state such as the cursor, the document and its symbol
+    table stays on the editor itself.
+    """
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self._completer = None
+        self._node_completer = None
+
+    @property
+    def completer(self):
+        """Ortak kod tamamlayıcı (ilk kullanımda oluşturulur)."""
+        if self._completer is None:
+            self._completer = Completer()
+        return self._completer
+
+    @property
+    def node_completer(self):
+        """Ortak `nuke.createNode` tamamlayıcı (ilk kullanımda oluşturulur)."""
+        if self._node_completer is None:
+            self._node_completer = createNodeCompleter()
+        return self._node_completer
+
+    def attach(self, editor):
+        """Ortak bileşenleri verilen editöre bağlar."""
+        self.completer.attach(editor)
+        self.node_completer.attach(editor)
@@ -18,10 +18,7 @@ from PySide2.QtGui import QFontDatabase, QFont
 import os
 import time
 import re
-import importlib
-import editor.settings.settings_ux
 from editor.settings import settings_ux
-importlib.reload(editor.settings.settings_ux)
 
 
 class ProcessManager(QThread):
@@ -141,7 +138,7 @@ class SettingsWindow(QMainWindow):
 
         # Category List
         self.category_list = QListWidget()
-        self.category_list.addItems(["General", "Code Editor", "Environment", "Licence", "Github", "Other Apps"])
+        self.category_list.addItems(["General", "Code Editor", "Environment", "Licence", "Github", "Other Apps", "Output"])
         self.category_list.currentRowChanged.connect(self.display_category)
 
         # Setting Panels for Each Category
@@ -152,6 +149,7 @@ class SettingsWindow(QMainWindow):
         self.settings_panels.addWidget(self.licence_settings())
         self.settings_panels.addWidget(self.github_settings())
         self.settings_panels.addWidget(self.other_apps_settings())
+        self.settings_panels.addWidget(self.output_settings())
 
         # Apply, OK, Cancel Buttons
         button_box = QDialogButtonBox(QDialogButtonBox.Reset | QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -276,6 +274,21 @@ class SettingsWindow(QMainWindow):
         start_group.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         layout.addWidget(start_group)
 
+        # Developer
+        developer_group = QGroupBox("Developer")
+        developer_layout = QVBoxLayout()
+        hot_reload_checkbox = QCheckBox("Hot reload editor modules on open")
+        hot_reload_checkbox.setObjectName("dev_hot_reload")
+        hot_reload_description = QLabel("Re-executes the editor's modules each time the IDE is opened from the menu and "
+                                        "opens a new window with the fresh code. Only for editing the IDE itself.")
+        hot_reload_description.setStyleSheet("color: Grey;")
+        hot_reload_description.setWordWrap(True)
+        developer_layout.addWidget(hot_reload_checkbox)
+        developer_layout.addWidget(hot_reload_description)
+        developer_group.setLayout(developer_layout)
+        developer_group.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        layout.addWidget(developer_group)
+
         # UI Settings Group for Code Editor Default Interface
         ui_settings_group = QGroupBox("UI Settings")
         ui_settings_layout = QFormLayout()
@@ -605,6 +618,25 @@ class SettingsWindow(QMainWindow):
         disable_node_completer_checkbox.setObjectName("disable_node_completer")
         extra_layout.addRow(disable_node_completer_checkbox)  # Disable Fuzzy Completion altına ekle
 
+        # Büyük dosyalar için tembel renklendirme eşiği
+        lazy_highlight_spinbox = QSpinBox()
+        lazy_highlight_spinbox.setObjectName("lazy_highlight_threshold")
+        lazy_highlight_spinbox.setRange(0, 102400)
+        lazy_highlight_spinbox.setValue(256)
+        lazy_highlight_spinbox.setSuffix(" KB")
+        lazy_highlight_spinbox.setToolTip("Files larger than this are highlighted around the visible area first "
+                                          "and in the background afterwards. 0 disables lazy highlighting.")
+        extra_layout.addRow("Lazy Highlighting Above:", lazy_highlight_spinbox)
+
+        # Yazma gecikmesi profili (durum çubuğunda p50/p95/p99)
+        typing_profiler_checkbox = QCheckBox("Typing Latency Profiler")
+        typing_profiler_checkbox.setChecked(False)
+        typing_profiler_checkbox.setObjectName("typing_profiler")
+        typing_profiler_checkbox.setToolTip("Measures every keystroke through the highlighter, completer, ghosting, "
+                                            "node completer, header and status bar. Click the status bar readout "
+                                            "to export a Chrome trace.")
+        extra_layout.addRow(typing_profiler_checkbox)
+
         # Slot fonksiyonunu tanımla
         def toggle_dependent_checkboxes(state):
             # Disable diğer checkbox'ları, eğer disable_smart_compilation işaretli değilse
@@ -1483,6 +1515,54 @@ class SettingsWindow(QMainWindow):
         panel.setLayout(layout)
         return panel
 
+    def output_settings(self):
+        panel = QWidget()
+        layout = QVBoxLayout()
+
+        output_group = QGroupBox("Output Panel")
+        output_layout = QFormLayout()
+
+        # OUTPUT belgesinde tutulan en fazla satır; eskiler baştan atılır
+        max_block_spinbox = QSpinBox()
+        max_block_spinbox.setObjectName("max_block_count")
+        max_block_spinbox.setRange(0, 10000000)
+        max_block_spinbox.setSingleStep(1000)
+        max_block_spinbox.setValue(10000)
+        max_block_spinbox.setSpecialValueText("Unlimited")
+        max_block_spinbox.setToolTip("Oldest lines are dropped from the OUTPUT panel above this count. "
+                                     "0 keeps every line.")
+        output_layout.addRow("Maximum Lines:", max_block_spinbox)
+
+        # Tüm çıktının ayrıca yazıldığı dosya; boşsa kapalı
+        log_file_layout = QHBoxLayout()
+        log_file_input = QLineEdit()
+        log_file_input.setObjectName("log_file")
+        log_file_input.setPlaceholderText("No log file")
+        log_file_input.setToolTip("Every output line is also appended to this file, including dropped ones.")
+        browse_button = QPushButton("...")
+        browse_button.setFixedWidth(30)
+
+        def browse_log_file():
+            file_name, _ = QFileDialog.getSaveFileName(self, "Output Log File", log_file_input.text(),
+                                                       "Log Files (*.log *.txt);;All Files (*)")
+            if file_name:
+                log_file_input.setText(file_name)
+
+        browse_button.clicked.connect(browse_log_file)
+        log_file_layout.addWidget(log_file_input)
+        log_file_layout.addWidget(browse_button)
+        output_layout.addRow("Log File:", log_file_layout)
+
+        output_group.setLayout(output_layout)
+        layout.addWidget(output_group)
+
+        # Add spacer to push Groups upward
+        spacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+        layout.addItem(spacer)
+
+        panel.setLayout(layout)
+        return panel
+
     def load_licence_file(self):
         file_name, _ = QFileDialog.getOpenFileName(self, "Load License File", "", "License Files (*.lic)")
         if file_name:
@@ -1512,6 +1592,7 @@ class SettingsWindow(QMainWindow):
         - 3: Licence
         - 4: GitHub
         - 5: Other Apps
+        - 6: Output
         """
 
         # General Panel
@@ -1563,9 +1644,19 @@ class SettingsWindow(QMainWindow):
         for widget in other_apps_panel.findChildren(QLabel):
             widget.setText(other_apps_data.get(widget.objectName(), widget.text()))
 
+        # Output Panel
+        output_panel = self.settings_panels.widget(6)
+        output_data = self.settings.get("Output", {})
+        for widget in output_panel.findChildren(QSpinBox):
+            widget.setValue(output_data.get(widget.objectName(), widget.value()))
+        for widget in output_panel.findChildren(QLineEdit):
+            if not isinstance(widget.parent(), QSpinBox):  # spinbox'ın iç line edit'i atlanır
+                widget.setText(output_data.get(widget.objectName(), widget.text()))
+
     def to_json(self):
         """Saves the current state of all widgets to the settings file."""
-        settings_data = {}
+        # Penceredeki widget'larla gösterilmeyen bölümler ve anahtarlar dosyada korunur
+        settings_data = {section: dict(values) for section, values in self.settings.items()}
 
         # General Settings
         general_data = {}
@@ -1576,7 +1667,7 @@ class SettingsWindow(QMainWindow):
         for widget in general_panel.findChildren(QComboBox):  # QComboBox'ları ekleyin
             if widget.objectName():
                 general_data[widget.objectName()] = widget.currentText()  # Seçili metni al
-        settings_data["General"] = general_data
+        settings_data.setdefault("General", {}).update(general_data)
 
         # Code Editor Settings
         code_editor_data = {}
@@ -1590,7 +1681,7 @@ class SettingsWindow(QMainWindow):
         for widget in code_editor_panel.findChildren(QCheckBox):
             if widget.objectName():
                 code_editor_data[widget.objectName()] = widget.isChecked()
-        settings_data["Code Editor"] = code_editor_data
+        settings_data.setdefault("Code Editor", {}).update(code_editor_data)
 
         # Environment Settings
         environment_data = {}
@@ -1601,7 +1692,7 @@ class SettingsWindow(QMainWindow):
         for widget in environment_panel.findChildren(QLineEdit):
             if widget.objectName():
                 environment_data[widget.objectName()] = widget.text()
-        settings_data["Environment"] = environment_data
+        settings_data.setdefault("Environment", {}).update(environment_data)
 
         # Licence Settings
         licence_data = {}
@@ -1609,7 +1700,7 @@ class SettingsWindow(QMainWindow):
         for widget in licence_panel.findChildren(QLineEdit):
             if widget.objectName():
                 licence_data[widget.objectName()] = widget.text()
-        settings_data["Licence"] = licence_data
+        settings_data.setdefault("Licence", {}).update(licence_data)
 
         # GitHub Settings
         github_data = {}
@@ -1617,7 +1708,7 @@ class SettingsWindow(QMainWindow):
         for widget in github_panel.findChildren(QLineEdit):
             if widget.objectName():
                 github_data[widget.objectName()] = widget.text()
-        settings_data["Github"] = github_data
+        settings_data.setdefault("Github", {}).update(github_data)
 
         # Other Apps Settings
         other_apps_data = {}
@@ -1625,14 +1716,30 @@ class SettingsWindow(QMainWindow):
         for widget in other_apps_panel.findChildren(QLabel):
             if widget.objectName():
                 other_apps_data[widget.objectName()] = widget.text()
-        settings_data["Other Apps"] = other_apps_data
+        settings_data.setdefault("Other Apps", {}).update(other_apps_data)
+
+        # Output Settings
+        output_data = {}
+        output_panel = self.settings_panels.widget(6)
+        for widget in output_panel.findChildren(QSpinBox):
+            if widget.objectName():
+                output_data[widget.objectName()] = widget.value()
+        for widget in output_panel.findChildren(QLineEdit):
+            if widget.objectName() and not isinstance(widget.parent(), QSpinBox):
+                output_data[widget.objectName()] = widget.text()
+        settings_data.setdefault("Output", {}).update(output_data)
 
         # Save JSON to file
         with open(self.SETTINGS_FILE, "w", encoding="utf-8") as file:
             json.dump(settings_data, file, indent=4, ensure_ascii=False)
 
+        self.settings = settings_data
         print(f"Settings saved to {self.SETTINGS_FILE}")
 
+        # Açık editörlerin önbelleğe alınmış ayarları yenilemesi için
+        from editor.core import SettingsStore
+        SettingsStore.instance().reload()
+
 
 def launch_settings():
     app = QApplication.instance()
@@ -0,0 +1,90 @@
+import ast
+from PySide2.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+
+def parse_outline(code):
+    """
+    Parses Python code into a flat class/function outline for the HEADER dock.
+
+    Returns:
+        list: (kind, name, lineno, methods) tuples in `ast.walk` order, where `methods` is a tuple of
+        (name, lineno) pairs for classes and empty for functions. None if the code does not parse.
+    """
+    try:
+        tree = ast.parse(code)
+    except (SyntaxError, ValueError):
+        return None
+
+    outline = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            methods = tuple((sub_node.name, sub_node.lineno) for sub_node in node.body
+                            if isinstance(sub_node, ast.FunctionDef))
+            outline.append(("Class", node.name, node.lineno, methods))
+        elif isinstance(node, ast.FunctionDef):
+            outline.append(("Function", node.name, node.lineno, ()))
+    return outline
+
+
+class _ParseTask(QRunnable):
+    """Worker thread üzerinde metni parse eder ve sonucu ana thread'e sinyal ile gönderir."""
+
+    def __init__(self, signal, editor, revision, code):
+        super().__init__()
+        self.signal = signal
+        self.editor = editor
+        self.revision = revision
+        self.code = code
+
+    def run(self):
+        self.signal.emit(self.editor, self.revision, parse_outline(self.code))
+
+
+class StructureService(QObject):
+    """
+    Debounced, off-thread structure parser for the HEADER dock.
+
+    `schedule` restarts a single-shot timer on every keystroke; once typing pauses the document text is
+    parsed on the global QThreadPool. Results are tagged with `QTextDocument.revision()` and dropped if
+    the document has changed since. When the code does not parse, the editor's own last good outline is
+    re-emitted so the HEADER keeps showing it, or an empty outline if that editor never parsed.
+    """
+    outline_ready = Signal(object, object)  # editor, outline
+    _parsed = Signal(object, int, object)  # worker -> ana thread
+
+    def __init__(self, parent=None, delay=300):
+        super().__init__(parent)
+        self.editor = None
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self._start_parse)
+        self._parsed.connect(self._on_parsed)
+
+    def schedule(self, editor):
+        """Yazma durduğunda `editor` için yeniden parse planlar."""
+        self.editor = editor
+        self.timer.start()
+
+    def _start_parse(self):
+        editor = self.editor
+        if editor is None:
+            return
+        document = editor.document()
+        QThreadPool.globalInstance().start(
+            _ParseTask(self._parsed, editor, document.revision(), document.toPlainText()))
+
+    def _on_parsed(self, editor, revision, outline):
+        if editor is not self.editor:
+            return
+        try:
+            if editor.document().revision() != revision:
+                return  # Eski sonuç; daha yeni bir parse planlandı
+        except RuntimeError:
+            return  # Sekme kapatıldı ve editör silindi
+        if outline is None:
+            # Yalnızca bu editörün son geçerli outline'ı; hiç parse edilmediyse HEADER boşalır
+            outline = getattr(editor, "last_header_outline", [])
+        else:
+            editor.last_header_outline = outline
+        self.outline_ready.emit(editor, outline)
@@ -0,0 +1,83 @@
+import re
+from collections import Counter
+
+IDENTIFIER_PATTERN = re.compile(r'\b[a-zA-Z_][a-zA-Z_0-9]*\b')
+
+
+def scan_identifiers(text):
+    """Metindeki tüm tanımlayıcıları (değişken, fonksiyon ve sınıf adları) sayılarıyla döndürür."""
+    return Counter(IDENTIFIER_PATTERN.findall(text))
+
+
+class DocumentSymbolIndex:
+    """
+    Identifier table of a single document, kept up to date block by block.
+
+    Each block (line) keeps a Counter of the identifiers it contains and the index keeps the total
+    reference count per identifier, so a name disappears as soon as its last occurrence is deleted.
+    The editor feeds it the coalesced document changes and only the touched blocks are re-scanned.
+    """
+
+    def __init__(self):
+        self.blocks = [Counter()]  # Boş bir belgede tek bir boş blok vardır
+        self.counts = Counter()
+        self.buckets = {}  # İlk harf (küçük) -> isim kümesi
+
+    def __len__(self):
+        return len(self.counts)
+
+    def __contains__(self, name):
+        return name in self.counts
+
+    def apply_change(self, first, old_last, new_lines):
+        """
+        Replaces blocks `first..old_last` (inclusive, old numbering) with the given line texts.
+        """
+        for block in self.blocks[first:old_last + 1]:
+            for name, count in block.items():
+                remaining = self.counts[name] - count
+                if remaining > 0:
+                    self.counts[name] = remaining
+                else:
+                    del self.counts[name]
+                    bucket = self.buckets[name[:1].lower()]
+                    bucket.discard(name)
+                    if not bucket:
+                        del self.buckets[name[:1].lower()]
+
+        new_blocks = [scan_identifiers(line) for line in new_lines]
+        for block in new_blocks:
+            for name, count in block.items():
+                if name not in self.counts:
+                    self.buckets.setdefault(name[:1].lower(), set()).add(name)
+                self.counts[name] += count
+        self.blocks[first:old_last + 1] = new_blocks
+
+    def apply_blocks(self, first, last, block_count, block_text):
+        """
+        Re-scans blocks `first..last` (current numbering) after an edit that left `block_count` blocks.
+
+        The change in the block count tells how many old blocks the range replaced.
+        """
+        old_last = last - (block_count - len(self.blocks))
+        self.apply_change(first, old_last, [block_text(number) for number in range(first, last + 1)])
+
+    def rebuild(self, lines):
+        """Tüm belgeyi baştan indeksler."""
+        self.__init__()
+        self.apply_change(0, 0, lines)
+
+    def names(self):
+        return list(self.counts)
+
+    def prefix_matches(self, prefix, limit=None):
+        """`prefix` ile başlayan isimler, alfabetik sırada."""
+        bucket = self.buckets.get(prefix[:1].lower(), ())
+        matches = sorted(name for name in bucket if name.startswith(prefix))
+        return matches if limit is None else matches[:limit]
+
+    def fuzzy_candidates(self, word):
+        """PrefixTrie.fuzzy_candidates ile aynı sınırlama: aynı ilk harf ve uyumlu uzunluk."""
+        length = len(word)
+        return [name for name in self.buckets.get(word[:1].lower(), ())
+                if length / 3 <= len(name) <= length * 3]
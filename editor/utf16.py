@@ -0,0 +1,24 @@
+import bisect
+import re
+
+# BMP dışındaki karakterler (emoji vb.) QTextDocument'ta iki UTF-16 birimi kaplar
+ASTRAL_PATTERN = re.compile("[\U00010000-\U0010FFFF]")
+
+
+class Utf16Index:
+    """
+    Converts `str` indices of one text into QTextDocument positions.
+
+    Python indexes code points while Qt counts UTF-16 code units, so every character outside the BMP
+    before an index shifts its document position by one. Texts without such characters (the usual case)
+    convert without any lookup.
+    """
+
+    def __init__(self, text):
+        self.astral = [match.start() for match in ASTRAL_PATTERN.finditer(text)]
+
+    def __call__(self, index):
+        if not self.astral:
+            return index
+        return index + bisect.bisect_left(self.astral, index)
+
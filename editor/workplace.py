@@ -0,0 +1,103 @@
+import os
+from PySide2.QtCore import Qt, QObject, QRunnable, QThreadPool, QFileSystemWatcher, Signal
+
+# WORKPLACE'de gösterilen dosya uzantıları
+ALLOWED_EXTENSIONS = {'.py', '.txt', '.sh', '.cpp', '.png', '.jpg', '.jpeg'}
+
+# Klasör öğelerinin dizin yolunu taşıdığı rol (dosyalar yolu Qt.UserRole'da taşır)
+DIRECTORY_ROLE = Qt.UserRole + 1
+
+
+def scan_directory(directory):
+    """
+    Lists a single directory level for the WORKPLACE tree.
+
+    Returns:
+        list: (name, path, is_dir) tuples for sub-directories and files with an allowed extension,
+        or None if the directory cannot be read.
+    """
+    entries = []
+    try:
+        with os.scandir(directory) as iterator:
+            for entry in iterator:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                if is_dir or os.path.splitext(entry.name)[1].lower() in ALLOWED_EXTENSIONS:
+                    entries.append((entry.name, entry.path, is_dir))
+    except OSError:
+        return None
+    return entries
+
+
+class _ScanTask(QRunnable):
+    """Bir dizini worker thread üzerinde tarar ve sonucu ana thread'e sinyal ile gönderir."""
+
+    def __init__(self, signal, generation, directory):
+        super().__init__()
+        self.signal = signal
+        self.generation = generation
+        self.directory = directory
+
+    def run(self):
+        self.signal.emit(self.generation, self.directory, scan_directory(self.directory))
+
+
+class DirectoryScanner(QObject):
+    """
+    Background directory loader and watcher for the WORKPLACE tree.
+
+    Directories are scanned one level at a time on the global QThreadPool. Every loaded directory is
+    watched, and a change only rescans that directory. Requests for a directory that is already being
+    scanned are coalesced into one follow-up scan. `reset` drops results that belong to a previous project.
+    """
+    directory_loaded = Signal(str, object)  # directory, entries (None if unreadable)
+    _scanned = Signal(int, str, object)  # worker -> ana thread
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+        self.pending = set()
+        self.dirty = set()
+        self.watched = set()
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.scan)
+        self._scanned.connect(self._on_scanned)
+
+    def reset(self):
+        """Bekleyen sonuçları geçersiz kılar ve izlenen dizinleri bırakır."""
+        self.generation += 1
+        self.pending.clear()
+        self.dirty.clear()
+        if self.watched:
+            self.watcher.removePaths(list(self.watched))
+            self.watched.clear()
+
+    def scan(self, directory):
+        """Dizini arka planda tarar; sonuç `directory_loaded` ile gelir."""
+        if directory in self.pending:
+            self.dirty.add(directory)
+            return
+        self.pending.add(directory)
+        QThreadPool.globalInstance().start(_ScanTask(self._scanned, self.generation, directory))
+
+    def unwatch(self, directory):
+        """Artık ağaçta olmayan bir dizinin izlenmesini bırakır."""
+        if directory in self.watched:
+            self.watched.discard(directory)
+            self.watcher.removePath(directory)
+
+    def _on_scanned(self, generation, directory, entries):
+        if generation != self.generation:
+            return  # Önceki projeye ait sonuç
+        self.pending.discard(directory)
+        if entries is None:
+            self.unwatch(directory)
+        elif directory not in self.watched:
+            self.watched.add(directory)
+            self.watcher.addPath(directory)
+        self.directory_loaded.emit(directory, entries)
+        if directory in self.dirty:
+            self.dirty.discard(directory)
+            self.scan(directory)
@@ -1,7 +1,6 @@
 import os
 import sys
 import json
-import importlib
 from PySide2.QtWidgets import QApplication
 
 project_dir = os.path.expanduser("~/.nuke/nuke_code_project")
@@ -13,22 +12,45 @@ sys.path.append(modules_path)
 
 
 
-def ide_start_reload():
+def hot_reload_enabled():
     """
-    Start or reload the Python code editor.
+    Developer mode: NUKE_IDE_HOT_RELOAD environment variable or the `dev_hot_reload` setting.
     """
+    env = os.environ.get("NUKE_IDE_HOT_RELOAD")
+    if env is not None:
+        return env not in ("", "0")
+    try:
+        with open(settings_path, "r") as file:
+            return bool(json.load(file).get("General", {}).get("dev_hot_reload", False))
+    except (OSError, ValueError):
+        return False
+
+
+def ide_start_reload(hot_reload=None):
+    """
+    Start the Python code editor, or bring the open one to front.
+
+    The editor modules are imported once; only in hot reload mode they are dropped from
+    sys.modules and executed again, and a new window is opened with the fresh code.
+    """
+    if hot_reload is None:
+        hot_reload = hot_reload_enabled()
+    if hot_reload:
+        from editor.hot_reload import purge_editor_modules
+        purge_editor_modules()
+
     from editor import editor_window
-    importlib.reload(editor_window)
 
     EditorApp = editor_window.EditorApp
     app = QApplication.instance() or QApplication(sys.argv)
 
     # Bring existing editor to front or create a new one
-    for widget in app.topLevelWidgets():
-        if isinstance(widget, EditorApp):
-            widget.raise_()
-            widget.activateWindow()
-            return
+    if not hot_reload:
+        for widget in app.topLevelWidgets():
+            if isinstance(widget, EditorApp):
+                widget.raise_()
+                widget.activateWindow()
+                return
 
     window = EditorApp()
     window.show()
@@ -0,0 +1,27 @@
+import glob
+import importlib
+import os
+
+import pytest
+
+from conftest import ROOT
+
+BENCH_MODULES = sorted(os.path.splitext(os.path.basename(path))[0]
+                       for path in glob.glob(os.path.join(ROOT, "benchmarks", "bench_*.py")))
+
+
+@pytest.fixture(scope="module")
+def benchmark_environment():
+    pytest.importorskip("PySide2")
+    from benchmarks import harness
+    return harness.setup_environment()
+
+
+def test_benchmark_modules_are_found():
+    assert "bench_output" in BENCH_MODULES
+
+
+@pytest.mark.parametrize("module", BENCH_MODULES)
+def test_benchmark_module_imports(benchmark_environment, module):
+    """Her benchmark modülü (ve içe aktardığı assets/ nuke stub'ları) gerçek ortamda yüklenebilmeli."""
+    importlib.import_module(f"benchmarks.{module}")
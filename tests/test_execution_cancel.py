@@ -0,0 +1,39 @@
+import time
+
+import pytest
+
+# Her yinelemede hatayı yutan döngü; Stop yine de çalışmayı bitirmeli
+SWALLOWING_LOOP = """
+import time
+while True:
+    try:
+        time.sleep(0.001)
+    except Exception:
+        pass
+"""
+
+
+@pytest.fixture
+def qt_application():
+    pytest.importorskip("PySide2")
+    from PySide2.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def test_cancel_stops_code_that_catches_exception(qt_application):
+    from editor.output import ExecutionEngine, needs_main_thread
+
+    assert not needs_main_thread(SWALLOWING_LOOP)  # worker thread, asenkron istisna yolu
+    engine = ExecutionEngine()
+    results = []
+    engine.finished.connect(results.append)
+    assert engine.run(SWALLOWING_LOOP)
+    time.sleep(0.05)
+    engine.cancel()
+
+    deadline = time.perf_counter() + 5
+    while not results and time.perf_counter() < deadline:
+        qt_application.processEvents()
+        time.sleep(0.01)
+    assert [result["status"] for result in results] == ["cancelled"]
+    assert not engine.is_running()
@@ -0,0 +1,46 @@
+import pytest
+
+SOURCE = "def f{0}(value):\n    return value * {0}  # yorum\n"
+
+
+@pytest.fixture
+def editor_environment():
+    pytest.importorskip("PySide2")
+    from benchmarks import harness
+    return harness.setup_environment()  # code_editor, Nuke'un eklenti yollarını bekler
+
+
+def pending_blocks(highlighter):
+    block = highlighter.document().firstBlock()
+    pending = 0
+    while block.isValid():
+        pending += block.userState() == highlighter.PENDING
+        block = block.next()
+    return pending
+
+
+def finish_idle(highlighter):
+    while highlighter.idle_timer.isActive():
+        highlighter.idle_timer.stop()
+        highlighter.highlight_idle_chunk()
+
+
+def test_set_plain_text_restarts_lazy_highlighting(editor_environment):
+    from PySide2.QtWidgets import QPlainTextEdit
+    from editor.code_editor import PygmentsHighlighter
+
+    editor = QPlainTextEdit()
+    document = editor.document()
+    highlighter = PygmentsHighlighter(document)
+    highlighter.lazy_threshold = 1024
+    editor.setPlainText("".join(SOURCE.format(index) for index in range(1000)))
+    editor_environment.processEvents()  # ilk renklendirme setDocument'tan sonra ertelenir
+    finish_idle(highlighter)
+    assert highlighter.done_until == document.blockCount() - 1
+
+    # Yeni metin yalnızca görünür alan çevresinde hemen renklendirilmeli, kalanı yine boşta dilimlerde
+    editor.setPlainText("".join(SOURCE.format(-index) for index in range(1000)))
+    assert highlighter.done_until == -1
+    assert pending_blocks(highlighter) == document.blockCount() - highlighter.lazy_margin - 1
+    finish_idle(highlighter)
+    assert pending_blocks(highlighter) == 0
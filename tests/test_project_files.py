@@ -0,0 +1,21 @@
+import os
+
+import pytest
+
+pytest.importorskip("PySide2")
+from editor.search import project_files  # PySide2 gerektirir
+
+
+def test_open_document_is_not_collected_again_from_a_relative_directory(tmp_path, monkeypatch):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "tool.py").write_text("import nuke\n")
+    (tmp_path / "pkg" / "other.py").write_text("pass\n")
+    monkeypatch.chdir(tmp_path)
+
+    open_path = os.path.abspath(os.path.join("pkg", "tool.py"))
+    paths = project_files({open_path: "import nuke  # edited\n"}, "pkg")
+
+    assert paths[open_path] == "import nuke  # edited\n"
+    assert os.path.join("pkg", "tool.py") not in paths
+    assert paths[os.path.join("pkg", "other.py")] is None
+    assert len(paths) == 2
@@ -0,0 +1,54 @@
+import pytest
+
+
+class FakeDocument:
+    def __init__(self):
+        self.revision_number = 0
+
+    def revision(self):
+        return self.revision_number
+
+
+class FakeEditor:
+    def __init__(self):
+        self._document = FakeDocument()
+
+    def document(self):
+        return self._document
+
+
+@pytest.fixture
+def qt_application():
+    pytest.importorskip("PySide2")
+    from PySide2.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def service(qt_application):
+    from editor.structure import StructureService
+    service = StructureService()
+    service.emitted = []
+    service.outline_ready.connect(lambda editor, outline: service.emitted.append((editor, outline)))
+    return service
+
+
+def test_unparsable_code_without_previous_outline_clears_header(service):
+    editor = FakeEditor()
+    service.editor = editor
+    service._on_parsed(editor, 0, None)
+    assert service.emitted == [(editor, [])]
+
+
+def test_last_good_outline_is_reused_only_for_its_editor(service):
+    from editor.structure import parse_outline
+    first, second = FakeEditor(), FakeEditor()
+    outline = parse_outline("class A:\n    def run(self):\n        pass\n")
+
+    service.editor = first
+    service._on_parsed(first, 0, outline)
+    service._on_parsed(first, 0, None)
+    service.editor = second
+    service._on_parsed(second, 0, None)
+
+    assert service.emitted == [(first, outline), (first, outline), (second, [])]
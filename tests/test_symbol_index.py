@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from editor.changes import PendingChange
+from editor.symbols import DocumentSymbolIndex, scan_identifiers
+
+PIECES = ("foo", "bar_1", "x", "_tmp", "Node", "9", " ", " ", "=", "(", ")", ".", "\n", "\n")
+
+
+def random_text(rng, pieces):
+    return "".join(rng.choice(PIECES) for _ in range(pieces))
+
+
+def random_edit(rng, text):
+    """(position, removed, inserted) of one random range edit of `text`."""
+    position = rng.randint(0, len(text))
+    removed = rng.randint(0, min(len(text) - position, 12))
+    return position, removed, random_text(rng, rng.randint(0, 4))
+
+
+def apply_to_index(index, text, position, added):
+    """Same block mapping as `CodeEditor.update_symbol_index`, on a plain string."""
+    lines = text.split("\n")
+    first = text.count("\n", 0, position)
+    last = text.count("\n", 0, position + added)
+    index.apply_blocks(first, last, len(lines), lambda number: lines[number])
+
+
+def assert_matches_rescan(index, text):
+    lines = text.split("\n")
+    assert index.counts == scan_identifiers(text)
+    assert index.blocks == [scan_identifiers(line) for line in lines]
+    assert set().union(*index.buckets.values()) == set(index.counts)
+
+
+def test_single_edits_match_full_rescan():
+    rng = random.Random(4)
+    text = random_text(rng, 200)
+    index = DocumentSymbolIndex()
+    index.rebuild(text.split("\n"))
+    for _ in range(5000):
+        position, removed, inserted = random_edit(rng, text)
+        text = text[:position] + inserted + text[position + removed:]
+        apply_to_index(index, text, position, len(inserted))
+        assert_matches_rescan(index, text)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_merged_edit_bursts_match_full_rescan(seed):
+    rng = random.Random(seed)
+    text = random_text(rng, 200)
+    index = DocumentSymbolIndex()
+    index.rebuild(text.split("\n"))
+    for _ in range(1000):
+        before = text
+        pending = None
+        for _ in range(rng.randint(1, 8)):
+            position, removed, inserted = random_edit(rng, text)
+            text = text[:position] + inserted + text[position + removed:]
+            if pending is None:
+                pending = PendingChange(position, removed, len(inserted), False)
+            else:
+                pending.merge(position, removed, len(inserted), False)
+        change = pending.change()
+        # Birleştirilmiş aralığın dışı değişmemiş olmalı
+        assert before[:change.position] == text[:change.position]
+        assert before[change.position + change.removed:] == text[change.position + change.added:]
+        apply_to_index(index, text, change.position, change.added)
+        assert_matches_rescan(index, text)
+
+
+def test_pending_change_merges_adjacent_and_overlapping_edits():
+    pending = PendingChange(10, 0, 3, False)  # 3 karakter yazıldı
+    pending.merge(13, 0, 2, False)  # hemen arkasına 2 karakter daha
+    pending.merge(4, 2, 0, True)  # öncesinden 2 karakter silindi
+    assert pending.change() == (4, 6, 9, False)
+
+
+def test_name_disappears_with_its_last_occurrence():
+    index = DocumentSymbolIndex()
+    index.rebuild(["render = 1", "render()", "other"])
+    index.apply_change(0, 1, ["x = 1"])
+    assert "render" not in index
+    assert index.prefix_matches("r") == []
+    assert index.prefix_matches("o") == ["other"]
+    assert sorted(index.names()) == ["other", "x"]
@@ -0,0 +1,89 @@
+import random
+import re
+
+import pytest
+
+from editor.utf16 import Utf16Index
+
+EMOJI_SOURCE = "# 😀\nfoo = foo"
+
+
+def encoded_position(text, index):
+    return len(text[:index].encode("utf-16-le")) // 2
+
+
+def test_positions_after_astral_characters_shift():
+    position = Utf16Index(EMOJI_SOURCE)
+    starts = [match.start() for match in re.finditer("foo", EMOJI_SOURCE)]
+    assert starts == [4, 10]
+    assert [position(start) for start in starts] == [5, 11]
+
+
+def test_random_texts_match_utf16_encoding():
+    rng = random.Random(7)
+    for _ in range(500):
+        text = "".join(rng.choice("ab \n😀𝔘é\u2029") for _ in range(rng.randint(0, 40)))
+        position = Utf16Index(text)
+        assert [position(index) for index in range(len(text) + 1)] == \
+               [encoded_position(text, index) for index in range(len(text) + 1)]
+
+
+def test_bmp_text_is_unchanged():
+    position = Utf16Index("nuke.createNode('Blur')")
+    assert position(7) == 7
+
+
+# Aşağıdaki testler gerçek bir QTextDocument üzerinde çalışır ve PySide2 gerektirir
+class DocumentEditor:
+    """The part of CodeEditor that `replace_in_editor` uses, on a plain QTextDocument."""
+
+    def __init__(self, text):
+        from PySide2.QtGui import QTextDocument
+        self.document_ = QTextDocument()
+        self.document_.setPlainText(text)
+
+    def document(self):
+        return self.document_
+
+    def toPlainText(self):
+        return self.document_.toPlainText()
+
+    def bulk_edit(self):
+        from contextlib import contextmanager
+        from PySide2.QtGui import QTextCursor
+
+        @contextmanager
+        def edit():
+            cursor = QTextCursor(self.document_)
+            cursor.beginEditBlock()
+            try:
+                yield cursor
+            finally:
+                cursor.endEditBlock()
+        return edit()
+
+
+@pytest.fixture
+def qt_application():
+    pytest.importorskip("PySide2")
+    from PySide2.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def test_replace_in_editor_after_emoji(qt_application):
+    from editor.search import build_pattern, replace_spans, replace_in_editor
+    editor = DocumentEditor(EMOJI_SOURCE)
+    text = editor.toPlainText()
+    spans = replace_spans(build_pattern("foo"), text, "bar")
+    assert replace_in_editor(editor, text, spans) == 2
+    assert editor.toPlainText() == "# 😀\nbar = bar"
+
+
+def test_replace_in_editor_selection_after_emoji(qt_application):
+    from editor.search import build_pattern, replace_spans, replace_in_editor
+    editor = DocumentEditor("😀 foo\n😀 foo = foo")
+    selected = "😀 foo = foo"
+    offset = encoded_position(editor.toPlainText(), editor.toPlainText().index(selected))
+    spans = replace_spans(build_pattern("foo"), selected, "x")
+    replace_in_editor(editor, selected, spans, offset)
+    assert editor.toPlainText() == "😀 foo\n😀 x = x"